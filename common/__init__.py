@@ -0,0 +1,15 @@
+from .columnar import ColumnarDataset, open_csv
+from .preprocessing import Imputer, MinMaxScaler, Preprocessor, StandardScaler, fused_transform
+from .resampling import (
+    bootstrap, bootstrap_indices, confidence_interval, cross_validate, kfold_indices, resample,
+    stratified_kfold_indices, summarize,
+)
+from .serialization import load_model, save_model
+from .serving import PredictionServer
+from .shared_memory import SharedArray
+
+__all__ = [
+    'ColumnarDataset', 'Imputer', 'MinMaxScaler', 'PredictionServer', 'Preprocessor', 'SharedArray', 'StandardScaler',
+    'bootstrap', 'bootstrap_indices', 'confidence_interval', 'cross_validate', 'fused_transform', 'kfold_indices',
+    'load_model', 'open_csv', 'resample', 'save_model', 'stratified_kfold_indices', 'summarize',
+]
@@ -0,0 +1,209 @@
+from typing import Dict, List, Optional, Sequence
+import hashlib
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+
+CACHE_VERSION = 1
+SCHEMA_FILE = 'schema.json'
+DEFAULT_CHUNKSIZE = 100_000
+HASH_BLOCK_BYTES = 1 << 20
+FLOAT_DTYPES = ('float64', 'float32')
+
+
+def source_hash(path: str) -> str:
+    """
+    SHA-256 содержимого файла, читаемого блоками
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_BYTES), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def default_cache_dir(path: str) -> str:
+    directory, name = os.path.split(os.path.abspath(path))
+    return os.path.join(directory, '.cache', os.path.splitext(name)[0])
+
+
+def _column_file(index: int) -> str:
+    # Имена столбцов могут содержать '/' и пробелы, поэтому файлы нумеруются
+    return f'column_{index:04d}.npy'
+
+
+def _storage_dtype(kinds: List[set], float_dtype: str) -> List[str]:
+    """
+    Тип хранения столбца по типам pandas во всех частях: целые без пропусков остаются int64,
+    остальные числа — float_dtype, прочее — строки фиксированной длины
+    """
+    dtypes = []
+    for seen in kinds:
+        if seen <= {'i', 'u', 'b'}:
+            dtypes.append('int64')
+        elif seen <= {'i', 'u', 'b', 'f'}:
+            dtypes.append(float_dtype)
+        else:
+            dtypes.append('str')
+    return dtypes
+
+
+class ColumnarDataset:
+    """
+    CSV, один раз преобразованный в столбцы .npy и открываемый через memmap: каждый столбец —
+    представление файла без чтения в память и без копирования. В schema.json хранятся имена
+    и типы столбцов, число строк, размер, время изменения и SHA-256 исходного CSV.
+    """
+    
+    def __init__(self, directory: str, schema: Dict[str, object]):
+        self.directory = directory
+        self.schema = schema
+        self.columns = list(schema['columns'])
+        self.dtypes = dict(zip(self.columns, schema['dtypes']))
+        self.n_rows = int(schema['n_rows'])
+        self._arrays = {}
+    
+    @classmethod
+    def build(cls, path: str, directory: Optional[str] = None, float_dtype: str = 'float64',
+              chunksize: int = DEFAULT_CHUNKSIZE) -> 'ColumnarDataset':
+        """
+        Преобразование CSV в кэш за два прохода по частям: типы и число строк, затем запись столбцов
+        (и дополнительный проход для ширины строковых столбцов, часть которых выглядит как числа).
+        Кэш собирается во временном каталоге и заменяет старый целиком.
+        """
+        if float_dtype not in FLOAT_DTYPES:
+            raise ValueError(f"Неподдерживаемый тип хранения: {float_dtype}")
+        directory = directory or default_cache_dir(path)
+        stat = os.stat(path)
+        
+        columns = list(pd.read_csv(path, nrows=0).columns)
+        kinds = [set() for _ in columns]
+        widths = [1] * len(columns)
+        numeric_chunks = [False] * len(columns)
+        n_rows = 0
+        for chunk in pd.read_csv(path, chunksize=chunksize):
+            n_rows += len(chunk)
+            for i, column in enumerate(columns):
+                series = chunk[column]
+                kinds[i].add('f' if series.hasnans else series.dtype.kind)
+                if series.dtype.kind == 'O':
+                    widths[i] = max(widths[i], int(series.astype(str).str.len().max()))
+                else:
+                    numeric_chunks[i] = True
+        dtypes = _storage_dtype(kinds, float_dtype)
+        
+        # Строковый столбец, часть которого pandas прочитал как числа, записывается через astype(str)
+        # и для этих частей: их ширина измеряется отдельным проходом только по таким столбцам
+        remeasure = [i for i, dtype in enumerate(dtypes) if dtype == 'str' and numeric_chunks[i]]
+        if remeasure:
+            for chunk in pd.read_csv(path, usecols=[columns[i] for i in remeasure], chunksize=chunksize):
+                for i in remeasure:
+                    widths[i] = max(widths[i], int(chunk[columns[i]].astype(str).str.len().max()))
+        
+        staging = directory + '.building'
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+        arrays = []
+        for i, dtype in enumerate(dtypes):
+            storage = f'<U{widths[i]}' if dtype == 'str' else dtype
+            arrays.append(np.lib.format.open_memmap(os.path.join(staging, _column_file(i)), mode='w+',
+                                                    dtype=storage, shape=(n_rows,)))
+        start = 0
+        for chunk in pd.read_csv(path, chunksize=chunksize):
+            stop = start + len(chunk)
+            for i, column in enumerate(columns):
+                values = chunk[column]
+                arrays[i][start:stop] = values.astype(str).to_numpy() if dtypes[i] == 'str' else values.to_numpy()
+            start = stop
+        for array in arrays:
+            array.flush()
+        del arrays
+        
+        schema = {
+            'version': CACHE_VERSION,
+            'columns': columns,
+            'dtypes': dtypes,
+            'n_rows': n_rows,
+            'float_dtype': float_dtype,
+            'source': {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': source_hash(path)},
+        }
+        with open(os.path.join(staging, SCHEMA_FILE), 'w') as f:
+            json.dump(schema, f, ensure_ascii=False, indent=2)
+        shutil.rmtree(directory, ignore_errors=True)
+        os.replace(staging, directory)
+        return cls(directory, schema)
+    
+    @classmethod
+    def open(cls, directory: str) -> 'ColumnarDataset':
+        with open(os.path.join(directory, SCHEMA_FILE)) as f:
+            schema = json.load(f)
+        if schema.get('version') != CACHE_VERSION:
+            raise ValueError(f"Неподдерживаемая версия кэша: {schema.get('version')}")
+        return cls(directory, schema)
+    
+    def is_fresh(self, path: str, float_dtype: str = 'float64') -> bool:
+        """
+        Соответствует ли кэш файлу path: размер и время изменения сверяются сразу,
+        хэш содержимого пересчитывается только если время изменилось
+        """
+        source = self.schema['source']
+        if self.schema['float_dtype'] != float_dtype:
+            return False
+        stat = os.stat(path)
+        if stat.st_size != source['size']:
+            return False
+        if stat.st_mtime_ns == source['mtime_ns']:
+            return True
+        if source_hash(path) != source['sha256']:
+            return False
+        source['mtime_ns'] = stat.st_mtime_ns
+        with open(os.path.join(self.directory, SCHEMA_FILE), 'w') as f:
+            json.dump(self.schema, f, ensure_ascii=False, indent=2)
+        return True
+    
+    def __getitem__(self, column: str) -> np.ndarray:
+        """
+        Столбец как memmap только для чтения
+        """
+        if column not in self._arrays:
+            if column not in self.dtypes:
+                raise KeyError(f"Нет столбца: {column}")
+            file = os.path.join(self.directory, _column_file(self.columns.index(column)))
+            self._arrays[column] = np.load(file, mmap_mode='r')
+        return self._arrays[column]
+    
+    def __len__(self) -> int:
+        return self.n_rows
+    
+    def matrix(self, columns: Optional[Sequence[str]] = None, dtype=None) -> np.ndarray:
+        """
+        Матрица объекты × столбцы. В отличие от отдельных столбцов, это копия: столбцы лежат в разных файлах.
+        """
+        columns = self.columns if columns is None else list(columns)
+        if dtype is None:
+            dtype = np.result_type(*[self[column].dtype for column in columns])
+        X = np.empty((self.n_rows, len(columns)), dtype=dtype)
+        for j, column in enumerate(columns):
+            X[:, j] = self[column]
+        return X
+    
+    def to_frame(self) -> pd.DataFrame:
+        return pd.DataFrame({column: self[column] for column in self.columns}, copy=False)
+
+
+def open_csv(path: str, directory: Optional[str] = None, float_dtype: str = 'float64',
+             chunksize: int = DEFAULT_CHUNKSIZE) -> ColumnarDataset:
+    """
+    Кэш CSV: открывается, если соответствует исходному файлу, иначе строится заново
+    """
+    directory = directory or default_cache_dir(path)
+    if os.path.exists(os.path.join(directory, SCHEMA_FILE)):
+        try:
+            dataset = ColumnarDataset.open(directory)
+            if dataset.is_fresh(path, float_dtype):
+                return dataset
+        except (ValueError, KeyError, json.JSONDecodeError):
+            pass
+    return ColumnarDataset.build(path, directory, float_dtype, chunksize)
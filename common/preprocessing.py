@@ -0,0 +1,462 @@
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+STRATEGIES = ('median', 'mean')
+SCALINGS = ('minmax', 'standard')
+# Блок строк, который обрабатывается целиком перед переходом к следующему: остаётся в кэше процессора
+DEFAULT_BLOCK_BYTES = 1 << 20
+# Столько значений каждого столбца partial_fit хранит для медианы, прежде чем сжимать выборку
+MEDIAN_CAPACITY = 1 << 18
+
+
+def _as_matrix(X: np.ndarray) -> np.ndarray:
+    X = np.asarray(X)
+    if X.ndim != 2:
+        raise ValueError("Ожидается матрица объекты × признаки")
+    if X.dtype.kind not in 'fiub':
+        raise ValueError(f"Ожидаются числовые признаки, получен тип {X.dtype}")
+    return X
+
+
+def _row_blocks(n_rows: int, n_columns: int, itemsize: int, block_bytes: int):
+    rows = max(1, block_bytes // (itemsize * max(1, n_columns)))
+    for start in range(0, n_rows, rows):
+        yield start, min(n_rows, start + rows)
+
+
+def fused_transform(X: np.ndarray, out: Optional[np.ndarray] = None, fill: Optional[np.ndarray] = None,
+                    offset: Optional[np.ndarray] = None, scale: Optional[np.ndarray] = None,
+                    block_bytes: int = DEFAULT_BLOCK_BYTES) -> np.ndarray:
+    """
+    (x - offset) / scale с заменой пропусков на fill за один проход по блокам строк.
+    out=None — новая матрица, out=X — преобразование на месте, иначе результат пишется в out
+    (например, в заранее выделенный буфер float32). Пропуски остаются NaN при вычитании и делении,
+    поэтому подставляются уже отмасштабированные значения fill.
+    """
+    X = _as_matrix(X)
+    if out is None:
+        out = np.empty(X.shape, dtype=X.dtype if X.dtype.kind == 'f' else np.float64)
+    elif out.shape != X.shape or out.dtype.kind != 'f':
+        raise ValueError("Буфер результата должен быть вещественной матрицей той же формы")
+    if fill is not None:
+        fill = np.asarray(fill, dtype=np.float64)
+        if offset is not None:
+            fill = (fill - offset) / scale
+        fill = fill.astype(out.dtype)
+    if offset is not None:
+        offset = np.asarray(offset).astype(out.dtype, copy=False)
+        scale = np.asarray(scale).astype(out.dtype, copy=False)
+    
+    for start, stop in _row_blocks(len(X), X.shape[1], out.itemsize, block_bytes):
+        block = out[start:stop]
+        if out is not X:
+            np.copyto(block, X[start:stop], casting='same_kind')
+        if offset is not None:
+            block -= offset
+            block /= scale
+        if fill is not None:
+            missing = np.isnan(block)
+            if missing.any():
+                np.copyto(block, fill, where=missing)
+    return out
+
+
+class _MedianSketch:
+    """
+    Медиана потока значений одного столбца. Пока значений не больше capacity, хранятся все
+    и медиана точная; дальше выборка сжимается до capacity / 2 взвешенных квантилей,
+    равномерных по рангу, и медиана становится приближённой.
+    """
+    
+    def __init__(self, capacity: int = MEDIAN_CAPACITY):
+        self.capacity = capacity
+        self.values = []
+        self.weights = []
+        self.size = 0
+        self.exact = True
+    
+    def update(self, values: np.ndarray):
+        if len(values) == 0:
+            return
+        self.values.append(np.asarray(values, dtype=np.float64))
+        self.weights.append(np.ones(len(values)))
+        self.size += len(values)
+        if self.size > self.capacity:
+            self._compact()
+    
+    def _sorted(self) -> Tuple[np.ndarray, np.ndarray]:
+        values = np.concatenate(self.values)
+        order = np.argsort(values, kind='stable')
+        return values[order], np.concatenate(self.weights)[order]
+    
+    def _compact(self):
+        values, weights = self._sorted()
+        cumulative = np.cumsum(weights)
+        keep = max(1, self.capacity // 2)
+        targets = (np.arange(keep) + 0.5) * cumulative[-1] / keep
+        positions = np.minimum(np.searchsorted(cumulative, targets), len(values) - 1)
+        self.values = [values[positions]]
+        self.weights = [np.full(keep, cumulative[-1] / keep)]
+        self.size = keep
+        self.exact = False
+    
+    def median(self) -> float:
+        if self.size == 0:
+            return np.nan
+        if self.exact:
+            return float(np.median(np.concatenate(self.values)))
+        values, weights = self._sorted()
+        cumulative = np.cumsum(weights)
+        return float(values[np.searchsorted(cumulative, cumulative[-1] / 2)])
+
+
+class _Persistent(ABC):
+    """
+    Сохранение в .npz без pickle: тип объекта, его параметры и статистики как массивы
+    """
+    
+    KIND = None
+    
+    @abstractmethod
+    def _state(self) -> Dict[str, np.ndarray]:
+        pass
+    
+    @abstractmethod
+    def _restore(self, state: Dict[str, np.ndarray]):
+        pass
+    
+    def save(self, path: str):
+        if self._state_missing():
+            raise ValueError(f"{self.KIND} не обучен")
+        np.savez(path, kind=np.array(self.KIND), **self._state())
+    
+    def _state_missing(self) -> bool:
+        return any(value is None for value in self._state().values())
+    
+    @classmethod
+    def load(cls, path: str):
+        with np.load(path, allow_pickle=False) as f:
+            state = {name: f[name] for name in f.files}
+        kind = str(state.pop('kind'))
+        if kind != cls.KIND:
+            raise ValueError(f"В файле сохранён {kind}, а не {cls.KIND}")
+        obj = cls.__new__(cls)
+        obj._restore(state)
+        return obj
+
+
+class Imputer(_Persistent):
+    """
+    Заполнение пропусков медианой (как DataFrame.fillna(df.median())) или средним столбца.
+    fit считает медиану точно; partial_fit — точно, пока в столбце не больше capacity значений,
+    дальше по сжатой выборке.
+    """
+    
+    KIND = 'Imputer'
+    
+    def __init__(self, strategy: str = 'median', capacity: int = MEDIAN_CAPACITY,
+                 block_bytes: int = DEFAULT_BLOCK_BYTES):
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Неизвестная стратегия заполнения: {strategy}")
+        self.strategy = strategy
+        self.capacity = capacity
+        self.block_bytes = block_bytes
+        self._reset()
+    
+    def _reset(self):
+        self.n_rows = 0
+        self.count = None
+        self._sum = None
+        self._sketches = None
+        self._values = None
+    
+    @property
+    def n_missing(self) -> np.ndarray:
+        return self.n_rows - self.count
+    
+    @property
+    def values(self) -> np.ndarray:
+        """
+        Значения для заполнения; у столбца без единого значения — NaN
+        """
+        if self._values is None and self.count is not None:
+            if self.strategy == 'mean':
+                with np.errstate(invalid='ignore', divide='ignore'):
+                    self._values = self._sum / self.count
+            else:
+                self._values = np.array([sketch.median() for sketch in self._sketches])
+        return self._values
+    
+    def fit(self, X: np.ndarray) -> 'Imputer':
+        X = _as_matrix(X)
+        self._reset()
+        self.partial_fit(X)
+        if self.strategy == 'median' and not all(sketch.exact for sketch in self._sketches):
+            medians = [np.median(column[~np.isnan(column)]) if count else np.nan
+                       for column, count in zip(X.T, self.count)]
+            self._values = np.array(medians, dtype=np.float64)
+        return self
+    
+    def partial_fit(self, X: np.ndarray) -> 'Imputer':
+        X = _as_matrix(X)
+        if self.count is None:
+            self.count = np.zeros(X.shape[1], dtype=np.int64)
+            self._sum = np.zeros(X.shape[1])
+            self._sketches = [_MedianSketch(self.capacity) for _ in range(X.shape[1])]
+        elif X.shape[1] != len(self.count):
+            raise ValueError("Число признаков не совпадает с обучением")
+        if self.strategy == 'median' and self._sketches is None:
+            raise ValueError("Медианы загружены из файла без выборки: дообучение невозможно")
+        
+        for start, stop in _row_blocks(len(X), X.shape[1], 8, self.block_bytes):
+            block = X[start:stop].astype(np.float64, copy=False)
+            observed = ~np.isnan(block)
+            self.count += observed.sum(axis=0)
+            if self.strategy == 'mean':
+                self._sum += np.where(observed, block, 0.0).sum(axis=0)
+            else:
+                for j, sketch in enumerate(self._sketches):
+                    sketch.update(block[observed[:, j], j])
+        self.n_rows += len(X)
+        self._values = None
+        return self
+    
+    def transform(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return fused_transform(X, out, fill=self.values, block_bytes=self.block_bytes)
+    
+    def fit_transform(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return self.fit(X).transform(X, out)
+    
+    def _state(self) -> Dict[str, np.ndarray]:
+        return {'strategy': np.array(self.strategy), 'capacity': np.array(self.capacity),
+                'block_bytes': np.array(self.block_bytes), 'n_rows': np.array(self.n_rows), 'count': self.count,
+                'sum': self._sum, 'values': self.values}
+    
+    def _restore(self, state: Dict[str, np.ndarray]):
+        self.__init__(str(state['strategy']), int(state['capacity']), int(state['block_bytes']))
+        self.n_rows = int(state['n_rows'])
+        self.count = state['count']
+        self._sum = state['sum']
+        self._values = state['values']
+
+
+class MinMaxScaler(_Persistent):
+    """
+    Нормализация в [0, 1]: (x - min) / (max - min), у постоянного столбца делитель 1.
+    Пропуски в статистиках не участвуют.
+    """
+    
+    KIND = 'MinMaxScaler'
+    
+    def __init__(self, block_bytes: int = DEFAULT_BLOCK_BYTES):
+        self.block_bytes = block_bytes
+        self.min = None
+        self.max = None
+    
+    def fit(self, X: np.ndarray) -> 'MinMaxScaler':
+        self.min = None
+        self.max = None
+        return self.partial_fit(X)
+    
+    def partial_fit(self, X: np.ndarray) -> 'MinMaxScaler':
+        X = _as_matrix(X)
+        if self.min is None:
+            self.min = np.full(X.shape[1], np.inf)
+            self.max = np.full(X.shape[1], -np.inf)
+        for start, stop in _row_blocks(len(X), X.shape[1], 8, self.block_bytes):
+            block = X[start:stop]
+            missing = np.isnan(block)
+            self.min = np.minimum(self.min, np.where(missing, np.inf, block).min(axis=0))
+            self.max = np.maximum(self.max, np.where(missing, -np.inf, block).max(axis=0))
+        return self
+    
+    def parameters(self, fill: Optional[np.ndarray] = None,
+                   n_missing: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (offset, scale) преобразования; fill и n_missing — пропуски, которые будут заполнены перед ним
+        """
+        low, high = self.min, self.max
+        if fill is not None:
+            filled = n_missing > 0
+            low = np.where(filled, np.fmin(low, fill), low)
+            high = np.where(filled, np.fmax(high, fill), high)
+        span = high - low
+        return low, np.where(span == 0, 1.0, span)
+    
+    def transform(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        offset, scale = self.parameters()
+        return fused_transform(X, out, offset=offset, scale=scale, block_bytes=self.block_bytes)
+    
+    def fit_transform(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return self.fit(X).transform(X, out)
+    
+    def _state(self) -> Dict[str, np.ndarray]:
+        return {'block_bytes': np.array(self.block_bytes), 'min': self.min, 'max': self.max}
+    
+    def _restore(self, state: Dict[str, np.ndarray]):
+        self.__init__(int(state['block_bytes']))
+        self.min = state['min']
+        self.max = state['max']
+
+
+class StandardScaler(_Persistent):
+    """
+    Стандартизация (x - mean) / std со смещённым std, как np.std; у постоянного столбца делитель 1.
+    Среднее и сумма квадратов отклонений объединяются по блокам (формула Чана), пропуски пропускаются.
+    """
+    
+    KIND = 'StandardScaler'
+    
+    def __init__(self, block_bytes: int = DEFAULT_BLOCK_BYTES):
+        self.block_bytes = block_bytes
+        self.count = None
+        self.mean = None
+        self.m2 = None
+    
+    def fit(self, X: np.ndarray) -> 'StandardScaler':
+        self.count = None
+        return self.partial_fit(X)
+    
+    def _merge(self, count: np.ndarray, mean: np.ndarray, m2: np.ndarray):
+        total = self.count + count
+        share = np.divide(count, total, out=np.zeros(len(total)), where=total > 0)
+        delta = mean - self.mean
+        self.mean = self.mean + delta * share
+        self.m2 = self.m2 + m2 + delta ** 2 * self.count * share
+        self.count = total
+    
+    def partial_fit(self, X: np.ndarray) -> 'StandardScaler':
+        X = _as_matrix(X)
+        if self.count is None:
+            self.count = np.zeros(X.shape[1], dtype=np.int64)
+            self.mean = np.zeros(X.shape[1])
+            self.m2 = np.zeros(X.shape[1])
+        for start, stop in _row_blocks(len(X), X.shape[1], 8, self.block_bytes):
+            block = X[start:stop].astype(np.float64, copy=False)
+            observed = ~np.isnan(block)
+            count = observed.sum(axis=0)
+            mean = np.where(observed, block, 0.0).sum(axis=0) / np.maximum(count, 1)
+            m2 = (np.where(observed, block - mean, 0.0) ** 2).sum(axis=0)
+            self._merge(count, mean, m2)
+        return self
+    
+    @property
+    def std(self) -> np.ndarray:
+        return np.sqrt(self.m2 / np.maximum(self.count, 1))
+    
+    def parameters(self, fill: Optional[np.ndarray] = None,
+                   n_missing: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        (offset, scale) преобразования. n_missing заполненных значений fill добавляются к статистикам
+        как отдельный блок с нулевым разбросом: результат тот же, что при обучении на заполненных данных.
+        """
+        count, mean, m2 = self.count, self.mean, self.m2
+        if fill is not None:
+            total = count + n_missing
+            share = np.divide(n_missing, total, out=np.zeros(len(total)), where=total > 0)
+            delta = np.where(n_missing > 0, fill - mean, 0.0)
+            mean = mean + delta * share
+            m2 = m2 + delta ** 2 * count * share
+            count = total
+        std = np.sqrt(m2 / np.maximum(count, 1))
+        return mean, np.where(std == 0, 1.0, std)
+    
+    def transform(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        offset, scale = self.parameters()
+        return fused_transform(X, out, offset=offset, scale=scale, block_bytes=self.block_bytes)
+    
+    def fit_transform(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return self.fit(X).transform(X, out)
+    
+    def _state(self) -> Dict[str, np.ndarray]:
+        return {'block_bytes': np.array(self.block_bytes), 'count': self.count, 'mean': self.mean, 'm2': self.m2}
+    
+    def _restore(self, state: Dict[str, np.ndarray]):
+        self.__init__(int(state['block_bytes']))
+        self.count = state['count']
+        self.mean = state['mean']
+        self.m2 = state['m2']
+
+
+SCALER_CLASSES = {'minmax': MinMaxScaler, 'standard': StandardScaler}
+
+
+class Preprocessor(_Persistent):
+    """
+    Заполнение пропусков и масштабирование признаков одним преобразованием: статистики
+    масштабирования учитывают заполненные значения, а transform делает оба шага за один проход
+    по блокам строк, в том числе на месте (out=X). Сохраняется вместе со статистиками, поэтому
+    на этапе предсказания обучающие данные не нужны.
+    """
+    
+    KIND = 'Preprocessor'
+    
+    def __init__(self, strategy: Optional[str] = 'median', scaling: Optional[str] = 'minmax',
+                 feature_names: Optional[List[str]] = None, block_bytes: int = DEFAULT_BLOCK_BYTES):
+        if scaling is not None and scaling not in SCALINGS:
+            raise ValueError(f"Неизвестный способ масштабирования: {scaling}")
+        self.strategy = strategy
+        self.scaling = scaling
+        self.feature_names = None if feature_names is None else list(feature_names)
+        self.block_bytes = block_bytes
+        self.imputer = None if strategy is None else Imputer(strategy, block_bytes=block_bytes)
+        self.scaler = None if scaling is None else SCALER_CLASSES[scaling](block_bytes)
+        self._parameters = None
+    
+    def fit(self, X: np.ndarray) -> 'Preprocessor':
+        X = _as_matrix(X)
+        if self.imputer is not None:
+            self.imputer.fit(X)
+        if self.scaler is not None:
+            self.scaler.fit(X)
+        self._parameters = None
+        return self
+    
+    def partial_fit(self, X: np.ndarray) -> 'Preprocessor':
+        X = _as_matrix(X)
+        if self.imputer is not None:
+            self.imputer.partial_fit(X)
+        if self.scaler is not None:
+            self.scaler.partial_fit(X)
+        self._parameters = None
+        return self
+    
+    def parameters(self) -> Tuple[Optional[np.ndarray], Optional[np.ndarray], Optional[np.ndarray]]:
+        """
+        (fill, offset, scale) итогового преобразования
+        """
+        if self._parameters is None:
+            fill = n_missing = offset = scale = None
+            if self.imputer is not None:
+                fill, n_missing = self.imputer.values, self.imputer.n_missing
+            if self.scaler is not None:
+                offset, scale = self.scaler.parameters(fill, n_missing)
+            self._parameters = fill, offset, scale
+        return self._parameters
+    
+    def transform(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        fill, offset, scale = self.parameters()
+        return fused_transform(X, out, fill, offset, scale, self.block_bytes)
+    
+    def fit_transform(self, X: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+        return self.fit(X).transform(X, out)
+    
+    def _state(self) -> Dict[str, np.ndarray]:
+        state = {'strategy': np.array(self.strategy or ''), 'scaling': np.array(self.scaling or ''),
+                 'block_bytes': np.array(self.block_bytes)}
+        if self.feature_names is not None:
+            state['feature_names'] = np.array(self.feature_names)
+        for prefix, part in (('imputer', self.imputer), ('scaler', self.scaler)):
+            if part is not None:
+                state.update({f'{prefix}.{name}': value for name, value in part._state().items()})
+        return state
+    
+    def _restore(self, state: Dict[str, np.ndarray]):
+        names = state.get('feature_names')
+        self.__init__(str(state['strategy']) or None, str(state['scaling']) or None,
+                      None if names is None else [str(name) for name in names], int(state['block_bytes']))
+        for prefix, part in (('imputer', self.imputer), ('scaler', self.scaler)):
+            if part is not None:
+                part._restore({name[len(prefix) + 1:]: value for name, value in state.items()
+                               if name.startswith(prefix + '.')})
@@ -0,0 +1,187 @@
+from multiprocessing import Pool
+from statistics import NormalDist
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+import os
+import numpy as np
+
+from .shared_memory import SharedArray
+
+Split = Tuple[np.ndarray, np.ndarray]
+RandomState = Union[None, int, np.random.Generator]
+
+CI_METHODS = ('percentile', 'normal')
+
+# Состояние процесса-исполнителя: представления X и y в разделяемой памяти, фабрика модели и оценка
+_worker = {}
+
+
+def kfold_indices(n_samples: int, n_splits: int = 5, shuffle: bool = True, rng: RandomState = None) -> List[Split]:
+    """
+    Разбиение на n_splits блоков почти равного размера; каждый блок по очереди — тестовый
+    """
+    if not 2 <= n_splits <= n_samples:
+        raise ValueError(f"Число блоков должно быть от 2 до {n_samples}")
+    indices = np.random.default_rng(rng).permutation(n_samples) if shuffle else np.arange(n_samples)
+    folds = np.array_split(indices, n_splits)
+    return [(np.concatenate(folds[:i] + folds[i + 1:]), folds[i]) for i in range(n_splits)]
+
+
+def stratified_kfold_indices(y: np.ndarray, n_splits: int = 5, shuffle: bool = True,
+                             rng: RandomState = None) -> List[Split]:
+    """
+    K-блочное разбиение с сохранением долей классов: объекты каждого класса раздаются
+    по блокам по кругу, поэтому число объектов класса в блоках отличается не больше чем на 1
+    """
+    y = np.asarray(y)
+    if not 2 <= n_splits <= len(y):
+        raise ValueError(f"Число блоков должно быть от 2 до {len(y)}")
+    generator = np.random.default_rng(rng)
+    _, codes = np.unique(y, return_inverse=True)
+    order = []
+    for label in range(codes.max() + 1 if len(codes) else 0):
+        members = np.flatnonzero(codes == label)
+        order.append(generator.permutation(members) if shuffle else members)
+    order = np.concatenate(order) if order else np.zeros(0, dtype=np.intp)
+    fold_of = np.empty(len(y), dtype=np.intp)
+    fold_of[order] = np.arange(len(y)) % n_splits
+    return [(np.flatnonzero(fold_of != i), np.flatnonzero(fold_of == i)) for i in range(n_splits)]
+
+
+def bootstrap_indices(n_samples: int, n_resamples: int = 100, rng: RandomState = None) -> List[Split]:
+    """
+    Бутстреп-выборки с возвращением; тестовые объекты — не попавшие в выборку (out-of-bag).
+    Выборки без out-of-bag объектов вытягиваются заново: оценка на пустом блоке не определена
+    """
+    if n_samples < 2:
+        raise ValueError("Для бутстрепа нужно хотя бы 2 объекта")
+    generator = np.random.default_rng(rng)
+    splits = []
+    while len(splits) < n_resamples:
+        sample = generator.integers(0, n_samples, n_samples)
+        out_of_bag = np.ones(n_samples, dtype=bool)
+        out_of_bag[sample] = False
+        if out_of_bag.any():
+            splits.append((sample, np.flatnonzero(out_of_bag)))
+    return splits
+
+
+def default_scoring(model: Any, X: np.ndarray, y: np.ndarray) -> Dict[str, float]:
+    """
+    Метрики модели на тестовом блоке: evaluate, если он есть, иначе score
+    """
+    if hasattr(model, 'evaluate'):
+        return model.evaluate(X, y)
+    return {'score': float(model.score(X, y))}
+
+
+def _fit_and_score(factory: Callable[[], Any], scoring: Callable, X: np.ndarray, y: np.ndarray,
+                   split: Split) -> Dict[str, float]:
+    train, test = split
+    model = factory().fit(X[train], y[train])
+    result = scoring(model, X[test], y[test])
+    return result if isinstance(result, dict) else {'score': float(result)}
+
+
+def _init_worker(specs: Dict[str, tuple], factory: Callable[[], Any], scoring: Callable):
+    shared = {name: SharedArray.attach(spec) for name, spec in specs.items()}
+    _worker['shared'] = shared
+    _worker['factory'] = factory
+    _worker['scoring'] = scoring
+
+
+def _score_in_worker(split: Split) -> Dict[str, float]:
+    shared = _worker['shared']
+    return _fit_and_score(_worker['factory'], _worker['scoring'], shared['X'].array, shared['y'].array, split)
+
+
+def confidence_interval(values: Sequence[float], level: float = 0.95,
+                        method: str = 'percentile') -> Tuple[float, float]:
+    """
+    Доверительный интервал по значениям метрики: перцентильный (для бутстрепа)
+    или нормальный для среднего по блокам
+    """
+    if method not in CI_METHODS:
+        raise ValueError(f"Неизвестный способ построения интервала: {method}")
+    if not 0 < level < 1:
+        raise ValueError("Уровень доверия должен быть в интервале (0, 1)")
+    values = np.asarray(values, dtype=np.float64)
+    if method == 'percentile':
+        low, high = np.percentile(values, [50 * (1 - level), 50 * (1 + level)])
+        return float(low), float(high)
+    mean = values.mean()
+    if len(values) < 2:
+        return float(mean), float(mean)
+    half = NormalDist().inv_cdf(0.5 + level / 2) * values.std(ddof=1) / np.sqrt(len(values))
+    return float(mean - half), float(mean + half)
+
+
+def summarize(fold_results: List[Dict[str, float]], level: float = 0.95,
+              method: str = 'percentile') -> Dict[str, Dict[str, Any]]:
+    """
+    Среднее, стандартное отклонение и доверительный интервал каждой скалярной метрики
+    """
+    summary = {}
+    for name, value in fold_results[0].items():
+        if not np.isscalar(value):
+            continue
+        values = np.array([result[name] for result in fold_results], dtype=np.float64)
+        low, high = confidence_interval(values, level, method)
+        summary[name] = {
+            'values': values,
+            'mean': float(values.mean()),
+            'std': float(values.std(ddof=1)) if len(values) > 1 else 0.0,
+            'ci_low': low,
+            'ci_high': high,
+        }
+    return summary
+
+
+def resample(factory: Callable[[], Any], X: np.ndarray, y: np.ndarray, splits: Sequence[Split],
+             scoring: Callable = default_scoring, n_jobs: Optional[int] = None, level: float = 0.95,
+             method: str = 'normal') -> Dict[str, Any]:
+    """
+    Обучение factory() на обучающей части и оценка на тестовой для каждого разбиения.
+    При n_jobs > 1 разбиения обрабатываются пулом процессов: X и y копируются в разделяемую
+    память один раз, процессы получают только её имя и индексы блоков.
+    factory и scoring должны сериализоваться pickle (класс, functools.partial, функция модуля).
+    """
+    X = np.ascontiguousarray(X)
+    y = np.ascontiguousarray(y)
+    if len(X) != len(y):
+        raise ValueError("Число объектов и значений целевой переменной не совпадает")
+    if not splits:
+        raise ValueError("Нет разбиений для оценки")
+    n_jobs = min(n_jobs or os.cpu_count() or 1, len(splits))
+    
+    if n_jobs == 1:
+        folds = [_fit_and_score(factory, scoring, X, y, split) for split in splits]
+    else:
+        shared = {'X': SharedArray.copy_of(X), 'y': SharedArray.copy_of(y)}
+        try:
+            specs = {name: array.spec for name, array in shared.items()}
+            with Pool(n_jobs, initializer=_init_worker, initargs=(specs, factory, scoring)) as pool:
+                folds = pool.map(_score_in_worker, list(splits), chunksize=1)
+        finally:
+            for array in shared.values():
+                array.close()
+    return {'folds': folds, 'summary': summarize(folds, level, method)}
+
+
+def cross_validate(factory: Callable[[], Any], X: np.ndarray, y: np.ndarray, n_splits: int = 5,
+                   stratify: bool = False, scoring: Callable = default_scoring, n_jobs: Optional[int] = None,
+                   rng: RandomState = None, level: float = 0.95) -> Dict[str, Any]:
+    """
+    K-блочная (при stratify=True — стратифицированная) кросс-валидация, интервалы — нормальные
+    """
+    splits = stratified_kfold_indices(y, n_splits, rng=rng) if stratify else kfold_indices(len(X), n_splits, rng=rng)
+    return resample(factory, X, y, splits, scoring, n_jobs, level, method='normal')
+
+
+def bootstrap(factory: Callable[[], Any], X: np.ndarray, y: np.ndarray, n_resamples: int = 100,
+              scoring: Callable = default_scoring, n_jobs: Optional[int] = None, rng: RandomState = None,
+              level: float = 0.95) -> Dict[str, Any]:
+    """
+    Бутстреп с оценкой на out-of-bag объектах, интервалы — перцентильные
+    """
+    splits = bootstrap_indices(len(X), n_resamples, rng)
+    return resample(factory, X, y, splits, scoring, n_jobs, level, method='percentile')
@@ -0,0 +1,85 @@
+from typing import Any, Dict, Sequence, Tuple
+import json
+import os
+import shutil
+import numpy as np
+
+FORMAT_VERSION = 1
+MANIFEST_FILE = 'model.json'
+JSON_TYPES = (bool, int, float, str, type(None))
+
+
+def split_state(obj: Any, exclude: Sequence[str] = ()) -> Tuple[Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    Атрибуты объекта (кроме exclude), разделённые на скаляры для JSON и массивы для .npy
+    """
+    params, arrays = {}, {}
+    for name, value in vars(obj).items():
+        if name in exclude:
+            continue
+        if isinstance(value, np.ndarray):
+            arrays[name] = value
+        elif isinstance(value, np.generic):
+            params[name] = value.item()
+        elif isinstance(value, JSON_TYPES):
+            params[name] = value
+        else:
+            raise TypeError(f"Атрибут {name} типа {type(value).__name__} не сохраняется")
+    return params, arrays
+
+
+def restore_state(cls: type, params: Dict[str, Any], arrays: Dict[str, np.ndarray]) -> Any:
+    """
+    Объект cls с атрибутами из split_state, без вызова __init__
+    """
+    obj = cls.__new__(cls)
+    obj.__dict__.update(params)
+    obj.__dict__.update(arrays)
+    return obj
+
+
+def save_model(directory: str, kind: str, params: Dict[str, Any], arrays: Dict[str, np.ndarray]):
+    """
+    Модель как каталог: model.json с типом, параметрами и именами файлов, каждый массив — отдельный .npy.
+    Один и тот же массив (например, обучающая матрица модели и её индекса) записывается один раз.
+    Каталог собирается во временном и заменяет старый целиком. Массивы dtype=object из одних строк
+    (например, метки из pandas) записываются как строки фиксированной длины '<U'.
+    """
+    arrays = dict(arrays)
+    for name, array in arrays.items():
+        if array.dtype.hasobject:
+            if not all(isinstance(value, str) for value in array.flat):
+                raise ValueError(f"Массив {name} с dtype=object не сохраняется")
+            arrays[name] = array.astype(str)
+    staging = directory.rstrip(os.sep) + '.saving'
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+    files, written = {}, {}
+    for name, array in arrays.items():
+        if id(array) not in written:
+            # Имена массивов могут содержать точки и слэши, поэтому файлы нумеруются
+            written[id(array)] = f'array_{len(written):03d}.npy'
+            np.save(os.path.join(staging, written[id(array)]), array)
+        files[name] = written[id(array)]
+    
+    manifest = {'version': FORMAT_VERSION, 'kind': kind, 'params': params, 'arrays': files}
+    with open(os.path.join(staging, MANIFEST_FILE), 'w') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    shutil.rmtree(directory, ignore_errors=True)
+    os.replace(staging, directory)
+
+
+def load_model(directory: str, mmap: bool = True) -> Tuple[str, Dict[str, Any], Dict[str, np.ndarray]]:
+    """
+    (kind, params, arrays) из каталога save_model. При mmap=True массивы открываются через memmap
+    только для чтения: загрузка не читает данные, несколько процессов делят одни страницы файла.
+    """
+    with open(os.path.join(directory, MANIFEST_FILE)) as f:
+        manifest = json.load(f)
+    if manifest.get('version') != FORMAT_VERSION:
+        raise ValueError(f"Неподдерживаемая версия формата модели: {manifest.get('version')}")
+    opened = {}
+    for file in set(manifest['arrays'].values()):
+        opened[file] = np.load(os.path.join(directory, file), mmap_mode='r' if mmap else None, allow_pickle=False)
+    arrays = {name: opened[file] for name, file in manifest['arrays'].items()}
+    return manifest['kind'], manifest['params'], arrays
@@ -0,0 +1,165 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, List, Optional, Tuple
+import asyncio
+import json
+import numpy as np
+
+DEFAULT_MAX_BATCH_SIZE = 256
+# Столько секунд первый запрос пакета ждёт остальные: задержка ответа в обмен на размер пакета
+DEFAULT_MAX_WAIT = 0.002
+
+
+class PredictionServer:
+    """
+    Предсказания по одной строке для конкурентных клиентов asyncio. Запросы собираются в пакеты
+    до max_batch_size строк или до истечения max_wait с прихода первого из них, и пакет целиком
+    проходит через векторизованный predict модели (при наличии — после preprocessor.transform
+    на месте). predict выполняется в отдельном потоке: NumPy отпускает GIL, и цикл событий
+    тем временем принимает запросы для следующего пакета.
+    
+    Использование:
+        async with PredictionServer(model.predict, n_features) as server:
+            label = await server.predict(row)
+    """
+    
+    def __init__(self, predict: Callable[[np.ndarray], np.ndarray], n_features: int,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE, max_wait: float = DEFAULT_MAX_WAIT,
+                 preprocessor: Optional[Any] = None):
+        if max_batch_size < 1:
+            raise ValueError("Размер пакета должен быть положительным")
+        if max_wait < 0:
+            raise ValueError("Время ожидания не может быть отрицательным")
+        self.predict_batch = predict
+        self.n_features = n_features
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.preprocessor = preprocessor
+        self.n_requests = 0
+        self.n_batches = 0
+        self._queue = None
+        self._worker = None
+        self._executor = None
+        # Пакеты собираются в один переиспользуемый буфер: обрабатывается не больше одного пакета за раз
+        self._buffer = np.empty((max_batch_size, n_features))
+    
+    async def start(self) -> 'PredictionServer':
+        if self._worker is None:
+            self._queue = asyncio.Queue()
+            self._executor = ThreadPoolExecutor(max_workers=1)
+            self._worker = asyncio.get_running_loop().create_task(self._run())
+        return self
+    
+    async def stop(self):
+        """
+        Остановка после обработки уже поставленных в очередь запросов
+        """
+        if self._worker is None:
+            return
+        # Новые запросы отклоняются сразу, уже принятые обрабатываются до сигнала остановки
+        worker, self._worker = self._worker, None
+        await self._queue.put(None)
+        await worker
+        self._executor.shutdown()
+    
+    async def __aenter__(self) -> 'PredictionServer':
+        return await self.start()
+    
+    async def __aexit__(self, *exc_info):
+        await self.stop()
+    
+    async def predict(self, row: np.ndarray) -> Any:
+        """
+        Предсказание для одного объекта; ждёт, пока его пакет будет обработан
+        """
+        if self._worker is None:
+            raise RuntimeError("Сервер не запущен: вызовите start()")
+        row = np.asarray(row, dtype=np.float64)
+        if row.shape != (self.n_features,):
+            raise ValueError(f"Ожидается строка из {self.n_features} признаков, получена форма {row.shape}")
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((row, future))
+        return await future
+    
+    async def _collect(self, first: Tuple[np.ndarray, asyncio.Future]) -> Tuple[List[tuple], bool]:
+        """
+        Пакет, начатый запросом first, и признак того, что встречен сигнал остановки
+        """
+        batch = [first]
+        deadline = asyncio.get_running_loop().time() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            if self._queue.empty():
+                timeout = deadline - asyncio.get_running_loop().time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+            else:
+                item = self._queue.get_nowait()
+            if item is None:
+                return batch, True
+            batch.append(item)
+        return batch, False
+    
+    def _predict_rows(self, n_rows: int) -> np.ndarray:
+        X = self._buffer[:n_rows]
+        if self.preprocessor is not None:
+            self.preprocessor.transform(X, out=X)
+        return self.predict_batch(X)
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                break
+            batch, stopping = await self._collect(first)
+            for i, (row, _) in enumerate(batch):
+                self._buffer[i] = row
+            try:
+                predictions = await loop.run_in_executor(self._executor, self._predict_rows, len(batch))
+            except Exception as error:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(error)
+            else:
+                for (_, future), prediction in zip(batch, predictions):
+                    if not future.done():
+                        future.set_result(prediction)
+            self.n_requests += len(batch)
+            self.n_batches += 1
+    
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        async def answer(line: bytes):
+            try:
+                prediction = await self.predict(json.loads(line)['features'])
+                response = {'prediction': prediction.item() if isinstance(prediction, np.generic) else prediction}
+            except (ValueError, KeyError, TypeError, RuntimeError) as error:
+                response = {'error': str(error)}
+            return response
+        
+        # Запросы одного соединения обрабатываются конкурентно, ответы идут в порядке запросов
+        responses = asyncio.Queue()
+        
+        async def respond():
+            while (task := await responses.get()) is not None:
+                writer.write(json.dumps(await task).encode() + b'\n')
+                await writer.drain()
+        
+        sender = asyncio.ensure_future(respond())
+        while line := await reader.readline():
+            await responses.put(asyncio.ensure_future(answer(line)))
+        await responses.put(None)
+        await sender
+        writer.close()
+        await writer.wait_closed()
+    
+    async def serve(self, host: str = '127.0.0.1', port: int = 0) -> asyncio.AbstractServer:
+        """
+        Локальный TCP-сервер с построчным JSON: запрос {"features": [...]}, ответ {"prediction": ...}
+        или {"error": "..."}. port=0 — свободный порт, см. server.sockets[0].getsockname().
+        """
+        await self.start()
+        return await asyncio.start_server(self._handle_client, host, port)
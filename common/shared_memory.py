@@ -0,0 +1,58 @@
+from multiprocessing import shared_memory
+from typing import Tuple
+import numpy as np
+
+
+class SharedArray:
+    """
+    Массив numpy в разделяемой памяти. В дочерние процессы передаётся только spec
+    (имя сегмента, форма, тип), данные не копируются и не сериализуются.
+    """
+    
+    def __init__(self, shm: shared_memory.SharedMemory, shape: Tuple[int, ...], dtype: str, owner: bool):
+        self._shm = shm
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+        self.owner = owner
+        self.array = np.ndarray(self.shape, dtype=self.dtype, buffer=shm.buf)
+    
+    @classmethod
+    def create(cls, shape: Tuple[int, ...], dtype='float64') -> 'SharedArray':
+        dtype = np.dtype(dtype)
+        size = max(1, int(np.prod(shape)) * dtype.itemsize)
+        return cls(shared_memory.SharedMemory(create=True, size=size), shape, dtype.str, owner=True)
+    
+    @classmethod
+    def copy_of(cls, array: np.ndarray) -> 'SharedArray':
+        array = np.asarray(array)
+        shared = cls.create(array.shape, array.dtype)
+        shared.array[...] = array
+        return shared
+    
+    @classmethod
+    def attach(cls, spec: Tuple[str, Tuple[int, ...], str]) -> 'SharedArray':
+        name, shape, dtype = spec
+        return cls(shared_memory.SharedMemory(name=name), shape, dtype, owner=False)
+    
+    @property
+    def spec(self) -> Tuple[str, Tuple[int, ...], str]:
+        return self._shm.name, self.shape, self.dtype.str
+    
+    def close(self):
+        if self._shm is None:
+            return
+        self.array = None
+        try:
+            self._shm.close()
+        except BufferError:
+            # На буфер ещё ссылаются внешние представления; сегмент освободится вместе с ними
+            pass
+        if self.owner:
+            self._shm.unlink()
+        self._shm = None
+    
+    def __enter__(self) -> 'SharedArray':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
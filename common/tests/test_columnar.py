@@ -0,0 +1,134 @@
+import sys
+import os
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from common.columnar import ColumnarDataset, open_csv
+
+HOUSING_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'lab3', 'data', 'california_housing_train.csv')
+
+
+def _mixed_csv(directory: str) -> str:
+    path = os.path.join(directory, 'mixed.csv')
+    pd.DataFrame({
+        'count': [3, 1, 4, 1, 5, 9],
+        'value': [0.5, np.nan, 2.25, -1.0, 3.0, 1e10],
+        'label': ['a', 'bb', 'ccc', 'a', 'bb', 'dddd'],
+        'flag with/slash': [1, 0, 1, 1, 0, 1],
+    }).to_csv(path, index=False)
+    return path
+
+
+def test_round_trip():
+    print("Тестирование столбцового кэша CSV...")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = _mixed_csv(directory)
+        cache = os.path.join(directory, 'cache')
+        dataset = open_csv(path, cache, chunksize=4)
+        expected = pd.read_csv(path)
+        
+        assert dataset.columns == list(expected.columns) and len(dataset) == 6, "Схема не совпадает с CSV"
+        assert dataset.dtypes == {'count': 'int64', 'value': 'float64', 'label': 'str', 'flag with/slash': 'int64'}, \
+            f"Неожиданные типы столбцов: {dataset.dtypes}"
+        for column in expected.columns:
+            values = dataset[column]
+            assert isinstance(values, np.memmap) and not values.flags.writeable, "Столбец должен быть memmap для чтения"
+            assert np.array_equal(values, expected[column].to_numpy(), equal_nan=column == 'value'), \
+                f"Столбец {column} отличается"
+        assert pd.DataFrame.equals(dataset.to_frame(), expected), "DataFrame из кэша отличается от read_csv"
+        print("  ✓ Целые, вещественные с пропусками и строковые столбцы по частям")
+        
+        codes = os.path.join(directory, 'codes.csv')
+        with open(codes, 'w') as f:
+            f.write('code\n1\n2\n3\n123456\nabc\n')
+        stored = open_csv(codes, os.path.join(directory, 'codes'), chunksize=3)['code']
+        assert list(stored) == ['1', '2', '3', '123456', 'abc'], f"Строки обрезаны: {list(stored)}"
+        print("  ✓ Ширина строкового столбца учитывает части, прочитанные как числа")
+        
+        matrix = dataset.matrix(['count', 'value'])
+        assert matrix.dtype == np.float64 and np.array_equal(matrix, expected[['count', 'value']].values, equal_nan=True), \
+            "Матрица отличается от .values"
+        print("  ✓ Матрица выбранных столбцов как .values")
+        
+        small = open_csv(path, os.path.join(directory, 'cache32'), float_dtype='float32')
+        assert small['value'].dtype == np.float32 and small['count'].dtype == np.int64, "Тип хранения float32 не применён"
+        print("  ✓ Хранение вещественных столбцов в float32")
+    
+    print("✅ Тест столбцового кэша пройден\n")
+
+
+def test_invalidation():
+    print("Тестирование проверки актуальности кэша...")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = _mixed_csv(directory)
+        cache = os.path.join(directory, 'cache')
+        built = open_csv(path, cache)
+        marker = os.path.join(cache, 'column_0000.npy')
+        built_at = os.stat(marker).st_mtime_ns
+        
+        time.sleep(0.01)
+        os.utime(path)
+        reopened = open_csv(path, cache)
+        assert os.stat(marker).st_mtime_ns == built_at, "Файл с тем же содержимым не должен пересобирать кэш"
+        assert reopened.schema['source']['mtime_ns'] == os.stat(path).st_mtime_ns, "Время изменения не обновлено"
+        print("  ✓ Изменение времени без изменения содержимого: кэш переиспользуется")
+        
+        df = pd.read_csv(path)
+        df.loc[0, 'count'] = 7
+        df.to_csv(path, index=False)
+        rebuilt = open_csv(path, cache)
+        assert rebuilt['count'][0] == 7, "Изменённый CSV должен пересобрать кэш"
+        print("  ✓ Изменённый CSV пересобирает кэш")
+        
+        assert open_csv(path, cache, float_dtype='float32')['value'].dtype == np.float32, \
+            "Другой тип хранения должен пересобрать кэш"
+        assert ColumnarDataset.open(cache).schema['float_dtype'] == 'float32', "Схема не обновлена"
+        print("  ✓ Смена типа хранения пересобирает кэш")
+    
+    print("✅ Тест проверки актуальности пройден\n")
+
+
+def test_housing():
+    print("Тестирование кэша California Housing...")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        dataset = open_csv(HOUSING_FILE, directory)
+        expected = pd.read_csv(HOUSING_FILE)
+        assert np.array_equal(dataset.matrix(), expected.values), "Матрица кэша отличается от read_csv"
+        start = time.perf_counter()
+        open_csv(HOUSING_FILE, directory)['median_income']
+        elapsed = time.perf_counter() - start
+        print(f"  ✓ {len(dataset)} строк совпадают с read_csv, повторное открытие {elapsed * 1000:.2f} мс")
+    
+    print("✅ Тест кэша California Housing пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование столбцового кэша".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_round_trip()
+        test_invalidation()
+        test_housing()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ СТОЛБЦОВОГО КЭША ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,174 @@
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from common.preprocessing import Imputer, MinMaxScaler, Preprocessor, StandardScaler
+
+HOUSING_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'lab3', 'data', 'california_housing_train.csv')
+TARGET = 'median_house_value'
+
+
+def _housing_with_gaps() -> pd.DataFrame:
+    df = pd.read_csv(HOUSING_FILE).drop(columns=TARGET)
+    # Пропуски в нескольких столбцах, как в total_bedrooms исходного датасета
+    rng = np.random.default_rng(0)
+    for column in ('total_rooms', 'total_bedrooms', 'median_income'):
+        df.loc[rng.random(len(df)) < 0.05, column] = np.nan
+    return df
+
+
+def test_matches_notebook():
+    print("Тестирование предобработки против ноутбука...")
+    
+    df = _housing_with_gaps()
+    X = df.to_numpy()
+    filled = df.fillna(df.median()).to_numpy()
+    X_min = filled.min(axis=0)
+    X_range = filled.max(axis=0) - X_min
+    expected = (filled - X_min) / X_range
+    
+    preprocessor = Preprocessor('median', 'minmax', list(df.columns))
+    result = preprocessor.fit_transform(X)
+    assert np.array_equal(result, expected), "fillna(median) + min-max нормализация отличаются"
+    assert np.array_equal(Imputer().fit_transform(X), filled), "Заполнение медианой отличается от pandas"
+    print("  ✓ Медиана + min-max совпадают с fillna и нормализацией из ноутбука")
+    
+    standard = Preprocessor('median', 'standard').fit(X).transform(X)
+    assert np.allclose(standard, (filled - filled.mean(axis=0)) / filled.std(axis=0), atol=1e-12), \
+        "Стандартизация должна учитывать заполненные значения"
+    print("  ✓ Стандартизация по заполненным данным без их материализации")
+    
+    streamed = Preprocessor('median', 'standard')
+    for start in range(0, len(X), 1000):
+        streamed.partial_fit(X[start:start + 1000])
+    fill, offset, scale = streamed.parameters()
+    assert np.array_equal(fill, np.nanmedian(X, axis=0)), "Потоковые медианы должны быть точными"
+    assert np.allclose(offset, filled.mean(axis=0), rtol=1e-12), "partial_fit по частям должен совпадать с fit"
+    assert np.allclose(scale, filled.std(axis=0), rtol=1e-12), "partial_fit по частям должен совпадать с fit"
+    print("  ✓ partial_fit по частям совпадает с fit")
+    
+    print("✅ Тест предобработки против ноутбука пройден\n")
+
+
+def test_in_place_transform():
+    print("Тестирование преобразования на месте...")
+    
+    X = _housing_with_gaps().to_numpy()
+    preprocessor = Preprocessor('mean', 'minmax', block_bytes=1 << 12).fit(X)
+    expected = preprocessor.transform(X)
+    assert not np.isnan(expected).any(), "Пропуски должны быть заполнены"
+    
+    buffer = X.copy()
+    assert preprocessor.transform(buffer, out=buffer) is buffer, "out=X должен преобразовать матрицу на месте"
+    assert np.array_equal(buffer, expected), "Результат на месте отличается"
+    
+    out32 = np.empty(X.shape, dtype=np.float32)
+    assert preprocessor.transform(X, out=out32) is out32, "Результат должен записываться в переданный буфер"
+    assert np.allclose(out32, expected, atol=1e-6), "Буфер float32 заполнен неверно"
+    
+    try:
+        preprocessor.transform(X, out=np.empty((len(X), 2)))
+        assert False, "Буфер другой формы должен вызывать ValueError"
+    except ValueError:
+        pass
+    print("  ✓ out=X, буфер float32 и проверка формы буфера")
+    
+    print("✅ Тест преобразования на месте пройден\n")
+
+
+def test_save_and_load():
+    print("Тестирование сохранения статистик...")
+    
+    df = _housing_with_gaps()
+    X = df.to_numpy()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'preprocessing.npz')
+        preprocessor = Preprocessor('median', 'standard', list(df.columns)).fit(X[:10000])
+        preprocessor.save(path)
+        loaded = Preprocessor.load(path)
+        assert loaded.feature_names == list(df.columns), "Имена признаков не восстановлены"
+        assert np.array_equal(loaded.transform(X), preprocessor.transform(X)), "Загруженное преобразование отличается"
+        print("  ✓ Preprocessor восстанавливается без обучающих данных")
+        
+        try:
+            loaded.partial_fit(X[10000:])
+            assert False, "Дообучение медиан после загрузки должно вызывать ValueError"
+        except ValueError:
+            pass
+        
+        imputer_path = os.path.join(directory, 'imputer.npz')
+        Imputer('mean', capacity=512, block_bytes=4096).fit(X).save(imputer_path)
+        imputer = Imputer.load(imputer_path)
+        assert (imputer.capacity, imputer.block_bytes) == (512, 4096), "Параметры Imputer не восстановлены"
+        assert Preprocessor.load(path).block_bytes == preprocessor.block_bytes, "block_bytes не восстановлен"
+        
+        scaler_path = os.path.join(directory, 'scaler.npz')
+        StandardScaler().fit(X[:10000]).save(scaler_path)
+        resumed = StandardScaler.load(scaler_path).partial_fit(X[10000:])
+        full = StandardScaler().fit(X)
+        assert np.allclose(resumed.mean, full.mean) and np.allclose(resumed.std, full.std), "Дообучение после загрузки"
+        
+        minmax_path = os.path.join(directory, 'minmax.npz')
+        MinMaxScaler().fit(X).save(minmax_path)
+        try:
+            StandardScaler.load(minmax_path)
+            assert False, "Загрузка файла другого типа должна вызывать ValueError"
+        except ValueError:
+            pass
+        try:
+            Imputer().save(os.path.join(directory, 'empty.npz'))
+            assert False, "Сохранение необученного объекта должно вызывать ValueError"
+        except ValueError:
+            pass
+    print("  ✓ Масштабирование дообучается после загрузки, чужие и пустые файлы отклоняются")
+    
+    print("✅ Тест сохранения статистик пройден\n")
+
+
+def test_streaming_median():
+    print("Тестирование потоковой медианы...")
+    
+    rng = np.random.default_rng(1)
+    X = np.column_stack([rng.lognormal(size=200_000), rng.integers(0, 5, size=200_000)]).astype(float)
+    imputer = Imputer(capacity=4096)
+    for chunk in np.array_split(X, 50):
+        imputer.partial_fit(chunk)
+    for j in range(X.shape[1]):
+        rank = np.mean(X[:, j] < imputer.values[j])
+        exact = imputer.values[j] == np.median(X[:, j])
+        assert abs(rank - 0.5) < 0.01 or exact, f"Медиана столбца {j} неточна: ранг {rank}"
+    assert np.array_equal(Imputer(capacity=4096).fit(X).values, np.median(X, axis=0)), \
+        "fit должен считать медиану точно"
+    print("  ✓ Сжатая выборка ограничивает память, ошибка ранга медианы < 1%")
+    
+    print("✅ Тест потоковой медианы пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование предобработки".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_matches_notebook()
+        test_in_place_transform()
+        test_save_and_load()
+        test_streaming_median()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ ПРЕДОБРАБОТКИ ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,104 @@
+import sys
+import os
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from common.resampling import (
+    bootstrap, bootstrap_indices, confidence_interval, cross_validate, kfold_indices, stratified_kfold_indices,
+)
+
+
+class MeanRegressor:
+    def fit(self, X, y):
+        self.mean = float(np.mean(y))
+        return self
+    
+    def score(self, X, y):
+        return float(np.mean(np.abs(y - self.mean)))
+
+
+def test_splits():
+    print("Тестирование разбиений...")
+    
+    state = np.random.get_state()[1].copy()
+    splits = kfold_indices(103, 5, rng=0)
+    tests = np.concatenate([test for _, test in splits])
+    assert np.array_equal(np.sort(tests), np.arange(103)), "Тестовые блоки должны разбивать все объекты"
+    for train, test in splits:
+        assert len(np.intersect1d(train, test)) == 0 and len(train) + len(test) == 103, "Блоки пересекаются"
+        assert len(test) in (20, 21), "Размеры блоков должны отличаться не больше чем на 1"
+    assert all(np.array_equal(a[1], b[1]) for a, b in zip(splits, kfold_indices(103, 5, rng=0))), \
+        "Одинаковый seed должен давать одинаковые разбиения"
+    print("  ✓ K-блочное разбиение")
+    
+    y = np.array([0] * 50 + [1] * 30 + [2] * 7)
+    for train, test in stratified_kfold_indices(y, 5, rng=1):
+        counts = np.bincount(y[test], minlength=3)
+        assert np.all(np.abs(counts - np.bincount(y, minlength=3) / 5) < 1), f"Доли классов нарушены: {counts}"
+    print("  ✓ Стратифицированное разбиение сохраняет доли классов")
+    
+    for sample, out_of_bag in bootstrap_indices(200, 10, rng=2):
+        assert len(sample) == 200 and len(np.intersect1d(sample, out_of_bag)) == 0, "Out-of-bag пересекается с выборкой"
+        assert len(np.union1d(sample, out_of_bag)) == 200, "Out-of-bag должен содержать все невыбранные объекты"
+    print("  ✓ Бутстреп и out-of-bag")
+    
+    splits = bootstrap_indices(3, 50, rng=5)
+    assert len(splits) == 50 and all(len(out_of_bag) > 0 for _, out_of_bag in splits), "Пустой out-of-bag"
+    result = bootstrap(MeanRegressor, np.zeros((3, 1)), np.array([1.0, 2.0, 4.0]), n_resamples=50, n_jobs=1, rng=5)
+    summary = result['summary']['score']
+    assert np.all(np.isfinite(summary['values'])) and np.isfinite(summary['ci_low']), "Интервал не должен быть NaN"
+    print("  ✓ На 3 объектах выборки без out-of-bag вытягиваются заново")
+    
+    assert np.array_equal(state, np.random.get_state()[1]), "Глобальное состояние np.random не должно меняться"
+    print("  ✓ Глобальный генератор не затронут")
+    
+    print("✅ Тест разбиений пройден\n")
+
+
+def test_parallel_resampling():
+    print("Тестирование параллельной оценки...")
+    
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(500, 3))
+    y = rng.normal(size=500) * 2 + 5
+    
+    serial = cross_validate(MeanRegressor, X, y, n_splits=5, n_jobs=1, rng=3)
+    parallel = cross_validate(MeanRegressor, X, y, n_splits=5, n_jobs=2, rng=3)
+    assert serial['folds'] == parallel['folds'], "Пул процессов дал другие результаты"
+    summary = serial['summary']['score']
+    assert summary['ci_low'] < summary['mean'] < summary['ci_high'], "Среднее должно лежать внутри интервала"
+    print(f"  ✓ Кросс-валидация в пуле совпадает с последовательной: {summary['mean']:.4f} "
+          f"[{summary['ci_low']:.4f}, {summary['ci_high']:.4f}]")
+    
+    result = bootstrap(MeanRegressor, X, y, n_resamples=20, n_jobs=2, rng=4)
+    values = result['summary']['score']['values']
+    assert len(values) == 20, "Должно быть 20 бутстреп-оценок"
+    assert result['summary']['score']['ci_low'] == confidence_interval(values)[0], "Перцентильный интервал неверен"
+    print("  ✓ Бутстреп в пуле процессов")
+    
+    print("✅ Тест параллельной оценки пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование ресэмплинга".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_splits()
+        test_parallel_resampling()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ РЕСЭМПЛИНГА ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,219 @@
+import sys
+import os
+import asyncio
+import json
+import tempfile
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from common.preprocessing import Preprocessor
+from common.serialization import MANIFEST_FILE, load_model, save_model
+from common.serving import PredictionServer
+
+
+class RecordingModel:
+    """
+    Линейная модель, запоминающая размеры пакетов
+    """
+    
+    def __init__(self, weights):
+        self.weights = np.asarray(weights, dtype=np.float64)
+        self.batch_sizes = []
+    
+    def predict(self, X):
+        self.batch_sizes.append(len(X))
+        if np.isnan(X).any():
+            raise ValueError("NaN в признаках")
+        return X @ self.weights
+
+
+def test_model_directory():
+    print("Тестирование формата сохранения моделей...")
+    
+    X = np.random.default_rng(0).normal(size=(1000, 4))
+    labels = np.array(['a', 'bb', 'ccc'])
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'model')
+        save_model(path, 'Example', {'k': 5, 'name': None}, {'X': X, 'index.X': X, 'labels': labels})
+        assert len(os.listdir(path)) == 3, "Общий массив должен записываться один раз"
+        
+        kind, params, arrays = load_model(path)
+        assert kind == 'Example' and params == {'k': 5, 'name': None}, "Параметры не восстановлены"
+        assert isinstance(arrays['X'], np.memmap) and not arrays['X'].flags.writeable, "Ожидается memmap для чтения"
+        assert arrays['X'] is arrays['index.X'], "Общий массив должен открываться один раз"
+        assert np.array_equal(arrays['X'], X) and np.array_equal(arrays['labels'], labels), "Массивы отличаются"
+        assert not isinstance(load_model(path, mmap=False)[2]['X'], np.memmap), "mmap=False читает в память"
+        print("  ✓ model.json + .npy, общие массивы без дублей, memmap только для чтения")
+        
+        try:
+            save_model(path, 'Example', {}, {'objects': np.array([{}, None])})
+            assert False, "Массив объектов должен вызывать ValueError"
+        except ValueError:
+            pass
+        assert load_model(path)[0] == 'Example', "Неудачное сохранение не должно портить старую модель"
+        
+        words = os.path.join(directory, 'words')
+        save_model(words, 'Example', {}, {'labels': np.array(['a', 'bbb'], dtype=object)})
+        stored = load_model(words)[2]['labels']
+        assert stored.dtype == np.dtype('<U3') and list(stored) == ['a', 'bbb'], "Строки dtype=object должны стать '<U'"
+        
+        with open(os.path.join(path, MANIFEST_FILE)) as f:
+            manifest = json.load(f)
+        manifest['version'] = 0
+        with open(os.path.join(path, MANIFEST_FILE), 'w') as f:
+            json.dump(manifest, f)
+        try:
+            load_model(path)
+            assert False, "Другая версия формата должна вызывать ValueError"
+        except ValueError:
+            pass
+    print("  ✓ Массивы объектов и чужие версии отклоняются")
+    
+    print("✅ Тест формата сохранения пройден\n")
+
+
+async def _predict_concurrently(server, rows):
+    return await asyncio.gather(*(server.predict(row) for row in rows))
+
+
+def test_micro_batching():
+    print("Тестирование сборки запросов в пакеты...")
+    
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(1000, 3))
+    model = RecordingModel([1.0, -2.0, 0.5])
+    
+    async def scenario():
+        async with PredictionServer(model.predict, 3, max_batch_size=64, max_wait=0.01) as server:
+            predictions = await _predict_concurrently(server, X)
+            return predictions, server.n_requests, server.n_batches
+    
+    predictions, n_requests, n_batches = asyncio.run(scenario())
+    assert np.allclose(predictions, X @ model.weights), "Предсказания по пакетам отличаются"
+    assert n_requests == len(X) and n_batches == len(model.batch_sizes), "Счётчики запросов и пакетов неверны"
+    assert max(model.batch_sizes) == 64 and n_batches < len(X) / 10, f"Пакеты не собираются: {model.batch_sizes}"
+    print(f"  ✓ {n_requests} конкурентных запросов обработаны {n_batches} пакетами по ≤ 64 строки")
+    
+    model.batch_sizes.clear()
+    
+    async def sequential():
+        async with PredictionServer(model.predict, 3, max_batch_size=64, max_wait=0.0) as server:
+            return [await server.predict(row) for row in X[:5]]
+    
+    assert np.allclose(asyncio.run(sequential()), X[:5] @ model.weights), "Одиночные запросы отличаются"
+    assert model.batch_sizes == [1] * 5, "Последовательные запросы не должны ждать друг друга"
+    print("  ✓ Последовательный клиент получает ответы без ожидания пакета")
+    
+    preprocessor = Preprocessor('mean', 'standard').fit(X)
+    raw = X[:50].copy()
+    raw[::7, 1] = np.nan
+    
+    async def preprocessed():
+        async with PredictionServer(model.predict, 3, preprocessor=preprocessor) as server:
+            return await _predict_concurrently(server, raw)
+    
+    assert np.allclose(asyncio.run(preprocessed()), preprocessor.transform(raw) @ model.weights), \
+        "Предобработка должна применяться к пакету"
+    print("  ✓ Пропуски заполняются и признаки масштабируются на месте в буфере пакета")
+    
+    print("✅ Тест сборки в пакеты пройден\n")
+
+
+def test_errors():
+    print("Тестирование ошибок сервера...")
+    
+    model = RecordingModel([1.0, 1.0])
+    
+    async def scenario():
+        server = PredictionServer(model.predict, 2, max_wait=0.01)
+        try:
+            await server.predict([1.0, 2.0])
+            assert False, "Запрос к незапущенному серверу должен вызывать RuntimeError"
+        except RuntimeError:
+            pass
+        async with server:
+            try:
+                await server.predict([1.0, 2.0, 3.0])
+                assert False, "Строка другой длины должна вызывать ValueError"
+            except ValueError:
+                pass
+            results = await asyncio.gather(server.predict([1.0, np.nan]), server.predict([1.0, 2.0]),
+                                           return_exceptions=True)
+            assert all(isinstance(result, ValueError) for result in results), "Ошибку получают все запросы пакета"
+            assert await server.predict([1.0, 2.0]) == 3.0, "Сервер должен работать после ошибки"
+        try:
+            await server.predict([1.0, 2.0])
+            assert False, "Запрос к остановленному серверу должен вызывать RuntimeError"
+        except RuntimeError:
+            pass
+    
+    asyncio.run(scenario())
+    print("  ✓ Неверная форма, ошибка predict и остановленный сервер")
+    
+    print("✅ Тест ошибок сервера пройден\n")
+
+
+def test_tcp_protocol():
+    print("Тестирование TCP-протокола...")
+    
+    model = RecordingModel([2.0, 3.0])
+    
+    async def scenario():
+        server = PredictionServer(model.predict, 2, max_wait=0.01)
+        tcp = await server.serve()
+        port = tcp.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        lines = [{'features': [i, 1]} for i in range(20)] + [{'features': [1]}, {'rows': []}]
+        writer.write(b''.join(json.dumps(line).encode() + b'\n' for line in lines) + b'not json\n')
+        await writer.drain()
+        writer.write_eof()
+        responses = [json.loads(line) for line in (await reader.read()).splitlines()]
+        writer.close()
+        
+        await server.stop()
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        writer.write(json.dumps({'features': [1, 1]}).encode() + b'\n')
+        writer.write_eof()
+        stopped = [json.loads(line) for line in (await reader.read()).splitlines()]
+        writer.close()
+        tcp.close()
+        await tcp.wait_closed()
+        return responses, stopped
+    
+    responses, stopped = asyncio.run(scenario())
+    assert [response.get('prediction') for response in responses[:20]] == [2.0 * i + 3.0 for i in range(20)], \
+        "Ответы должны идти в порядке запросов"
+    assert all('error' in response for response in responses[20:]) and len(responses) == 23, "Ошибки в ответах"
+    assert len(model.batch_sizes) < 20, "Запросы одного соединения должны собираться в пакеты"
+    print(f"  ✓ Построчный JSON: 20 запросов в {len(model.batch_sizes)} пакетах, ошибки возвращаются клиенту")
+    assert len(stopped) == 1 and 'error' in stopped[0], "Остановленный сервер должен отвечать ошибкой"
+    print("  ✓ После остановки сервер отвечает ошибкой, а не разрывает соединение")
+    
+    print("✅ Тест TCP-протокола пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование сервера предсказаний".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_model_directory()
+        test_micro_batching()
+        test_errors()
+        test_tcp_protocol()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ СЕРВЕРА ПРЕДСКАЗАНИЙ ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,76 @@
+import sys
+import os
+from multiprocessing import Pool
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from common import SharedArray
+
+
+def _column_sums(spec):
+    shared = SharedArray.attach(spec)
+    result = shared.array.sum(axis=0)
+    shared.close()
+    return result
+
+
+def _fill_row(args):
+    spec, row = args
+    shared = SharedArray.attach(spec)
+    shared.array[row] = row
+    shared.close()
+
+
+def test_shared_array():
+    print("Тестирование SharedArray...")
+    
+    data = np.arange(12, dtype=np.float32).reshape(4, 3)
+    with SharedArray.copy_of(data) as shared:
+        assert shared.array.dtype == np.float32 and shared.array.shape == (4, 3), "Форма и тип должны сохраняться"
+        with Pool(2) as pool:
+            sums = pool.map(_column_sums, [shared.spec] * 3)
+        for result in sums:
+            assert np.array_equal(result, data.sum(axis=0)), "Процессы должны видеть те же данные"
+        print("  ✓ Процессы пула читают массив по spec без копирования")
+    
+    with SharedArray.create((5, 2), 'int64') as shared:
+        with Pool(2) as pool:
+            pool.map(_fill_row, [(shared.spec, row) for row in range(5)])
+        assert np.array_equal(shared.array[:, 0], np.arange(5)), "Запись из процессов должна быть видна"
+        print("  ✓ Запись из дочерних процессов видна владельцу")
+    
+    shared = SharedArray.copy_of(data)
+    name = shared.spec[0]
+    shared.close()
+    shared.close()
+    try:
+        SharedArray.attach((name, (4, 3), '<f4'))
+        assert False, "Сегмент должен быть удалён владельцем"
+    except FileNotFoundError:
+        print("  ✓ close() владельца освобождает сегмент, повторный вызов безопасен")
+    
+    print("✅ Тест SharedArray пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование общих утилит".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_shared_array()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ ОБЩИХ УТИЛИТ ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,242 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence
+import argparse
+import json
+import math
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.engine import RecommendationEngine
+from src.knowledge_base import OWLKnowledgeBase
+from src.parsers import InputParser
+
+from benchmarks.synthetic_owl import generate_ontology
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+DEFAULT_SIZES = (100, 10_000, 1_000_000)
+
+SAMPLE_TEXTS = [
+    "Мне нравятся кооперативные игры",
+    "Хочу простые партийные игры",
+    "евро игры с рабочими",
+    "Ищу сложную стратегию с контролем территорий",
+    "Люблю декбилдинг и колоды карт",
+    "Что-нибудь легкое для компании с кубиками",
+    "Средней сложности игра с размещением тайлов",
+    "Соревновательная игра со скрытыми ролями",
+]
+
+
+def peak_rss_bytes() -> Optional[int]:
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return usage if sys.platform == 'darwin' else usage * 1024
+
+
+def percentile(sorted_values: Sequence[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = min(len(sorted_values) - 1, max(0, math.ceil(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+
+def summarize(latencies_ns: List[int]) -> Dict[str, float]:
+    values = sorted(latencies_ns)
+    total = sum(values)
+    return {
+        'calls': len(values),
+        'total_s': total / 1e9,
+        'throughput_per_s': len(values) / (total / 1e9) if total else 0.0,
+        'mean_ms': total / len(values) / 1e6 if values else 0.0,
+        'p50_ms': percentile(values, 50) / 1e6,
+        'p99_ms': percentile(values, 99) / 1e6,
+    }
+
+
+def measure(fn: Callable, args_list: Sequence[tuple], min_calls: int = 5, max_calls: int = 100_000,
+            time_budget: float = 1.0) -> Dict[str, float]:
+    if not args_list:
+        args_list = [()]
+    latencies = []
+    clock = time.perf_counter_ns
+    deadline = clock() + int(time_budget * 1e9)
+    i = 0
+    
+    while i < max_calls and (i < max(min_calls, len(args_list)) or clock() < deadline):
+        args = args_list[i % len(args_list)]
+        start = clock()
+        fn(*args)
+        latencies.append(clock() - start)
+        i += 1
+    
+    return summarize(latencies)
+
+
+def measure_once(fn: Callable) -> float:
+    start = time.perf_counter_ns()
+    fn()
+    return (time.perf_counter_ns() - start) / 1e9
+
+
+def run_size(games: int, workdir: str, time_budget: float = 1.0, seed: int = 0) -> Dict[str, Any]:
+    owl_file = os.path.join(workdir, f'synthetic_{games}_{seed}.owl')
+    if not os.path.exists(owl_file):
+        generate_ontology(owl_file, games, seed=seed)
+    snapshot_file = os.path.join(workdir, f'synthetic_{games}_{seed}.snapshot')
+    if os.path.exists(snapshot_file):
+        os.remove(snapshot_file)
+    
+    load = {
+        'parse': measure_once(lambda: OWLKnowledgeBase(owl_file)),
+        'parse_and_snapshot': measure_once(lambda: OWLKnowledgeBase(owl_file, snapshot_file)),
+        'snapshot': measure_once(lambda: OWLKnowledgeBase(owl_file, snapshot_file)),
+        'file_bytes': os.path.getsize(owl_file),
+    }
+    
+    kb = OWLKnowledgeBase(owl_file, snapshot_file)
+    engine = RecommendationEngine(kb)
+    state = kb._state
+    genres = [(g,) for g in sorted(state.genres)]
+    mechanics = [(m,) for m in sorted(state.mechanics)]
+    sample_games = [(g,) for g in state.game_names[::max(1, len(state.game_names) // 1000)]]
+    texts = [(text,) for text in SAMPLE_TEXTS]
+    preferences = [InputParser.parse_preferences(text) for text in SAMPLE_TEXTS]
+    candidates = [engine.get_recommendations(prefs) for prefs in preferences]
+    
+    operations = {
+        'query_games_by_genre': (kb.query_games_by_genre, genres),
+        'query_games_by_mechanic': (kb.query_games_by_mechanic, mechanics),
+        'query_games_by_complexity': (kb.query_games_by_complexity, [('light',), ('medium',), ('heavy',)]),
+        'query_cooperative_games': (kb.query_cooperative_games, []),
+        'query_gateway_games': (kb.query_gateway_games, []),
+        'query_deep_strategy_games': (kb.query_deep_strategy_games, []),
+        'get_game_info': (kb.get_game_info, sample_games),
+        'get_recommendations': (engine.get_recommendations, [(prefs,) for prefs in preferences]),
+        'rank_recommendations': (
+            lambda games, prefs: engine.rank_recommendations(games, prefs, top_k=5),
+            list(zip(candidates, preferences)),
+        ),
+        'parse_preferences': (InputParser.parse_preferences, texts),
+    }
+    
+    results = {}
+    for name, (fn, args_list) in operations.items():
+        results[name] = measure(fn, args_list, time_budget=time_budget)
+    
+    return {
+        'games': games,
+        'load_s': load,
+        'operations': results,
+        'peak_rss_bytes': peak_rss_bytes(),
+    }
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_isolated(games: int, workdir: str, time_budget: float, seed: int) -> Dict[str, Any]:
+    command = [
+        sys.executable, os.path.abspath(__file__), '--single', str(games),
+        '--workdir', workdir, '--time-budget', str(time_budget), '--seed', str(seed),
+    ]
+    completed = subprocess.run(command, capture_output=True, text=True)
+    if completed.returncode != 0:
+        return {'games': games, 'error': completed.stderr.strip().splitlines()[-1:]}
+    return json.loads(completed.stdout)
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], threshold: float) -> List[str]:
+    regressions = []
+    base_by_size = {r['games']: r for r in baseline.get('results', []) if 'operations' in r}
+    for result in current.get('results', []):
+        base = base_by_size.get(result['games'])
+        if base is None or 'operations' not in result:
+            continue
+        for name, stats in result['operations'].items():
+            before = base['operations'].get(name)
+            if not before or not before['p50_ms']:
+                continue
+            ratio = stats['p50_ms'] / before['p50_ms']
+            if ratio > threshold:
+                regressions.append(
+                    f"{name} @ {result['games']}: p50 {before['p50_ms']:.3f} → {stats['p50_ms']:.3f} мс (x{ratio:.2f})"
+                )
+    return regressions
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Бенчмарки рекомендательной системы")
+    parser.add_argument('--sizes', type=int, nargs='+', default=list(DEFAULT_SIZES), help="размеры каталога")
+    parser.add_argument('--workdir', help="каталог для синтетических онтологий (по умолчанию временный)")
+    parser.add_argument('--time-budget', type=float, default=1.0, help="время на одну операцию, сек")
+    parser.add_argument('--seed', type=int, default=0, help="зерно генератора онтологий")
+    parser.add_argument('--output', help="файл для JSON-отчёта (по умолчанию stdout)")
+    parser.add_argument('--compare', metavar='BASELINE', help="JSON-отчёт для сравнения")
+    parser.add_argument('--threshold', type=float, default=1.2, help="допустимый рост p50 при сравнении")
+    parser.add_argument('--single', type=int, help=argparse.SUPPRESS)
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    
+    if args.single is not None:
+        json.dump(run_size(args.single, args.workdir, args.time_budget, args.seed), sys.stdout)
+        return
+    
+    workdir = args.workdir or tempfile.mkdtemp(prefix='bg-bench-')
+    os.makedirs(workdir, exist_ok=True)
+    try:
+        results = [run_isolated(size, workdir, args.time_budget, args.seed) for size in args.sizes]
+    finally:
+        # Временный каталог с онтологиями и снимками удаляется, заданный через --workdir остаётся
+        if not args.workdir:
+            shutil.rmtree(workdir, ignore_errors=True)
+    report = {
+        'meta': {
+            'revision': git_revision(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'time_budget_s': args.time_budget,
+            'seed': args.seed,
+        },
+        'results': results,
+    }
+    
+    text = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    else:
+        print(text)
+    
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            regressions = compare(report, json.load(f), args.threshold)
+        for line in regressions:
+            print(f"Регрессия: {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+from itertools import accumulate
+from typing import List, Optional, TextIO
+import argparse
+import random
+
+BG = 'http://example.org/boardgames#'
+
+BASE_GENRES = [
+    'eurogame', 'ameritrash', 'abstract', 'cooperative', 'deck_builder',
+    'party', 'wargame', 'engine_builder', 'set_collection', 'social_deduction',
+]
+
+BASE_MECHANICS = [
+    'worker_placement', 'tile_placement', 'drafting', 'deck_building', 'dice_rolling', 'area_control',
+    'hidden_roles', 'hand_management', 'resource_management', 'tableau_building', 'set_collection',
+    'route_building',
+]
+
+DISTRIBUTIONS = ('uniform', 'zipf')
+
+HEADER = f'''<?xml version="1.0"?>
+<rdf:RDF xmlns="{BG}"
+     xml:base="http://example.org/boardgames"
+     xmlns:owl="http://www.w3.org/2002/07/owl#"
+     xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+     xmlns:xml="http://www.w3.org/XML/1998/namespace"
+     xmlns:xsd="http://www.w3.org/2001/XMLSchema#"
+     xmlns:rdfs="http://www.w3.org/2000/01/rdf-schema#">
+    <owl:Ontology rdf:about="http://example.org/boardgames"/>
+'''
+
+FOOTER = '</rdf:RDF>\n'
+
+
+def _names(base: List[str], prefix: str, count: int) -> List[str]:
+    names = base[:count]
+    names += [f'{prefix}_{i}' for i in range(len(names), count)]
+    return names
+
+
+class Sampler:
+    def __init__(self, population: List[str], distribution: str, zipf_s: float, rng: random.Random):
+        if distribution not in DISTRIBUTIONS:
+            raise ValueError(f"Неизвестное распределение: {distribution}")
+        self.population = population
+        self.rng = rng
+        self.cum_weights = None
+        if distribution == 'zipf':
+            self.cum_weights = list(accumulate(1.0 / (rank ** zipf_s) for rank in range(1, len(population) + 1)))
+    
+    def sample(self, max_count: int) -> List[str]:
+        if not self.population or max_count <= 0:
+            return []
+        count = self.rng.randint(0, min(max_count, len(self.population)))
+        if self.cum_weights is None:
+            return self.rng.sample(self.population, count)
+        picked = self.rng.choices(self.population, cum_weights=self.cum_weights, k=count)
+        return list(dict.fromkeys(picked))
+
+
+def _individual(name: str, type_name: str, properties: Optional[List[tuple]] = None) -> str:
+    lines = [
+        f'    <owl:NamedIndividual rdf:about="{BG}{name}">',
+        f'        <rdf:type rdf:resource="{BG}{type_name}"/>',
+    ]
+    for prop, value in properties or ():
+        lines.append(f'        <{prop} rdf:resource="{BG}{value}"/>')
+    lines.append('    </owl:NamedIndividual>\n')
+    return '\n'.join(lines)
+
+
+def write_ontology(output: TextIO, games: int, genres: int = 10, mechanics: int = 12, designers: int = 50,
+                   max_genres: int = 2, max_mechanics: int = 3, max_designers: int = 1,
+                   distribution: str = 'zipf', zipf_s: float = 1.1, seed: int = 0):
+    rng = random.Random(seed)
+    genre_names = _names(BASE_GENRES, 'genre', genres)
+    mechanic_names = _names(BASE_MECHANICS, 'mechanic', mechanics)
+    designer_names = [f'designer_{i}' for i in range(designers)]
+    
+    genre_sampler = Sampler(genre_names, distribution, zipf_s, rng)
+    mechanic_sampler = Sampler(mechanic_names, distribution, zipf_s, rng)
+    designer_sampler = Sampler(designer_names, distribution, zipf_s, rng)
+    
+    output.write(HEADER)
+    for name in genre_names:
+        output.write(_individual(name, 'Genre'))
+    for name in mechanic_names:
+        output.write(_individual(name, 'Mechanic'))
+    for name in designer_names:
+        output.write(_individual(name, 'Designer'))
+    
+    for i in range(games):
+        properties = [('hasGenre', g) for g in genre_sampler.sample(max_genres)]
+        properties += [('hasMechanic', m) for m in mechanic_sampler.sample(max_mechanics)]
+        properties += [('designedBy', d) for d in designer_sampler.sample(max_designers)]
+        output.write(_individual(f'game_{i}', 'Game', properties))
+    output.write(FOOTER)
+
+
+def generate_ontology(path: str, games: int, **options) -> str:
+    with open(path, 'w', encoding='utf-8') as f:
+        write_ontology(f, games, **options)
+    return path
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Генератор синтетической онтологии настольных игр")
+    parser.add_argument('output', help="путь к создаваемому OWL файлу")
+    parser.add_argument('--games', type=int, default=10000, help="количество игр")
+    parser.add_argument('--genres', type=int, default=10, help="количество жанров")
+    parser.add_argument('--mechanics', type=int, default=12, help="количество механик")
+    parser.add_argument('--designers', type=int, default=50, help="количество авторов")
+    parser.add_argument('--max-genres', type=int, default=2, help="максимум жанров у игры")
+    parser.add_argument('--max-mechanics', type=int, default=3, help="максимум механик у игры")
+    parser.add_argument('--distribution', choices=DISTRIBUTIONS, default='zipf', help="распределение признаков")
+    parser.add_argument('--zipf-s', type=float, default=1.1, help="показатель распределения Ципфа")
+    parser.add_argument('--seed', type=int, default=0, help="зерно генератора случайных чисел")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    generate_ontology(
+        args.output, args.games, genres=args.genres, mechanics=args.mechanics, designers=args.designers,
+        max_genres=args.max_genres, max_mechanics=args.max_mechanics,
+        distribution=args.distribution, zipf_s=args.zipf_s, seed=args.seed,
+    )
+
+
+if __name__ == "__main__":
+    main()
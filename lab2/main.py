@@ -1,7 +1,12 @@
+import argparse
 import os
 import sys
 
-from src import OWLKnowledgeBase, RecommendationEngine, DialogueManager
+from src import (
+    OWLKnowledgeBase, CachedKnowledgeBase, RecommendationEngine, DialogueManager,
+    InputParser, RecommendationPipeline, RuleKnowledgeBase,
+)
+from src.service import run_batch, serve
 
 
 def validate_environment():
@@ -21,11 +26,71 @@ def validate_environment():
     return owl_file
 
 
+def rules_path() -> str:
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.join(os.path.dirname(script_dir), 'lab1', 'boardgames.pl')
+
+
+def snapshot_path(owl_file: str) -> str:
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    name = os.path.splitext(os.path.basename(owl_file))[0]
+    return os.path.join(script_dir, '.cache', f'{name}.snapshot')
+
+
+def load_synonyms():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    synonyms_file = os.path.join(script_dir, 'data', 'synonyms.json')
+    
+    if os.path.exists(synonyms_file):
+        InputParser.load_synonyms(synonyms_file)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Система рекомендаций настольных игр")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--batch', metavar='FILE',
+                      help="обработать JSONL-файл запросов ('-' для stdin) и вывести JSONL-ответы")
+    mode.add_argument('--serve', action='store_true',
+                      help="запустить TCP-сервер (JSON-запрос на строку)")
+    parser.add_argument('--rules', action='store_true',
+                        help="вычислять классификацию по правилам из lab1/boardgames.pl")
+    parser.add_argument('--output', metavar='FILE', help="файл для ответов пакетного режима (по умолчанию stdout)")
+    parser.add_argument('--host', default='127.0.0.1', help="адрес сервера")
+    parser.add_argument('--port', type=int, default=8765, help="порт сервера")
+    return parser.parse_args()
+
+
+def run_batch_mode(pipeline: RecommendationPipeline, input_path: str, output_path: str = None):
+    input_stream = sys.stdin if input_path == '-' else open(input_path, encoding='utf-8')
+    output_stream = open(output_path, 'w', encoding='utf-8') if output_path else sys.stdout
+    try:
+        run_batch(pipeline, input_stream, output_stream)
+    finally:
+        if input_stream is not sys.stdin:
+            input_stream.close()
+        if output_stream is not sys.stdout:
+            output_stream.close()
+
+
 def main():
+    args = parse_args()
     owl_file = validate_environment()
     
     try:
-        kb = OWLKnowledgeBase(owl_file)
+        load_synonyms()
+        kb = OWLKnowledgeBase(owl_file, snapshot_file=snapshot_path(owl_file))
+        if args.rules:
+            kb = RuleKnowledgeBase(rules_path(), source=kb)
+        
+        if args.batch or args.serve:
+            pipeline = RecommendationPipeline(RecommendationEngine(CachedKnowledgeBase(kb)))
+            if args.batch:
+                run_batch_mode(pipeline, args.batch, args.output)
+            else:
+                print(f"Сервер рекомендаций слушает {args.host}:{args.port}", file=sys.stderr)
+                serve(pipeline, args.host, args.port)
+            return
+        
         engine = RecommendationEngine(kb)
         dialogue = DialogueManager(engine)
         
@@ -1,17 +1,22 @@
-from .knowledge_base import KnowledgeBase, OWLKnowledgeBase
+from .knowledge_base import KnowledgeBase, OWLKnowledgeBase, CachedKnowledgeBase
 from .models import UserPreferences
 from .parsers import InputParser
 from .engine import RecommendationEngine
 from .ui import DialogueManager
 from .validators import InputValidator
+from .service import RecommendationPipeline
+from .rules import RuleKnowledgeBase
 
 __all__ = [
     'KnowledgeBase',
     'OWLKnowledgeBase',
+    'CachedKnowledgeBase',
     'UserPreferences',
     'InputParser',
     'RecommendationEngine',
     'DialogueManager',
     'InputValidator',
+    'RecommendationPipeline',
+    'RuleKnowledgeBase',
 ]
 
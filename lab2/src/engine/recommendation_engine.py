@@ -1,5 +1,8 @@
-from typing import List
+from typing import Callable, Dict, List, Optional
+import heapq
+
 from src.knowledge_base import KnowledgeBase
+from src.knowledge_base.incidence import top_k_order
 from src.models import UserPreferences
 
 
@@ -8,41 +11,115 @@ class RecommendationEngine:
         self.kb = knowledge_base
     
     def get_recommendations(self, preferences: UserPreferences) -> List[str]:
+        return self.get_recommendations_batch([preferences])[0]
+    
+    def get_recommendations_batch(self, prefs_list: List[UserPreferences]) -> List[List[str]]:
+        genre_games = self._memoize(self.kb.query_games_by_genre)
+        mechanic_games = self._memoize(self.kb.query_games_by_mechanic)
+        complexity_games = self._memoize(self.kb.query_games_by_complexity)
+        fixed_games = self._memoize(lambda query: query())
+        
+        results = {}
+        batch = []
+        
+        for preferences in prefs_list:
+            key = self._preferences_key(preferences)
+            if key not in results:
+                results[key] = self._collect_candidates(
+                    preferences, genre_games, mechanic_games, complexity_games, fixed_games
+                )
+            batch.append(list(results[key]))
+        
+        return batch
+    
+    def _collect_candidates(self, preferences: UserPreferences,
+                            genre_games: Callable[[str], List[str]],
+                            mechanic_games: Callable[[str], List[str]],
+                            complexity_games: Callable[[str], List[str]],
+                            fixed_games: Callable[[Callable], List[str]]) -> List[str]:
         candidates = set()
         
         for genre in preferences.genres:
-            games = self.kb.query_games_by_genre(genre)
-            candidates.update(games)
+            candidates.update(genre_games(genre))
         
         for mechanic in preferences.mechanics:
-            games = self.kb.query_games_by_mechanic(mechanic)
-            candidates.update(games)
+            candidates.update(mechanic_games(mechanic))
         
         if preferences.cooperative:
-            coop_games = self.kb.query_cooperative_games()
+            coop_games = fixed_games(self.kb.query_cooperative_games)
             if candidates:
                 candidates.intersection_update(coop_games)
             else:
                 candidates.update(coop_games)
         
         if preferences.complexity:
-            complex_games = self.kb.query_games_by_complexity(preferences.complexity)
+            complex_games = complexity_games(preferences.complexity)
             if candidates:
                 candidates.intersection_update(complex_games)
             else:
                 candidates.update(complex_games)
         
         if not candidates:
-            gateway = self.kb.query_gateway_games()
+            gateway = fixed_games(self.kb.query_gateway_games)
             candidates.update(gateway[:3])
         
         return list(candidates)
     
-    def rank_recommendations(self, games: List[str], preferences: UserPreferences) -> List[tuple]:
+    @staticmethod
+    def _memoize(query: Callable) -> Callable:
+        cache = {}
+        
+        def cached(arg):
+            if arg not in cache:
+                cache[arg] = query(arg)
+            return cache[arg]
+        
+        return cached
+    
+    @staticmethod
+    def _preferences_key(preferences: UserPreferences) -> tuple:
+        return (
+            frozenset(preferences.genres),
+            frozenset(preferences.mechanics),
+            preferences.complexity,
+            preferences.cooperative,
+        )
+    
+    def rank_recommendations(self, games: List[str], preferences: UserPreferences,
+                             top_k: Optional[int] = None) -> List[tuple]:
+        return self._rank(games, preferences, self.kb.get_game_info, top_k)
+    
+    def rank_batch(self, games_list: List[List[str]], prefs_list: List[UserPreferences],
+                   top_k: Optional[int] = None) -> List[List[tuple]]:
+        if len(games_list) != len(prefs_list):
+            raise ValueError("Количество списков игр должно совпадать с количеством предпочтений")
+        
+        game_info = self._memoize(self.kb.get_game_info)
+        return [
+            self._rank(games, preferences, game_info, top_k)
+            for games, preferences in zip(games_list, prefs_list)
+        ]
+    
+    def recommend_batch(self, prefs_list: List[UserPreferences],
+                        top_k: Optional[int] = None) -> List[List[tuple]]:
+        return self.rank_batch(self.get_recommendations_batch(prefs_list), prefs_list, top_k)
+    
+    def _rank(self, games: List[str], preferences: UserPreferences,
+              game_info: Callable[[str], Dict[str, any]], top_k: Optional[int] = None) -> List[tuple]:
+        index = self.kb.incidence_index()
+        ids = index.lookup(games) if index is not None and games else None
+        
+        if ids is not None:
+            scores = index.scores(ids, preferences.genres, preferences.mechanics, preferences.complexity)
+            return [
+                (games[i], float(scores[i]), game_info(games[i]))
+                for i in top_k_order(scores, top_k)
+            ]
+        
         ranked = []
         
         for game in games:
-            info = self.kb.get_game_info(game)
+            info = game_info(game)
             score = 0
             
             genre_matches = len(set(info['genres']) & preferences.genres)
@@ -56,6 +133,10 @@ class RecommendationEngine:
             
             ranked.append((game, score, info))
         
+        if top_k is not None and top_k < len(ranked):
+            positions = heapq.nsmallest(top_k, range(len(ranked)), key=lambda i: (-ranked[i][1], i))
+            return [ranked[i] for i in positions]
+        
         ranked.sort(key=lambda x: x[1], reverse=True)
         return ranked
 
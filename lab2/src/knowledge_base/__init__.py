@@ -1,5 +1,5 @@
 from .base import KnowledgeBase
 from .owl_kb import OWLKnowledgeBase
+from .cached_kb import CachedKnowledgeBase
 
-__all__ = ['KnowledgeBase', 'OWLKnowledgeBase']
-
+__all__ = ['KnowledgeBase', 'OWLKnowledgeBase', 'CachedKnowledgeBase']
@@ -1,8 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict
+from typing import List, Dict, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .incidence import IncidenceIndex
 
 
 class KnowledgeBase(ABC):
+    @property
+    def version(self) -> int:
+        return 0
+    
     @abstractmethod
     def query_games_by_genre(self, genre: str) -> List[str]:
         pass
@@ -30,4 +37,6 @@ class KnowledgeBase(ABC):
     @abstractmethod
     def get_game_info(self, game: str) -> Dict[str, any]:
         pass
-
+    
+    def incidence_index(self) -> Optional['IncidenceIndex']:
+        return None
@@ -0,0 +1,25 @@
+from typing import Iterable, Iterator
+
+
+def bits_to_mask(ids: Iterable[int]) -> int:
+    buf = bytearray()
+    for i in ids:
+        byte = i >> 3
+        if byte >= len(buf):
+            buf.extend(bytes(byte + 1 - len(buf)))
+        buf[byte] |= 1 << (i & 7)
+    return int.from_bytes(buf, 'little')
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    if mask <= 0:
+        return
+    bits = bin(mask)[:1:-1]
+    pos = bits.find('1')
+    while pos != -1:
+        yield pos
+        pos = bits.find('1', pos + 1)
+
+
+def popcount(mask: int) -> int:
+    return mask.bit_count()
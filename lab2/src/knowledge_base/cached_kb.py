@@ -0,0 +1,109 @@
+from collections import OrderedDict, namedtuple
+from typing import Callable, Dict, List, Optional
+import threading
+import time
+
+from .base import KnowledgeBase
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'evictions', 'maxsize', 'currsize'])
+
+
+class CachedKnowledgeBase(KnowledgeBase):
+    def __init__(self, backend: KnowledgeBase, maxsize: int = 1024, ttl: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        if maxsize <= 0:
+            raise ValueError("Размер кэша должен быть положительным")
+        if ttl is not None and ttl <= 0:
+            raise ValueError("Время жизни записей кэша должно быть положительным")
+        
+        self.backend = backend
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._cache = OrderedDict()
+        self._lock = threading.Lock()
+        self._cached_version = backend.version
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __getattr__(self, name):
+        if name == 'backend':
+            raise AttributeError(name)
+        return getattr(self.backend, name)
+    
+    @property
+    def version(self) -> int:
+        return self.backend.version
+    
+    def cache_info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self.evictions, self.maxsize, len(self._cache))
+    
+    def cache_clear(self):
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+    
+    def _sync_version(self) -> int:
+        version = self.backend.version
+        if version != self._cached_version:
+            self._cache.clear()
+            self._cached_version = version
+        return version
+    
+    def _lookup(self, key: tuple, compute: Callable):
+        with self._lock:
+            version = self._sync_version()
+            entry = self._cache.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > self._clock():
+                    self._cache.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._cache[key]
+            self.misses += 1
+        
+        value = compute()
+        
+        with self._lock:
+            if self._sync_version() == version:
+                expires_at = self._clock() + self.ttl if self.ttl is not None else None
+                self._cache[key] = (value, expires_at)
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.maxsize:
+                    self._cache.popitem(last=False)
+                    self.evictions += 1
+        return value
+    
+    def _cached_list(self, key: tuple, compute: Callable[[], List[str]]) -> List[str]:
+        return list(self._lookup(key, lambda: tuple(compute())))
+    
+    def query_games_by_genre(self, genre: str) -> List[str]:
+        return self._cached_list(('genre', genre), lambda: self.backend.query_games_by_genre(genre))
+    
+    def query_games_by_mechanic(self, mechanic: str) -> List[str]:
+        return self._cached_list(('mechanic', mechanic), lambda: self.backend.query_games_by_mechanic(mechanic))
+    
+    def query_games_by_complexity(self, complexity: str) -> List[str]:
+        return self._cached_list(
+            ('complexity', complexity), lambda: self.backend.query_games_by_complexity(complexity)
+        )
+    
+    def query_cooperative_games(self) -> List[str]:
+        return self._cached_list(('cooperative',), self.backend.query_cooperative_games)
+    
+    def query_gateway_games(self) -> List[str]:
+        return self._cached_list(('gateway',), self.backend.query_gateway_games)
+    
+    def query_deep_strategy_games(self) -> List[str]:
+        return self._cached_list(('deep_strategy',), self.backend.query_deep_strategy_games)
+    
+    def get_game_info(self, game: str) -> Dict[str, any]:
+        return dict(self._lookup(('info', game), lambda: self.backend.get_game_info(game)))
+    
+    def incidence_index(self):
+        return self.backend.incidence_index()
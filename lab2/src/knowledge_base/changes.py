@@ -0,0 +1,47 @@
+from typing import List, Optional, Tuple
+import json
+
+from .owl_loader import PROPERTIES, Individual
+
+
+def _as_list(record: dict, field: str, default: List[str]) -> List[str]:
+    value = record.get(field, default)
+    if isinstance(value, str):
+        return [value]
+    if not isinstance(value, list) or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"Поле '{field}' должно быть строкой или списком строк")
+    return list(value)
+
+
+def parse_change(record: dict) -> Tuple[str, Optional[Individual]]:
+    name = record.get('name')
+    if not isinstance(name, str) or not name:
+        raise ValueError("Поле 'name' обязательно в записи изменений")
+    if record.get('op', 'upsert') == 'delete':
+        return name, None
+    
+    types = _as_list(record, 'types', ['Game'])
+    properties = {prop: _as_list(record, prop, []) for prop in PROPERTIES}
+    return name, (name, types, properties)
+
+
+def read_changes(change_file: str, offset: int = 0) -> Tuple[List[Individual], List[str], int]:
+    with open(change_file, 'rb') as f:
+        f.seek(offset)
+        data = f.read()
+    
+    end = data.rfind(b'\n') + 1
+    latest = {}
+    for line_no, line in enumerate(data[:end].splitlines(), 1):
+        if not line.strip():
+            continue
+        try:
+            name, individual = parse_change(json.loads(line))
+        except (ValueError, TypeError, AttributeError) as e:
+            raise ValueError(f"Некорректная запись в файле изменений {change_file} (смещение {offset}, строка {line_no}): {e}")
+        latest.pop(name, None)
+        latest[name] = individual
+    
+    upserts = [individual for individual in latest.values() if individual is not None]
+    removals = [name for name, individual in latest.items() if individual is None]
+    return upserts, removals, offset + end
@@ -0,0 +1,87 @@
+from typing import Dict, Iterable, List, Optional, Set
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+GENRE_WEIGHT = 2.0
+MECHANIC_WEIGHT = 1.5
+COMPLEXITY_WEIGHT = 1.0
+
+
+class IncidenceIndex:
+    def __init__(self, game_names: List[str], game_genres: Dict[str, List[str]],
+                 game_mechanics: Dict[str, List[str]], game_complexity: Dict[str, str]):
+        if np is None:
+            raise ImportError("Для матрицы инцидентности требуется numpy")
+        
+        self.game_names = list(game_names)
+        self.game_ids = {name: gid for gid, name in enumerate(self.game_names)}
+        
+        self.genre_ids, self.genre_matrix = self._build_matrix(game_genres)
+        self.mechanic_ids, self.mechanic_matrix = self._build_matrix(game_mechanics)
+        
+        self.complexity_ids = {}
+        codes = np.full(len(self.game_names), -1, dtype=np.int8)
+        for gid, name in enumerate(self.game_names):
+            complexity = game_complexity.get(name)
+            if complexity is not None:
+                codes[gid] = self.complexity_ids.setdefault(complexity, len(self.complexity_ids))
+        self.complexity_codes = codes
+    
+    def _build_matrix(self, relation: Dict[str, List[str]]):
+        vocabulary = {}
+        rows = []
+        cols = []
+        for gid, name in enumerate(self.game_names):
+            for value in relation.get(name, []):
+                rows.append(gid)
+                cols.append(vocabulary.setdefault(value, len(vocabulary)))
+        
+        matrix = np.zeros((len(self.game_names), len(vocabulary)), dtype=np.uint8)
+        matrix[rows, cols] = 1
+        return vocabulary, matrix
+    
+    def lookup(self, games: Iterable[str]) -> Optional['np.ndarray']:
+        ids = [self.game_ids.get(game) for game in games]
+        if None in ids:
+            return None
+        return np.asarray(ids, dtype=np.intp)
+    
+    def _weights(self, vocabulary: Dict[str, int], selected: Set[str], weight: float) -> 'np.ndarray':
+        vector = np.zeros(len(vocabulary))
+        for value in selected:
+            col = vocabulary.get(value)
+            if col is not None:
+                vector[col] = weight
+        return vector
+    
+    def scores(self, ids: 'np.ndarray', genres: Set[str], mechanics: Set[str],
+               complexity: Optional[str]) -> 'np.ndarray':
+        scores = np.zeros(len(ids))
+        
+        if genres and self.genre_ids:
+            scores += self.genre_matrix[ids] @ self._weights(self.genre_ids, genres, GENRE_WEIGHT)
+        if mechanics and self.mechanic_ids:
+            scores += self.mechanic_matrix[ids] @ self._weights(self.mechanic_ids, mechanics, MECHANIC_WEIGHT)
+        if complexity and complexity in self.complexity_ids:
+            scores += (self.complexity_codes[ids] == self.complexity_ids[complexity]) * COMPLEXITY_WEIGHT
+        
+        return scores
+
+
+def top_k_order(scores: 'np.ndarray', k: Optional[int] = None) -> 'np.ndarray':
+    n = len(scores)
+    if k is None or k >= n:
+        return np.argsort(-scores, kind='stable')
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    
+    kth = np.partition(scores, n - k)[n - k]
+    above = np.flatnonzero(scores > kth)
+    ties = np.flatnonzero(scores == kth)[:k - len(above)]
+    
+    selected = np.concatenate([above, ties])
+    selected.sort()
+    return selected[np.argsort(-scores[selected], kind='stable')]
@@ -0,0 +1,127 @@
+from collections.abc import Mapping, MutableMapping, MutableSet
+from typing import Any, Hashable, Iterable, Iterator
+
+_MISSING = object()
+_REMOVED = object()
+
+# Слой изменений сливается с базой, когда его размер превышает корень из размера базы:
+# fork() копирует не больше O(sqrt(N)) записей, слияние за O(N) происходит раз в sqrt(N) версий
+MIN_LAYER_SIZE = 32
+
+
+class LayeredDict(MutableMapping):
+    # Общая база, которую никто не изменяет, и собственный слой изменений поверх неё.
+    # Версии состояния, полученные через fork(), делят базу и копируют только слой.
+    
+    def __init__(self, base: Mapping = None):
+        self._base = base if base is not None else {}
+        self._layer = {}
+        self._len = len(self._base)
+    
+    @classmethod
+    def fork_of(cls, mapping: Mapping) -> 'LayeredDict':
+        # Обычный словарь после публикации состояния не изменяется и становится базой как есть
+        if isinstance(mapping, LayeredDict):
+            return mapping.fork()
+        return cls(mapping)
+    
+    def fork(self) -> 'LayeredDict':
+        other = LayeredDict.__new__(LayeredDict)
+        if len(self._layer) > max(MIN_LAYER_SIZE, len(self._base) ** 0.5):
+            base = dict(self._base)
+            for key, value in self._layer.items():
+                if value is _REMOVED:
+                    del base[key]
+                else:
+                    base[key] = value
+            other._base, other._layer = base, {}
+        else:
+            other._base, other._layer = self._base, dict(self._layer)
+        other._len = self._len
+        return other
+    
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self._layer.get(key, _MISSING)
+        if value is _MISSING:
+            return self._base[key]
+        if value is _REMOVED:
+            raise KeyError(key)
+        return value
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        value = self._layer.get(key, _MISSING)
+        if value is _MISSING:
+            return self._base.get(key, default)
+        return default if value is _REMOVED else value
+    
+    def __contains__(self, key: Hashable) -> bool:
+        value = self._layer.get(key, _MISSING)
+        if value is _MISSING:
+            return key in self._base
+        return value is not _REMOVED
+    
+    def __setitem__(self, key: Hashable, value: Any):
+        if key not in self:
+            self._len += 1
+        self._layer[key] = value
+    
+    def __delitem__(self, key: Hashable):
+        if key not in self:
+            raise KeyError(key)
+        if key in self._base:
+            self._layer[key] = _REMOVED
+        else:
+            del self._layer[key]
+        self._len -= 1
+    
+    def __iter__(self) -> Iterator[Hashable]:
+        layer = self._layer
+        for key in self._base:
+            if layer.get(key) is not _REMOVED:
+                yield key
+        base = self._base
+        for key in layer:
+            if key not in base:
+                yield key
+    
+    def __len__(self) -> int:
+        return self._len
+    
+    def __repr__(self) -> str:
+        return f"LayeredDict({dict(self.items())!r})"
+
+
+class LayeredSet(MutableSet):
+    # Множество поверх LayeredDict с тем же разделением базы между версиями
+    
+    def __init__(self, items: LayeredDict):
+        self._items = items
+    
+    @classmethod
+    def fork_of(cls, items: Iterable[Hashable]) -> 'LayeredSet':
+        if isinstance(items, LayeredSet):
+            return cls(items._items.fork())
+        return cls(LayeredDict(dict.fromkeys(items, True)))
+    
+    @classmethod
+    def _from_iterable(cls, items: Iterable[Hashable]) -> set:
+        return set(items)
+    
+    def __contains__(self, item: Hashable) -> bool:
+        return item in self._items
+    
+    def __iter__(self) -> Iterator[Hashable]:
+        return iter(self._items)
+    
+    def __len__(self) -> int:
+        return len(self._items)
+    
+    def add(self, item: Hashable):
+        self._items[item] = True
+    
+    def discard(self, item: Hashable):
+        if item in self._items:
+            del self._items[item]
+    
+    def __repr__(self) -> str:
+        return f"LayeredSet({set(self)!r})"
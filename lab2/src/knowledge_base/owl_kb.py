@@ -1,20 +1,21 @@
-from typing import List, Dict
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
+import os
+import threading
 import xml.etree.ElementTree as ET
 
 from .base import KnowledgeBase
+from .bitset import iter_bits
+from .changes import read_changes
+from .incidence import IncidenceIndex, np
+from .owl_loader import Individual, extract_name, iter_individuals
+from .snapshot import load_snapshot, save_snapshot, source_fingerprint
+from .state import KnowledgeState
 
 
 class OWLKnowledgeBase(KnowledgeBase):
-    def __init__(self, owl_file: str):
-        try:
-            self.tree = ET.parse(owl_file)
-            self.root = self.tree.getroot()
-        except ET.ParseError as e:
-            raise ValueError(f"Ошибка парсинга OWL файла: {e}")
-        except FileNotFoundError:
-            raise FileNotFoundError(f"OWL файл не найден: {owl_file}")
-        except Exception as e:
-            raise RuntimeError(f"Ошибка загрузки онтологии: {e}")
+    def __init__(self, owl_file: str, snapshot_file: Optional[str] = None):
+        self.owl_file = owl_file
+        self.snapshot_file = snapshot_file
         
         self.ns = {
             'rdf': 'http://www.w3.org/1999/02/22-rdf-syntax-ns#',
@@ -23,114 +24,185 @@ class OWLKnowledgeBase(KnowledgeBase):
             'bg': 'http://example.org/boardgames#'
         }
         
-        self._games = set()
-        self._genres = set()
-        self._mechanics = set()
-        self._game_genres = {}
-        self._game_mechanics = {}
-        self._game_designers = {}
-        
-        self._parse_ontology()
+        self._write_lock = threading.Lock()
+        self._change_offsets = {}
+        self._fingerprint = None
+        self._state = KnowledgeState()
+        self._load()
     
-    def _extract_name(self, uri: str) -> str:
-        return uri.split('#')[-1] if '#' in uri else uri.split('/')[-1]
+    @property
+    def version(self) -> int:
+        return self._state.version
     
-    def _parse_ontology(self):
-        for individual in self.root.findall('.//owl:NamedIndividual', self.ns):
-            about = individual.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}about')
-            if not about:
-                continue
+    def reload(self) -> int:
+        with self._write_lock:
+            if not os.path.exists(self.owl_file):
+                raise FileNotFoundError(f"OWL файл не найден: {self.owl_file}")
             
-            name = self._extract_name(about)
+            fingerprint = source_fingerprint(self.owl_file)
+            if fingerprint == self._fingerprint:
+                return 0
             
-            types = individual.findall('.//rdf:type', self.ns)
-            for t in types:
-                resource = t.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource')
-                if resource:
-                    type_name = self._extract_name(resource)
-                    if type_name == 'Game':
-                        self._games.add(name)
-                    elif type_name == 'Genre':
-                        self._genres.add(name)
-                    elif type_name == 'Mechanic':
-                        self._mechanics.add(name)
-            
-            if name in self._games:
-                self._game_genres[name] = []
-                self._game_mechanics[name] = []
-                self._game_designers[name] = []
-                
-                for genre_elem in individual.findall('.//bg:hasGenre', self.ns):
-                    genre_uri = genre_elem.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource')
-                    if genre_uri:
-                        self._game_genres[name].append(self._extract_name(genre_uri))
-                
-                for mechanic_elem in individual.findall('.//bg:hasMechanic', self.ns):
-                    mechanic_uri = mechanic_elem.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource')
-                    if mechanic_uri:
-                        self._game_mechanics[name].append(self._extract_name(mechanic_uri))
-                
-                for designer_elem in individual.findall('.//bg:designedBy', self.ns):
-                    designer_uri = designer_elem.get('{http://www.w3.org/1999/02/22-rdf-syntax-ns#}resource')
-                    if designer_uri:
-                        self._game_designers[name].append(self._extract_name(designer_uri))
+            upserts, removals = self._state.diff(self._parse_ontology())
+            if upserts or removals:
+                self._state = self._state.apply_delta(upserts, removals)[0]
+            self._fingerprint = fingerprint
+            self._save_snapshot(fingerprint)
+            return len(upserts) + len(removals)
+    
+    def apply_delta(self, upserts: Iterable[Individual] = (), removals: Iterable[str] = ()) -> int:
+        upserts = list(upserts)
+        removals = list(removals)
+        with self._write_lock:
+            self._state = self._state.apply_delta(upserts, removals)[0]
+        return len(upserts) + len(removals)
+    
+    def apply_change_file(self, change_file: str) -> int:
+        with self._write_lock:
+            offset = self._change_offsets.get(change_file, 0)
+            upserts, removals, offset = read_changes(change_file, offset)
+            if upserts or removals:
+                self._state = self._state.apply_delta(upserts, removals)[0]
+            self._change_offsets[change_file] = offset
+            return len(upserts) + len(removals)
+    
+    def _extract_name(self, uri: str) -> str:
+        return extract_name(uri)
+    
+    def _load(self):
+        if not os.path.exists(self.owl_file):
+            raise FileNotFoundError(f"OWL файл не найден: {self.owl_file}")
+        
+        state = KnowledgeState()
+        fingerprint = source_fingerprint(self.owl_file)
+        
+        facts = load_snapshot(self.snapshot_file, self.owl_file) if self.snapshot_file else None
+        if facts is not None:
+            state.import_facts(facts)
+        else:
+            for name, types, properties in self._parse_ontology():
+                state.add_individual(name, types, properties)
+        
+        state.build_indexes()
+        self._state = state
+        self._fingerprint = fingerprint
+        if facts is None:
+            self._save_snapshot(fingerprint)
+    
+    def _save_snapshot(self, fingerprint: Tuple[int, int]):
+        if not self.snapshot_file:
+            return
+        try:
+            save_snapshot(self.snapshot_file, self.owl_file, self._state.export_facts(), fingerprint)
+        except OSError:
+            pass
     
+    def _parse_ontology(self) -> Iterator[Individual]:
+        try:
+            yield from iter_individuals(self.owl_file)
+        except ET.ParseError as e:
+            raise ValueError(f"Ошибка парсинга OWL файла: {e}")
+        except FileNotFoundError:
+            raise FileNotFoundError(f"OWL файл не найден: {self.owl_file}")
+        except Exception as e:
+            raise RuntimeError(f"Ошибка загрузки онтологии: {e}")
+    
+    def genre_mask(self, genre: str) -> int:
+        return self._state.genre_index.get(genre, 0)
+    
+    def mechanic_mask(self, mechanic: str) -> int:
+        return self._state.mechanic_index.get(mechanic, 0)
+    
+    def designer_mask(self, designer: str) -> int:
+        return self._state.designer_index.get(designer, 0)
+    
+    def complexity_mask(self, complexity: str) -> int:
+        return self._state.complexity_index.get(complexity, 0)
+    
+    def all_games_mask(self) -> int:
+        return self._state.all_games_mask
+    
+    def games_from_mask(self, mask: int) -> List[str]:
+        return self._games_from_mask(self._state, mask)
+    
+    @staticmethod
+    def _games_from_mask(state: KnowledgeState, mask: int) -> List[str]:
+        names = state.game_names
+        return [names[i] for i in iter_bits(mask & state.all_games_mask)]
+    
+    # Каждый запрос читает self._state один раз: все маски и имена берутся из одной версии,
+    # даже если apply_delta подменит состояние посреди запроса
     def query_games_by_genre(self, genre: str) -> List[str]:
-        return [game for game, genres in self._game_genres.items() if genre in genres]
+        state = self._state
+        return self._games_from_mask(state, state.genre_index.get(genre, 0))
     
     def query_games_by_mechanic(self, mechanic: str) -> List[str]:
-        return [game for game, mechanics in self._game_mechanics.items() if mechanic in mechanics]
+        state = self._state
+        return self._games_from_mask(state, state.mechanic_index.get(mechanic, 0))
+    
+    def query_games_by_designer(self, designer: str) -> List[str]:
+        state = self._state
+        return self._games_from_mask(state, state.designer_index.get(designer, 0))
     
     def query_games_by_complexity(self, complexity: str) -> List[str]:
-        results = []
-        for game in self._games:
-            comp = self._calculate_complexity(game)
-            if comp == complexity:
-                results.append(game)
-        return results
+        state = self._state
+        return self._games_from_mask(state, state.complexity_index.get(complexity, 0))
     
     def _calculate_complexity(self, game: str) -> str:
-        mechanics = self._game_mechanics.get(game, [])
-        genres = self._game_genres.get(game, [])
-        
-        if 'worker_placement' in mechanics or 'area_control' in mechanics:
-            return 'heavy'
-        if 'party' in genres:
-            return 'light'
-        return 'medium'
+        return self._state.game_complexity.get(game, 'medium')
     
     def query_cooperative_games(self) -> List[str]:
-        results = []
-        for game in self._games:
-            genres = self._game_genres.get(game, [])
-            mechanics = self._game_mechanics.get(game, [])
-            if 'cooperative' in genres or 'hidden_roles' in mechanics:
-                results.append(game)
-        return results
+        state = self._state
+        return self._games_from_mask(
+            state, state.genre_index.get('cooperative', 0) | state.mechanic_index.get('hidden_roles', 0)
+        )
     
     def query_gateway_games(self) -> List[str]:
-        results = []
-        for game in self._games:
-            mechanics = self._game_mechanics.get(game, [])
-            if ('tile_placement' in mechanics or 'set_collection' in mechanics) and \
-               'area_control' not in mechanics:
-                results.append(game)
-        return results
+        state = self._state
+        mechanics = state.mechanic_index
+        simple = mechanics.get('tile_placement', 0) | mechanics.get('set_collection', 0)
+        return self._games_from_mask(state, simple & ~mechanics.get('area_control', 0))
     
     def query_deep_strategy_games(self) -> List[str]:
-        results = []
-        for game in self._games:
-            mechanics = self._game_mechanics.get(game, [])
-            if ('worker_placement' in mechanics or 'area_control' in mechanics) and \
-               'dice_rolling' not in mechanics:
-                results.append(game)
-        return results
+        state = self._state
+        mechanics = state.mechanic_index
+        strategic = mechanics.get('worker_placement', 0) | mechanics.get('area_control', 0)
+        return self._games_from_mask(state, strategic & ~mechanics.get('dice_rolling', 0))
     
     def get_game_info(self, game: str) -> Dict[str, any]:
+        state = self._state
         return {
             'name': game,
-            'genres': self._game_genres.get(game, []),
-            'mechanics': self._game_mechanics.get(game, []),
-            'complexity': self._calculate_complexity(game)
+            'genres': state.game_genres.get(game, []),
+            'mechanics': state.game_mechanics.get(game, []),
+            'complexity': state.game_complexity.get(game, 'medium')
         }
-
+    
+    def iter_facts(self) -> Iterator[Tuple[str, tuple]]:
+        state = self._state
+        games = state.live_games()
+        for game in games:
+            yield 'game', (game,)
+        for genre in sorted(state.genres):
+            yield 'genre', (genre,)
+        for mechanic in sorted(state.mechanics):
+            yield 'mechanic', (mechanic,)
+        for designer in state.designer_index:
+            yield 'designer', (designer,)
+        for game in games:
+            for genre in state.game_genres.get(game, []):
+                yield 'has_genre', (game, genre)
+            for mechanic in state.game_mechanics.get(game, []):
+                yield 'has_mechanic', (game, mechanic)
+            for designer in state.game_designers.get(game, []):
+                yield 'designer_of', (game, designer)
+    
+    def incidence_index(self) -> Optional[IncidenceIndex]:
+        if np is None:
+            return None
+        state = self._state
+        if state.incidence is None:
+            state.incidence = IncidenceIndex(
+                state.game_names, state.game_genres, state.game_mechanics, state.game_complexity
+            )
+        return state.incidence
@@ -0,0 +1,63 @@
+from typing import Dict, Iterator, List, Tuple
+import xml.etree.ElementTree as ET
+
+RDF_NS = '{http://www.w3.org/1999/02/22-rdf-syntax-ns#}'
+OWL_NS = '{http://www.w3.org/2002/07/owl#}'
+BG_NS = '{http://example.org/boardgames#}'
+
+NAMED_INDIVIDUAL = OWL_NS + 'NamedIndividual'
+RDF_ABOUT = RDF_NS + 'about'
+RDF_RESOURCE = RDF_NS + 'resource'
+RDF_TYPE = RDF_NS + 'type'
+
+PROPERTIES = {
+    'hasGenre': BG_NS + 'hasGenre',
+    'hasMechanic': BG_NS + 'hasMechanic',
+    'designedBy': BG_NS + 'designedBy',
+}
+
+Individual = Tuple[str, List[str], Dict[str, List[str]]]
+
+
+def extract_name(uri: str) -> str:
+    return uri.split('#')[-1] if '#' in uri else uri.split('/')[-1]
+
+
+def _resources(elem: ET.Element, tag: str) -> List[str]:
+    names = []
+    for child in elem.iter(tag):
+        resource = child.get(RDF_RESOURCE)
+        if resource:
+            names.append(extract_name(resource))
+    return names
+
+
+def _read_individual(elem: ET.Element) -> Individual:
+    name = extract_name(elem.get(RDF_ABOUT))
+    types = _resources(elem, RDF_TYPE)
+    properties = {prop: _resources(elem, tag) for prop, tag in PROPERTIES.items()}
+    return name, types, properties
+
+
+def iter_individuals(owl_file: str) -> Iterator[Individual]:
+    root = None
+    depth = 0
+    open_individuals = 0
+    
+    for event, elem in ET.iterparse(owl_file, events=('start', 'end')):
+        if event == 'start':
+            depth += 1
+            if root is None:
+                root = elem
+            if elem.tag == NAMED_INDIVIDUAL:
+                open_individuals += 1
+            continue
+        
+        if elem.tag == NAMED_INDIVIDUAL:
+            open_individuals -= 1
+            if elem.get(RDF_ABOUT):
+                yield _read_individual(elem)
+        
+        if depth == 2 and not open_individuals:
+            root.clear()
+        depth -= 1
@@ -0,0 +1,84 @@
+from typing import Any, Dict, Optional, Tuple
+import hashlib
+import marshal
+import os
+import struct
+import tempfile
+import zlib
+
+MAGIC = b'BGKBSNAP'
+FORMAT_VERSION = 1
+
+HEADER = struct.Struct('<8sHHqq32s')
+
+
+def source_fingerprint(source_file: str) -> Tuple[int, int]:
+    stat = os.stat(source_file)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> bytes:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.digest()
+
+
+def _pack_header(mtime_ns: int, size: int, digest: bytes) -> bytes:
+    return HEADER.pack(MAGIC, FORMAT_VERSION, marshal.version, mtime_ns, size, digest)
+
+
+def load_snapshot(snapshot_file: str, source_file: str) -> Optional[Dict[str, Any]]:
+    mtime_ns, size = source_fingerprint(source_file)
+    
+    try:
+        with open(snapshot_file, 'rb') as f:
+            header = f.read(HEADER.size)
+            payload = f.read()
+    except OSError:
+        return None
+    
+    if len(header) != HEADER.size:
+        return None
+    
+    magic, version, marshal_version, snap_mtime, snap_size, snap_digest = HEADER.unpack(header)
+    if magic != MAGIC or version != FORMAT_VERSION or marshal_version != marshal.version:
+        return None
+    if snap_size != size:
+        return None
+    
+    if snap_mtime != mtime_ns:
+        if file_digest(source_file) != snap_digest:
+            return None
+        try:
+            with open(snapshot_file, 'r+b') as f:
+                f.write(_pack_header(mtime_ns, size, snap_digest))
+        except OSError:
+            pass
+    
+    try:
+        return marshal.loads(zlib.decompress(payload))
+    except (ValueError, EOFError, TypeError, zlib.error):
+        return None
+
+
+def save_snapshot(snapshot_file: str, source_file: str, facts: Dict[str, Any],
+                  fingerprint: Optional[Tuple[int, int]] = None, digest: Optional[bytes] = None):
+    mtime_ns, size = fingerprint or source_fingerprint(source_file)
+    digest = digest or file_digest(source_file)
+    payload = zlib.compress(marshal.dumps(facts))
+    
+    directory = os.path.dirname(os.path.abspath(snapshot_file))
+    os.makedirs(directory, exist_ok=True)
+    
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.snapshot-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_pack_header(mtime_ns, size, digest))
+            f.write(payload)
+        os.replace(tmp_path, snapshot_file)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
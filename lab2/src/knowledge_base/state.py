@@ -0,0 +1,235 @@
+from typing import Dict, Iterable, List, Set, Tuple
+
+from .bitset import bits_to_mask, iter_bits
+from .layered import LayeredDict, LayeredSet
+from .owl_loader import Individual
+
+HEAVY_MECHANICS = ('worker_placement', 'area_control')
+LIGHT_GENRES = ('party',)
+
+
+def classify_complexity(genres: Iterable[str], mechanics: Iterable[str]) -> str:
+    if any(m in HEAVY_MECHANICS for m in mechanics):
+        return 'heavy'
+    if any(g in LIGHT_GENRES for g in genres):
+        return 'light'
+    return 'medium'
+
+
+class KnowledgeState:
+    def __init__(self, version: int = 0):
+        self.version = version
+        
+        self.games = set()
+        self.genres = set()
+        self.mechanics = set()
+        self.game_genres = {}
+        self.game_mechanics = {}
+        self.game_designers = {}
+        
+        self.game_ids = {}
+        self.game_names = []
+        self.all_games_mask = 0
+        self.genre_index = {}
+        self.mechanic_index = {}
+        self.designer_index = {}
+        self.complexity_index = {}
+        self.game_complexity = {}
+        self.incidence = None
+    
+    def add_individual(self, name: str, types: List[str], properties: Dict[str, List[str]]):
+        for type_name in types:
+            if type_name == 'Game':
+                self.games.add(name)
+            elif type_name == 'Genre':
+                self.genres.add(name)
+            elif type_name == 'Mechanic':
+                self.mechanics.add(name)
+        
+        if name in self.games:
+            if name not in self.game_ids:
+                self.game_ids[name] = len(self.game_names)
+                self.game_names.append(name)
+            
+            self.game_genres[name] = properties['hasGenre']
+            self.game_mechanics[name] = properties['hasMechanic']
+            self.game_designers[name] = properties['designedBy']
+    
+    def live_games(self) -> List[str]:
+        games = self.games
+        return [g for g in self.game_names if g in games]
+    
+    def export_facts(self) -> Dict[str, list]:
+        games = self.live_games()
+        return {
+            'games': games,
+            'genres': sorted(self.genres),
+            'mechanics': sorted(self.mechanics),
+            'game_genres': [self.game_genres[g] for g in games],
+            'game_mechanics': [self.game_mechanics[g] for g in games],
+            'game_designers': [self.game_designers[g] for g in games],
+        }
+    
+    def import_facts(self, facts: Dict[str, list]):
+        games = facts['games']
+        self.game_names = list(games)
+        self.game_ids = {game: gid for gid, game in enumerate(games)}
+        self.games = set(games)
+        self.genres = set(facts['genres'])
+        self.mechanics = set(facts['mechanics'])
+        self.game_genres = dict(zip(games, facts['game_genres']))
+        self.game_mechanics = dict(zip(games, facts['game_mechanics']))
+        self.game_designers = dict(zip(games, facts['game_designers']))
+    
+    def build_indexes(self):
+        genre_ids = {}
+        mechanic_ids = {}
+        designer_ids = {}
+        
+        for game in self.live_games():
+            gid = self.game_ids[game]
+            for genre in self.game_genres.get(game, []):
+                genre_ids.setdefault(genre, []).append(gid)
+            for mechanic in self.game_mechanics.get(game, []):
+                mechanic_ids.setdefault(mechanic, []).append(gid)
+            for designer in self.game_designers.get(game, []):
+                designer_ids.setdefault(designer, []).append(gid)
+        
+        self.all_games_mask = bits_to_mask(self.game_ids[g] for g in self.games)
+        self.genre_index = {k: bits_to_mask(ids) for k, ids in genre_ids.items()}
+        self.mechanic_index = {k: bits_to_mask(ids) for k, ids in mechanic_ids.items()}
+        self.designer_index = {k: bits_to_mask(ids) for k, ids in designer_ids.items()}
+        
+        heavy = 0
+        for mechanic in HEAVY_MECHANICS:
+            heavy |= self.mechanic_index.get(mechanic, 0)
+        light = 0
+        for genre in LIGHT_GENRES:
+            light |= self.genre_index.get(genre, 0)
+        light &= ~heavy
+        medium = self.all_games_mask & ~(heavy | light)
+        self.complexity_index = {'heavy': heavy, 'light': light, 'medium': medium}
+        
+        self.game_complexity = {}
+        for complexity, mask in self.complexity_index.items():
+            for gid in iter_bits(mask):
+                self.game_complexity[self.game_names[gid]] = complexity
+        
+        self.incidence = None
+    
+    def fork(self) -> 'KnowledgeState':
+        # Новая версия делит с текущей все словари и множества и копирует только их слои изменений,
+        # поэтому дельта стоит O(sqrt(N) + изменённые записи), а не O(N). Список game_names общий:
+        # он только дописывается, а маски и множество games каждой версии ссылаются лишь на её игры.
+        state = KnowledgeState(self.version)
+        state.games = LayeredSet.fork_of(self.games)
+        state.genres = LayeredSet.fork_of(self.genres)
+        state.mechanics = LayeredSet.fork_of(self.mechanics)
+        state.game_genres = LayeredDict.fork_of(self.game_genres)
+        state.game_mechanics = LayeredDict.fork_of(self.game_mechanics)
+        state.game_designers = LayeredDict.fork_of(self.game_designers)
+        state.game_ids = LayeredDict.fork_of(self.game_ids)
+        state.game_names = self.game_names
+        state.all_games_mask = self.all_games_mask
+        state.genre_index = LayeredDict.fork_of(self.genre_index)
+        state.mechanic_index = LayeredDict.fork_of(self.mechanic_index)
+        state.designer_index = LayeredDict.fork_of(self.designer_index)
+        state.complexity_index = LayeredDict.fork_of(self.complexity_index)
+        state.game_complexity = LayeredDict.fork_of(self.game_complexity)
+        return state
+    
+    def diff(self, individuals: Iterable[Individual]) -> Tuple[List[Individual], List[str]]:
+        latest = {}
+        for name, types, properties in individuals:
+            latest[name] = (name, types, properties)
+        
+        upserts = []
+        for name, types, properties in latest.values():
+            if not self._matches(name, types, properties):
+                upserts.append((name, types, properties))
+        
+        known = self.games | self.genres | self.mechanics
+        removals = [name for name in known if name not in latest]
+        return upserts, removals
+    
+    def _matches(self, name: str, types: List[str], properties: Dict[str, List[str]]) -> bool:
+        if (name in self.genres) != ('Genre' in types) or (name in self.mechanics) != ('Mechanic' in types):
+            return False
+        if (name in self.games) != ('Game' in types):
+            return False
+        if 'Game' not in types:
+            return True
+        return (
+            self.game_genres.get(name) == properties['hasGenre']
+            and self.game_mechanics.get(name) == properties['hasMechanic']
+            and self.game_designers.get(name) == properties['designedBy']
+        )
+    
+    def apply_delta(self, upserts: Iterable[Individual] = (), removals: Iterable[str] = (),
+                    rebuild_ratio: float = 0.125) -> Tuple['KnowledgeState', Set[str]]:
+        upserts = list(upserts)
+        removals = list(removals)
+        state = self.fork()
+        state.version = self.version + 1
+        
+        touched = set()
+        for name in removals:
+            touched.update(state._discard_individual(name))
+        for name, types, properties in upserts:
+            touched.update(state._discard_individual(name))
+            state.add_individual(name, types, properties)
+            if name in state.games:
+                touched.add(name)
+        
+        if len(touched) > max(1, len(state.game_names)) * rebuild_ratio:
+            state.build_indexes()
+        else:
+            for game in touched:
+                state._index_game(game)
+        return state, touched
+    
+    def _discard_individual(self, name: str) -> List[str]:
+        self.genres.discard(name)
+        self.mechanics.discard(name)
+        if name not in self.games:
+            return []
+        
+        gid = self.game_ids[name]
+        bit = ~(1 << gid)
+        self._clear_bits(self.genre_index, self.game_genres.pop(name, []), bit)
+        self._clear_bits(self.mechanic_index, self.game_mechanics.pop(name, []), bit)
+        self._clear_bits(self.designer_index, self.game_designers.pop(name, []), bit)
+        complexity = self.game_complexity.pop(name, None)
+        if complexity is not None:
+            self.complexity_index[complexity] &= bit
+        self.all_games_mask &= bit
+        self.games.discard(name)
+        return [name]
+    
+    @staticmethod
+    def _clear_bits(index: Dict[str, int], keys: List[str], bit: int):
+        for key in keys:
+            mask = index.get(key, 0) & bit
+            if mask:
+                index[key] = mask
+            else:
+                index.pop(key, None)
+    
+    def _index_game(self, name: str):
+        if name not in self.games:
+            return
+        
+        bit = 1 << self.game_ids[name]
+        for index, keys in (
+            (self.genre_index, self.game_genres[name]),
+            (self.mechanic_index, self.game_mechanics[name]),
+            (self.designer_index, self.game_designers[name]),
+        ):
+            for key in keys:
+                index[key] = index.get(key, 0) | bit
+        
+        complexity = classify_complexity(self.game_genres[name], self.game_mechanics[name])
+        self.game_complexity[name] = complexity
+        self.complexity_index[complexity] = self.complexity_index.get(complexity, 0) | bit
+        self.all_games_mask |= bit
+
@@ -1,5 +1,9 @@
+from typing import Dict
+import json
+
 from src.models import UserPreferences
 from src.validators import InputValidator
+from .keyword_matcher import KeywordMatcher
 
 
 class InputParser:
@@ -38,6 +42,52 @@ class InputParser:
         'тяжелые': 'heavy',
     }
     
+    COOPERATIVE_KEYWORDS = ['кооператив', 'вместе']
+    
+    COMPETITIVE_KEYWORDS = ['конкурент', 'против']
+    
+    _matcher = None
+    
+    @classmethod
+    def compile_matcher(cls) -> KeywordMatcher:
+        matcher = KeywordMatcher()
+        
+        for key, value in cls.GENRE_MAPPING.items():
+            matcher.add(key, ('genre', value))
+        for key, value in cls.MECHANIC_MAPPING.items():
+            matcher.add(key, ('mechanic', value))
+        for priority, (key, value) in enumerate(cls.COMPLEXITY_MAPPING.items()):
+            matcher.add(key, ('complexity', (priority, value)))
+        for key in cls.COOPERATIVE_KEYWORDS:
+            matcher.add(key, ('cooperative', True))
+        for key in cls.COMPETITIVE_KEYWORDS:
+            matcher.add(key, ('cooperative', False))
+        
+        matcher.build()
+        cls._matcher = matcher
+        return matcher
+    
+    @classmethod
+    def load_synonyms(cls, path: str):
+        with open(path, encoding='utf-8') as f:
+            synonyms = json.load(f)
+        
+        cls.GENRE_MAPPING = {**cls.GENRE_MAPPING, **cls._lowercase(synonyms.get('genres', {}))}
+        cls.MECHANIC_MAPPING = {**cls.MECHANIC_MAPPING, **cls._lowercase(synonyms.get('mechanics', {}))}
+        cls.COMPLEXITY_MAPPING = {**cls.COMPLEXITY_MAPPING, **cls._lowercase(synonyms.get('complexity', {}))}
+        cls.COOPERATIVE_KEYWORDS = cls.COOPERATIVE_KEYWORDS + [
+            k.lower() for k in synonyms.get('cooperative', []) if k.lower() not in cls.COOPERATIVE_KEYWORDS
+        ]
+        cls.COMPETITIVE_KEYWORDS = cls.COMPETITIVE_KEYWORDS + [
+            k.lower() for k in synonyms.get('competitive', []) if k.lower() not in cls.COMPETITIVE_KEYWORDS
+        ]
+        
+        cls.compile_matcher()
+    
+    @staticmethod
+    def _lowercase(mapping: Dict[str, str]) -> Dict[str, str]:
+        return {key.lower(): value for key, value in mapping.items()}
+    
     @staticmethod
     def parse_preferences(user_input: str) -> UserPreferences:
         if not user_input:
@@ -47,26 +97,33 @@ class InputParser:
         user_input_lower = user_input.lower()
         
         genres = set()
-        for key, value in InputParser.GENRE_MAPPING.items():
-            if key in user_input_lower:
-                genres.add(value)
-        
         mechanics = set()
-        for key, value in InputParser.MECHANIC_MAPPING.items():
-            if key in user_input_lower:
+        complexity_match = None
+        cooperative_found = False
+        competitive_found = False
+        
+        for kind, value in InputParser._matcher.payloads(user_input_lower):
+            if kind == 'genre':
+                genres.add(value)
+            elif kind == 'mechanic':
                 mechanics.add(value)
+            elif kind == 'complexity':
+                if complexity_match is None or value < complexity_match:
+                    complexity_match = value
+            elif value:
+                cooperative_found = True
+            else:
+                competitive_found = True
         
-        complexity = None
-        for key, value in InputParser.COMPLEXITY_MAPPING.items():
-            if key in user_input_lower:
-                complexity = value
-                break
+        complexity = complexity_match[1] if complexity_match else None
         
         cooperative = None
-        if 'кооператив' in user_input_lower or 'вместе' in user_input_lower:
+        if cooperative_found:
             cooperative = True
-        elif 'конкурент' in user_input_lower or 'против' in user_input_lower:
+        elif competitive_found:
             cooperative = False
         
         return UserPreferences(genres, mechanics, complexity, cooperative)
 
+
+InputParser.compile_matcher()
@@ -0,0 +1,70 @@
+from collections import deque
+from typing import Any, Iterator, List, Tuple
+
+
+class KeywordMatcher:
+    def __init__(self):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+        self._matches = [[]]
+        self._built = True
+    
+    def __len__(self) -> int:
+        return sum(len(out) for out in self._output)
+    
+    def add(self, keyword: str, payload: Any):
+        keyword = keyword.lower()
+        if not keyword:
+            raise ValueError("Ключевое слово не может быть пустым")
+        
+        node = 0
+        for ch in keyword:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = nxt
+        self._output[node].append((keyword, payload))
+        self._built = False
+    
+    def build(self):
+        self._fail = [0] * len(self._goto)
+        outputs = [list(out) for out in self._output]
+        queue = deque(self._goto[0].values())
+        
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[child] = target if target != child else 0
+                outputs[child].extend(outputs[self._fail[child]])
+                queue.append(child)
+        
+        self._matches = outputs
+        self._built = True
+    
+    def find_all(self, text: str) -> Iterator[Tuple[int, str, Any]]:
+        if not self._built:
+            self.build()
+        
+        goto = self._goto
+        fail = self._fail
+        matches = self._matches
+        node = 0
+        
+        for pos, ch in enumerate(text):
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for keyword, payload in matches[node]:
+                yield pos - len(keyword) + 1, keyword, payload
+    
+    def payloads(self, text: str) -> List[Any]:
+        return [payload for _, _, payload in self.find_all(text)]
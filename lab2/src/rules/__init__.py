@@ -0,0 +1,17 @@
+from .terms import Var, Literal, Rule
+from .prolog_parser import PrologSyntaxError, parse_program
+from .compiler import compile_program
+from .datalog import Relation, DatalogProgram
+from .rule_kb import RuleKnowledgeBase
+
+__all__ = [
+    'Var',
+    'Literal',
+    'Rule',
+    'PrologSyntaxError',
+    'parse_program',
+    'compile_program',
+    'Relation',
+    'DatalogProgram',
+    'RuleKnowledgeBase',
+]
@@ -0,0 +1,159 @@
+from itertools import product
+from typing import Dict, List, Optional, Tuple
+
+from .prolog_parser import CUT, PrologSyntaxError
+from .terms import Literal, Rule, Var
+
+DOMAIN = '$dom'
+
+
+class RuleCompiler:
+    def __init__(self):
+        self.facts = []
+        self.rules = []
+        self._aux_count = 0
+    
+    def compile(self, clauses: List[Tuple[Literal, Optional[tuple]]]) -> Tuple[List[Literal], List[Rule]]:
+        groups = {}
+        for head, body in clauses:
+            groups.setdefault(head.key, []).append((head, body))
+        
+        for group in groups.values():
+            if any(body is not None and self._has_cut(body) for _, body in group):
+                self._compile_cut_group(group)
+                continue
+            for head, body in group:
+                if body is None and not head.variables():
+                    self.facts.append(head)
+                else:
+                    self._emit(head, body)
+        
+        return self.facts, self.rules
+    
+    def _aux_name(self, prefix: str, base: str) -> str:
+        self._aux_count += 1
+        return f'${prefix}_{base}_{self._aux_count}'
+    
+    def _has_cut(self, expr: tuple) -> bool:
+        if expr == CUT:
+            return True
+        if expr[0] in ('and', 'or'):
+            return any(self._has_cut(item) for item in expr[1])
+        if expr[0] == 'not':
+            return self._has_cut(expr[1])
+        return False
+    
+    def _compile_cut_group(self, group: List[Tuple[Literal, Optional[tuple]]]):
+        heads = [head for head, _ in group]
+        arity = len(heads[0].args)
+        inputs = [i for i in range(arity) if all(isinstance(h.args[i], Var) for h in heads)]
+        guards = []
+        
+        for head, body in group:
+            items = self._top_level_items(body)
+            keys = tuple(head.args[i] for i in inputs)
+            previous = [Literal(name, keys, negated=True) for name in guards]
+            
+            if CUT in items:
+                cut_at = items.index(CUT)
+                prefix, suffix = items[:cut_at], items[cut_at + 1:]
+                if any(self._has_cut(item) for item in prefix + suffix):
+                    raise PrologSyntaxError(f"Несколько отсечений в правиле {head.predicate} не поддерживаются")
+                guard = self._aux_name('guard', head.predicate)
+                self._emit(Literal(guard, keys), self._conjoin(prefix))
+                guards.append(guard)
+                items = prefix + suffix
+            elif any(self._has_cut(item) for item in items):
+                raise PrologSyntaxError(f"Отсечение внутри выражения в правиле {head.predicate} не поддерживается")
+            
+            self._emit(head, self._conjoin(items + [('atom', lit) for lit in previous]))
+    
+    @staticmethod
+    def _top_level_items(body: Optional[tuple]) -> List[tuple]:
+        if body is None:
+            return []
+        if body[0] == 'and':
+            return list(body[1])
+        return [body]
+    
+    @staticmethod
+    def _conjoin(items: List[tuple]) -> Optional[tuple]:
+        if not items:
+            return None
+        return items[0] if len(items) == 1 else ('and', items)
+    
+    def _emit(self, head: Literal, body: Optional[tuple]):
+        conjunctions = self._dnf(body) if body is not None else [[]]
+        for literals in conjunctions:
+            self.rules.append(self._make_safe(head, literals))
+    
+    def _dnf(self, expr: tuple) -> List[List[Literal]]:
+        kind = expr[0]
+        if kind == 'atom':
+            return [[expr[1]]]
+        if kind == 'or':
+            return [conj for branch in expr[1] for conj in self._dnf(branch)]
+        if kind == 'and':
+            parts = [self._dnf(item) for item in expr[1]]
+            return [[lit for conj in combo for lit in conj] for combo in product(*parts)]
+        if kind == 'not':
+            inner = expr[1]
+            if inner[0] == 'atom':
+                return [[inner[1].negate()]]
+            if self._has_cut(inner):
+                raise PrologSyntaxError("Отсечение внутри отрицания не поддерживается")
+            variables = self._expr_variables(inner)
+            aux = Literal(self._aux_name('not', 'expr'), variables)
+            self._emit(aux, inner)
+            return [[aux.negate()]]
+        if expr == CUT:
+            raise PrologSyntaxError("Отсечение допускается только на верхнем уровне тела правила")
+        raise PrologSyntaxError(f"Неизвестная конструкция: {expr!r}")
+    
+    def _expr_variables(self, expr: tuple) -> Tuple[Var, ...]:
+        seen = {}
+        stack = [expr]
+        while stack:
+            node = stack.pop()
+            if node[0] == 'atom':
+                for var in node[1].variables():
+                    if not var.name.startswith('_#'):
+                        seen.setdefault(var, None)
+            elif node[0] in ('and', 'or'):
+                stack.extend(reversed(node[1]))
+            elif node[0] == 'not':
+                stack.append(node[1])
+        return tuple(seen)
+    
+    def _make_safe(self, head: Literal, literals: List[Literal]) -> Rule:
+        positive = [lit for lit in literals if not lit.negated]
+        negative = [lit for lit in literals if lit.negated]
+        
+        bound = {var for lit in positive for var in lit.variables()}
+        counts: Dict[Var, int] = {}
+        for lit in [head] + literals:
+            for var in set(lit.variables()):
+                counts[var] = counts.get(var, 0) + 1
+        
+        safe_negative = []
+        for lit in negative:
+            local = {var for var in lit.variables() if counts[var] == 1 and var not in bound}
+            if local:
+                shared = tuple(dict.fromkeys(var for var in lit.variables() if var not in local))
+                aux = Literal(self._aux_name('exists', lit.predicate), shared)
+                self.rules.append(self._make_safe(aux, [lit.negate()]))
+                lit = aux.negate()
+            safe_negative.append(lit)
+        
+        unbound = []
+        for lit in [head] + safe_negative:
+            for var in lit.variables():
+                if var not in bound and var not in unbound:
+                    unbound.append(var)
+        domain = [Literal(DOMAIN, (var,)) for var in unbound]
+        
+        return Rule(head, tuple(positive + domain + safe_negative))
+
+
+def compile_program(clauses: List[Tuple[Literal, Optional[tuple]]]) -> Tuple[List[Literal], List[Rule]]:
+    return RuleCompiler().compile(clauses)
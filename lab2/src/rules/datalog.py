@@ -0,0 +1,269 @@
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from .compiler import DOMAIN
+from .terms import Literal, Rule, Var
+
+RelationKey = Tuple[str, int]
+
+
+class Relation:
+    def __init__(self, arity: int, tuples: Iterable[tuple] = ()):
+        self.arity = arity
+        self.tuples = {}
+        self._indexes = {}
+        for row in tuples:
+            self.add(row)
+    
+    def __len__(self) -> int:
+        return len(self.tuples)
+    
+    def __iter__(self) -> Iterator[tuple]:
+        return iter(self.tuples)
+    
+    def __contains__(self, row: tuple) -> bool:
+        return row in self.tuples
+    
+    def add(self, row: tuple) -> bool:
+        if row in self.tuples:
+            return False
+        self.tuples[row] = None
+        for positions, index in self._indexes.items():
+            index.setdefault(tuple(row[i] for i in positions), []).append(row)
+        return True
+    
+    def update(self, rows: Iterable[tuple]) -> List[tuple]:
+        return [row for row in rows if self.add(row)]
+    
+    def lookup(self, positions: Tuple[int, ...], key: tuple) -> Iterable[tuple]:
+        if not positions:
+            return self.tuples
+        if len(positions) == self.arity:
+            return (key,) if key in self.tuples else ()
+        index = self._indexes.get(positions)
+        if index is None:
+            index = {}
+            for row in self.tuples:
+                index.setdefault(tuple(row[i] for i in positions), []).append(row)
+            self._indexes[positions] = index
+        return index.get(key, ())
+    
+    def copy(self) -> 'Relation':
+        return Relation(self.arity, self.tuples)
+
+
+class _Step:
+    def __init__(self, literal: Literal, bound: set):
+        self.key = literal.key
+        self.positions = []
+        self.key_terms = []
+        self.assign = []
+        self.checks = []
+        local = {}
+        for i, arg in enumerate(literal.args):
+            if not isinstance(arg, Var):
+                self.positions.append(i)
+                self.key_terms.append((False, arg))
+            elif arg in bound:
+                self.positions.append(i)
+                self.key_terms.append((True, arg))
+            elif arg in local:
+                self.checks.append((local[arg], i))
+            else:
+                local[arg] = i
+                self.assign.append((arg, i))
+        self.positions = tuple(self.positions)
+        bound.update(local)
+    
+    def key_for(self, env: dict) -> tuple:
+        return tuple(env[term] if is_var else term for is_var, term in self.key_terms)
+
+
+class _Plan:
+    def __init__(self, rule: Rule):
+        self.rule = rule
+        self.head = rule.head
+        bound = set()
+        self.positive = [_Step(lit, bound) for lit in rule.body if not lit.negated]
+        self.negative = [lit for lit in rule.body if lit.negated]
+        missing = [var for var in rule.head.variables() if var not in bound]
+        if missing:
+            raise ValueError(f"Небезопасное правило {rule!r}: переменные {missing} не связаны")
+    
+    def solutions(self, sources: List[Relation], relations: Dict[RelationKey, Relation]) -> Iterator[tuple]:
+        negative = [(relations.get(lit.key), lit.args) for lit in self.negative]
+        head_args = self.head.args
+        positive = self.positive
+        
+        def extend(depth: int, env: dict):
+            if depth == len(positive):
+                for relation, args in negative:
+                    row = tuple(env[a] if isinstance(a, Var) else a for a in args)
+                    if relation is not None and row in relation:
+                        return
+                yield tuple(env[a] if isinstance(a, Var) else a for a in head_args)
+                return
+            step = positive[depth]
+            for row in sources[depth].lookup(step.positions, step.key_for(env)):
+                if any(row[i] != row[j] for i, j in step.checks):
+                    continue
+                child = dict(env)
+                for var, i in step.assign:
+                    child[var] = row[i]
+                yield from extend(depth + 1, child)
+        
+        yield from extend(0, {})
+
+
+class DatalogProgram:
+    def __init__(self):
+        self.facts: Dict[RelationKey, Relation] = {}
+        self.rules: List[Rule] = []
+        self.relations: Dict[RelationKey, Relation] = {}
+        self._evaluated = False
+    
+    def add_fact(self, predicate: str, *args):
+        key = (predicate, len(args))
+        if key not in self.facts:
+            self.facts[key] = Relation(len(args))
+        self.facts[key].add(tuple(args))
+        self._evaluated = False
+    
+    def add_facts(self, facts: Iterable[Literal]):
+        for fact in facts:
+            self.add_fact(fact.predicate, *fact.args)
+    
+    def add_rule(self, rule: Rule):
+        self.rules.append(rule)
+        self._evaluated = False
+    
+    def add_rules(self, rules: Iterable[Rule]):
+        for rule in rules:
+            self.add_rule(rule)
+    
+    def _domain(self) -> Relation:
+        values = {}
+        for relation in self.facts.values():
+            for row in relation:
+                for value in row:
+                    values[value] = None
+        for rule in self.rules:
+            for lit in (rule.head,) + rule.body:
+                for arg in lit.args:
+                    if not isinstance(arg, Var):
+                        values[arg] = None
+        return Relation(1, ((value,) for value in values))
+    
+    def stratify(self) -> List[List[RelationKey]]:
+        derived = {}
+        for rule in self.rules:
+            derived.setdefault(rule.head.key, [])
+        for rule in self.rules:
+            for lit in rule.body:
+                if lit.key in derived:
+                    derived[rule.head.key].append((lit.key, lit.negated))
+        
+        index = {}
+        lowlink = {}
+        on_stack = set()
+        stack = []
+        components = []
+        
+        for root in derived:
+            if root in index:
+                continue
+            work = [(root, iter(derived[root]))]
+            index[root] = lowlink[root] = len(index)
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, edges = work[-1]
+                advanced = False
+                for target, _ in edges:
+                    if target not in index:
+                        index[target] = lowlink[target] = len(index)
+                        stack.append(target)
+                        on_stack.add(target)
+                        work.append((target, iter(derived[target])))
+                        advanced = True
+                        break
+                    if target in on_stack:
+                        lowlink[node] = min(lowlink[node], index[target])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    components.append(component)
+        
+        for component in components:
+            members = set(component)
+            for key in component:
+                for target, negated in derived[key]:
+                    if negated and target in members:
+                        raise ValueError(
+                            f"Программа не стратифицируема: {key[0]}/{key[1]} зависит от отрицания {target[0]}/{target[1]}"
+                        )
+        return components
+    
+    def evaluate(self) -> Dict[RelationKey, Relation]:
+        relations = {key: relation.copy() for key, relation in self.facts.items()}
+        relations[(DOMAIN, 1)] = self._domain()
+        plans = {}
+        for rule in self.rules:
+            plans.setdefault(rule.head.key, []).append(_Plan(rule))
+            relations.setdefault(rule.head.key, Relation(len(rule.head.args)))
+        
+        for stratum in self.stratify():
+            self._evaluate_stratum(set(stratum), [plan for key in stratum for plan in plans[key]], relations)
+        
+        self.relations = relations
+        self._evaluated = True
+        return relations
+    
+    @staticmethod
+    def _evaluate_stratum(members: set, plans: List[_Plan], relations: Dict[RelationKey, Relation]):
+        empty = Relation(0)
+        
+        def full_sources(plan: _Plan) -> List[Relation]:
+            return [relations.get(step.key, empty) for step in plan.positive]
+        
+        delta = {key: [] for key in members}
+        for plan in plans:
+            delta[plan.head.key].extend(plan.solutions(full_sources(plan), relations))
+        delta = {key: relations[key].update(rows) for key, rows in delta.items()}
+        
+        while any(delta.values()):
+            delta_relations = {key: Relation(relations[key].arity, rows) for key, rows in delta.items() if rows}
+            new_rows = {key: [] for key in members}
+            for plan in plans:
+                recursive = [i for i, step in enumerate(plan.positive) if step.key in members]
+                for i in recursive:
+                    if plan.positive[i].key not in delta_relations:
+                        continue
+                    sources = full_sources(plan)
+                    sources[i] = delta_relations[plan.positive[i].key]
+                    new_rows[plan.head.key].extend(plan.solutions(sources, relations))
+            delta = {key: relations[key].update(rows) for key, rows in new_rows.items()}
+    
+    def relation(self, predicate: str, arity: int) -> Relation:
+        if not self._evaluated:
+            self.evaluate()
+        return self.relations.get((predicate, arity), Relation(arity))
+    
+    def query(self, predicate: str, *pattern) -> List[tuple]:
+        relation = self.relation(predicate, len(pattern))
+        positions = tuple(i for i, value in enumerate(pattern) if value is not None and not isinstance(value, Var))
+        key = tuple(pattern[i] for i in positions)
+        return list(relation.lookup(positions, key))
+    
+    def holds(self, predicate: str, *args) -> bool:
+        return tuple(args) in self.relation(predicate, len(args))
@@ -0,0 +1,136 @@
+from typing import List, Optional, Tuple
+import re
+
+from .terms import Literal, Term, Var
+
+TOKEN_RE = re.compile(r"""
+    (?P<skip>\s+|%[^\n]*|/\*.*?\*/)
+  | (?P<neck>:-)
+  | (?P<naf>\\\+)
+  | (?P<number>\d+(?:\.\d+)?(?![A-Za-z_]))
+  | (?P<var>[A-Z_][A-Za-z0-9_]*)
+  | (?P<atom>[a-z][A-Za-z0-9_]*)
+  | (?P<quoted>'(?:[^'\\]|\\.)*')
+  | (?P<punct>[(),;.!])
+""", re.VERBOSE | re.DOTALL)
+
+CUT = ('cut',)
+
+
+class PrologSyntaxError(ValueError):
+    pass
+
+
+def tokenize(text: str) -> List[Tuple[str, str, int]]:
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = TOKEN_RE.match(text, pos)
+        if not match:
+            line = text.count('\n', 0, pos) + 1
+            raise PrologSyntaxError(f"Неожиданный символ {text[pos]!r} в строке {line}")
+        kind = match.lastgroup
+        if kind != 'skip':
+            tokens.append((kind, match.group(), text.count('\n', 0, pos) + 1))
+        pos = match.end()
+    return tokens
+
+
+class PrologParser:
+    def __init__(self, text: str):
+        self.tokens = tokenize(text)
+        self.pos = 0
+        self._anonymous = 0
+    
+    def _peek(self) -> Optional[Tuple[str, str, int]]:
+        return self.tokens[self.pos] if self.pos < len(self.tokens) else None
+    
+    def _next(self) -> Tuple[str, str, int]:
+        token = self._peek()
+        if token is None:
+            raise PrologSyntaxError("Неожиданный конец файла")
+        self.pos += 1
+        return token
+    
+    def _expect(self, value: str):
+        _, text, line = self._next()
+        if text != value:
+            raise PrologSyntaxError(f"Ожидалось '{value}', получено '{text}' в строке {line}")
+    
+    def _accept(self, value: str) -> bool:
+        token = self._peek()
+        if token is not None and token[1] == value and token[0] in ('punct', 'neck', 'naf'):
+            self.pos += 1
+            return True
+        return False
+    
+    def parse_clauses(self) -> List[Tuple[Literal, Optional[tuple]]]:
+        clauses = []
+        while self._peek() is not None:
+            head = self._literal()
+            body = None
+            if self._accept(':-'):
+                body = self._disjunction()
+            self._expect('.')
+            clauses.append((head, body))
+        return clauses
+    
+    def _disjunction(self) -> tuple:
+        branches = [self._conjunction()]
+        while self._accept(';'):
+            branches.append(self._conjunction())
+        return branches[0] if len(branches) == 1 else ('or', branches)
+    
+    def _conjunction(self) -> tuple:
+        items = [self._unary()]
+        while self._accept(','):
+            items.append(self._unary())
+        return items[0] if len(items) == 1 else ('and', items)
+    
+    def _unary(self) -> tuple:
+        if self._accept('\\+'):
+            return ('not', self._unary())
+        if self._accept('('):
+            expr = self._disjunction()
+            self._expect(')')
+            return expr
+        if self._accept('!'):
+            return CUT
+        return ('atom', self._literal())
+    
+    def _literal(self) -> Literal:
+        kind, text, line = self._next()
+        if kind not in ('atom', 'quoted'):
+            raise PrologSyntaxError(f"Ожидался предикат, получено '{text}' в строке {line}")
+        name = self._atom_value(kind, text)
+        
+        args = []
+        if self._accept('('):
+            args.append(self._term())
+            while self._accept(','):
+                args.append(self._term())
+            self._expect(')')
+        return Literal(name, tuple(args))
+    
+    def _term(self) -> Term:
+        kind, text, line = self._next()
+        if kind == 'var':
+            if text == '_':
+                self._anonymous += 1
+                return Var(f'_#{self._anonymous}')
+            return Var(text)
+        if kind in ('atom', 'quoted'):
+            return self._atom_value(kind, text)
+        if kind == 'number':
+            return float(text) if '.' in text else int(text)
+        raise PrologSyntaxError(f"Ожидался терм, получено '{text}' в строке {line}")
+    
+    @staticmethod
+    def _atom_value(kind: str, text: str) -> str:
+        if kind == 'quoted':
+            return re.sub(r"\\(.)", r"\1", text[1:-1])
+        return text
+
+
+def parse_program(text: str) -> List[Tuple[Literal, Optional[tuple]]]:
+    return PrologParser(text).parse_clauses()
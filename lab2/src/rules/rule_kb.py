@@ -0,0 +1,99 @@
+from typing import Dict, Iterable, List, Optional
+import os
+
+from src.knowledge_base import KnowledgeBase
+
+from .compiler import compile_program
+from .datalog import DatalogProgram
+from .prolog_parser import parse_program
+
+
+class RuleKnowledgeBase(KnowledgeBase):
+    COMPLEXITY_RULE = 'complexity'
+    COOPERATIVE_RULE = 'cooperative_or_hidden_teamplay'
+    GATEWAY_RULE = 'gateway_game'
+    DEEP_STRATEGY_RULE = 'deep_strategy'
+    
+    def __init__(self, rules_file: str, source: Optional[KnowledgeBase] = None):
+        self.rules_file = rules_file
+        self.source = source
+        
+        if not os.path.exists(rules_file):
+            raise FileNotFoundError(f"Файл правил не найден: {rules_file}")
+        with open(rules_file, encoding='utf-8') as f:
+            self._facts, self._rules = compile_program(parse_program(f.read()))
+        
+        self._program = None
+        self._source_version = None
+        self._game_rank = {}
+        self._materialize()
+    
+    @property
+    def version(self) -> int:
+        return self.source.version if self.source is not None else 0
+    
+    def _materialize(self):
+        program = DatalogProgram()
+        if self.source is None:
+            program.add_facts(self._facts)
+        else:
+            for predicate, args in self.source.iter_facts():
+                program.add_fact(predicate, *args)
+        program.add_rules(self._rules)
+        program.evaluate()
+        
+        self._game_rank = {row[0]: i for i, row in enumerate(program.relation('game', 1))}
+        self._source_version = self.version
+        self._program = program
+    
+    def _sync(self) -> DatalogProgram:
+        if self.source is not None and self.source.version != self._source_version:
+            self._materialize()
+        return self._program
+    
+    def rule_names(self) -> List[str]:
+        names = dict.fromkeys(rule.head.predicate for rule in self._rules)
+        return [name for name in names if not name.startswith('$')]
+    
+    def query(self, predicate: str, *pattern) -> List[tuple]:
+        return self._sync().query(predicate, *pattern)
+    
+    def holds(self, predicate: str, *args) -> bool:
+        return self._sync().holds(predicate, *args)
+    
+    def _games(self, names: Iterable[str]) -> List[str]:
+        rank = self._game_rank
+        return sorted({name for name in names if name in rank}, key=rank.__getitem__)
+    
+    def query_rule(self, name: str) -> List[str]:
+        return self._games(row[0] for row in self.query(name, None))
+    
+    def query_games_by_genre(self, genre: str) -> List[str]:
+        return self._games(row[0] for row in self.query('has_genre', None, genre))
+    
+    def query_games_by_mechanic(self, mechanic: str) -> List[str]:
+        return self._games(row[0] for row in self.query('has_mechanic', None, mechanic))
+    
+    def query_games_by_designer(self, designer: str) -> List[str]:
+        return self._games(row[0] for row in self.query('designer_of', None, designer))
+    
+    def query_games_by_complexity(self, complexity: str) -> List[str]:
+        return self._games(row[0] for row in self.query(self.COMPLEXITY_RULE, None, complexity))
+    
+    def query_cooperative_games(self) -> List[str]:
+        return self.query_rule(self.COOPERATIVE_RULE)
+    
+    def query_gateway_games(self) -> List[str]:
+        return self.query_rule(self.GATEWAY_RULE)
+    
+    def query_deep_strategy_games(self) -> List[str]:
+        return self.query_rule(self.DEEP_STRATEGY_RULE)
+    
+    def get_game_info(self, game: str) -> Dict[str, any]:
+        complexity = self.query(self.COMPLEXITY_RULE, game, None)
+        return {
+            'name': game,
+            'genres': [row[1] for row in self.query('has_genre', game, None)],
+            'mechanics': [row[1] for row in self.query('has_mechanic', game, None)],
+            'complexity': complexity[0][1] if complexity else 'medium'
+        }
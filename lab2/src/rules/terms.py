@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import Tuple, Union
+
+
+@dataclass(frozen=True)
+class Var:
+    name: str
+    
+    def __repr__(self) -> str:
+        return self.name
+
+
+Term = Union[Var, str, int, float]
+
+
+@dataclass(frozen=True)
+class Literal:
+    predicate: str
+    args: Tuple[Term, ...]
+    negated: bool = False
+    
+    @property
+    def key(self) -> Tuple[str, int]:
+        return self.predicate, len(self.args)
+    
+    def variables(self) -> Tuple[Var, ...]:
+        return tuple(arg for arg in self.args if isinstance(arg, Var))
+    
+    def negate(self) -> 'Literal':
+        return Literal(self.predicate, self.args, not self.negated)
+    
+    def __repr__(self) -> str:
+        text = f"{self.predicate}({', '.join(map(repr, self.args))})" if self.args else self.predicate
+        return f"\\+ {text}" if self.negated else text
+
+
+@dataclass(frozen=True)
+class Rule:
+    head: Literal
+    body: Tuple[Literal, ...] = ()
+    
+    def __repr__(self) -> str:
+        if not self.body:
+            return f"{self.head!r}."
+        return f"{self.head!r} :- {', '.join(map(repr, self.body))}."
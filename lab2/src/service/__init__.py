@@ -0,0 +1,5 @@
+from .pipeline import RecommendationPipeline
+from .batch import run_batch
+from .server import RecommendationServer, serve
+
+__all__ = ['RecommendationPipeline', 'run_batch', 'RecommendationServer', 'serve']
@@ -0,0 +1,50 @@
+from typing import IO, Iterator, List, Tuple
+import json
+
+from .pipeline import RecommendationPipeline
+
+
+def _decode_lines(lines: IO[str]) -> Iterator[Tuple[int, object]]:
+    for line_no, line in enumerate(lines, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_no, json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, ValueError(f"Некорректный JSON в строке {line_no}: {e.msg}")
+
+
+def _write(output: IO[str], response: dict):
+    output.write(json.dumps(response, ensure_ascii=False))
+    output.write('\n')
+
+
+def run_batch(pipeline: RecommendationPipeline, lines: IO[str], output: IO[str], batch_size: int = 1024) -> int:
+    if batch_size <= 0:
+        raise ValueError("Размер пакета должен быть положительным")
+    
+    processed = 0
+    chunk: List[Tuple[int, object]] = []
+    
+    def flush():
+        requests = [request for _, request in chunk if not isinstance(request, ValueError)]
+        responses = iter(pipeline.handle_many(requests))
+        for line_no, request in chunk:
+            if isinstance(request, ValueError):
+                _write(output, {'line': line_no, 'error': str(request)})
+            else:
+                _write(output, next(responses))
+        output.flush()
+        chunk.clear()
+    
+    for item in _decode_lines(lines):
+        chunk.append(item)
+        processed += 1
+        if len(chunk) >= batch_size:
+            flush()
+    
+    if chunk:
+        flush()
+    
+    return processed
@@ -0,0 +1,132 @@
+from typing import Any, Dict, List, Optional
+
+from src.engine import RecommendationEngine
+from src.models import UserPreferences
+from src.parsers import InputParser
+from src.ui import DialogueManager
+from src.validators import InputValidator
+
+
+class RecommendationPipeline:
+    DEFAULT_TOP_K = 5
+    
+    MAX_TOP_K = 100
+    
+    def __init__(self, engine: RecommendationEngine):
+        self.engine = engine
+    
+    def handle(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        return self.handle_many([request])[0]
+    
+    def handle_many(self, requests: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        responses = [None] * len(requests)
+        pending = []
+        
+        for i, request in enumerate(requests):
+            try:
+                preferences = self._prepare(request)
+            except ValueError as e:
+                responses[i] = self._error(request, str(e))
+                continue
+            pending.append((i, request, preferences))
+        
+        prefs_list = [preferences for _, _, preferences in pending]
+        candidates = self.engine.get_recommendations_batch(prefs_list)
+        top_ks = [self._top_k(request) for _, request, _ in pending]
+        ranked = self.engine.rank_batch(candidates, prefs_list, top_k=max(top_ks, default=0))
+        
+        for (i, request, preferences), games, ranking, top_k in zip(pending, candidates, ranked, top_ks):
+            response = {
+                'preferences': self._preferences_to_dict(preferences),
+                'recommendations': [
+                    {
+                        'name': game,
+                        'score': score,
+                        'genres': list(info['genres']),
+                        'mechanics': list(info['mechanics']),
+                        'complexity': info['complexity'],
+                    }
+                    for game, score, info in ranking[:top_k]
+                ],
+            }
+            if not games:
+                response['alternatives'] = self.engine.kb.query_gateway_games()[:3]
+            if 'id' in request:
+                response = {'id': request['id'], **response}
+            responses[i] = response
+        
+        return responses
+    
+    def _prepare(self, request: Dict[str, Any]) -> UserPreferences:
+        if not isinstance(request, dict):
+            raise ValueError("Запрос должен быть JSON-объектом")
+        
+        text = request.get('text')
+        if not isinstance(text, str):
+            raise ValueError("Поле 'text' обязательно и должно быть строкой")
+        
+        is_valid, error_msg = InputValidator.validate_user_input(text)
+        if not is_valid:
+            raise ValueError(error_msg)
+        
+        sanitized = InputValidator.sanitize_input(text)
+        if not InputValidator.has_meaningful_content(sanitized):
+            raise ValueError("Пожалуйста, опишите свои предпочтения подробнее")
+        
+        preferences = InputParser.parse_preferences(sanitized)
+        self._refine(preferences, request)
+        return preferences
+    
+    def _refine(self, preferences: UserPreferences, request: Dict[str, Any]):
+        if not preferences.complexity:
+            preferences.complexity = self._complexity_choice(request.get('complexity'))
+        
+        if preferences.cooperative is None:
+            preferences.cooperative = self._cooperative_choice(request.get('cooperative'))
+        
+        if not preferences.genres and not preferences.mechanics:
+            preferences.genres.add(self._genre_choice(request.get('genre')))
+    
+    @staticmethod
+    def _menu_choice(value: Any, max_val: int) -> Optional[int]:
+        if isinstance(value, bool) or not isinstance(value, (int, str)):
+            return None
+        is_valid, _, choice_num = InputValidator.validate_choice(str(value), 1, max_val)
+        return choice_num if is_valid else None
+    
+    def _complexity_choice(self, value: Any) -> Optional[str]:
+        if value in DialogueManager.COMPLEXITY_CHOICES.values():
+            return value
+        return DialogueManager.COMPLEXITY_CHOICES.get(self._menu_choice(value, 4))
+    
+    def _cooperative_choice(self, value: Any) -> Optional[bool]:
+        if isinstance(value, bool):
+            return value
+        return {1: True, 2: False}.get(self._menu_choice(value, 3))
+    
+    def _genre_choice(self, value: Any) -> str:
+        if value in DialogueManager.GENRE_CHOICES.values():
+            return value
+        return DialogueManager.GENRE_CHOICES.get(self._menu_choice(value, 4), DialogueManager.DEFAULT_GENRE)
+    
+    def _top_k(self, request: Dict[str, Any]) -> int:
+        top_k = request.get('top_k', self.DEFAULT_TOP_K)
+        if isinstance(top_k, bool) or not isinstance(top_k, int) or top_k < 1:
+            return self.DEFAULT_TOP_K
+        return min(top_k, self.MAX_TOP_K)
+    
+    @staticmethod
+    def _preferences_to_dict(preferences: UserPreferences) -> Dict[str, Any]:
+        return {
+            'genres': sorted(preferences.genres),
+            'mechanics': sorted(preferences.mechanics),
+            'complexity': preferences.complexity,
+            'cooperative': preferences.cooperative,
+        }
+    
+    @staticmethod
+    def _error(request: Any, message: str) -> Dict[str, Any]:
+        response = {'error': message}
+        if isinstance(request, dict) and 'id' in request:
+            response = {'id': request['id'], **response}
+        return response
@@ -0,0 +1,79 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+import asyncio
+import json
+
+from .pipeline import RecommendationPipeline
+
+
+class RecommendationServer:
+    def __init__(self, pipeline: RecommendationPipeline, host: str = '127.0.0.1', port: int = 8765):
+        self.pipeline = pipeline
+        self.host = host
+        self.port = port
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+    
+    async def start(self):
+        # Конвейер работает в отдельном потоке, чтобы долгий запрос не останавливал цикл событий;
+        # поток один, поэтому базе знаний и кэшу не нужна синхронизация
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._server = await asyncio.start_server(self._handle_client, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+    
+    async def serve_forever(self):
+        if self._server is None:
+            await self.start()
+        async with self._server:
+            await self._server.serve_forever()
+    
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+    
+    def _respond(self, line: bytes) -> dict:
+        try:
+            request = json.loads(line)
+        except (json.JSONDecodeError, UnicodeDecodeError) as e:
+            return {'error': f"Некорректный JSON: {e}"}
+        return self.pipeline.handle(request)
+    
+    @staticmethod
+    def _write(writer: asyncio.StreamWriter, response: dict):
+        writer.write(json.dumps(response, ensure_ascii=False).encode('utf-8') + b'\n')
+    
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except (asyncio.LimitOverrunError, ValueError):
+                    self._write(writer, {'error': "Слишком длинный запрос"})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                
+                response = await asyncio.get_running_loop().run_in_executor(self._executor, self._respond, line)
+                self._write(writer, response)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+
+def serve(pipeline: RecommendationPipeline, host: str = '127.0.0.1', port: int = 8765):
+    server = RecommendationServer(pipeline, host, port)
+    asyncio.run(server.serve_forever())
@@ -5,6 +5,14 @@ from src.validators import InputValidator
 
 
 class DialogueManager:
+    COMPLEXITY_CHOICES = {1: 'light', 2: 'medium', 3: 'heavy'}
+    
+    GENRE_CHOICES = {1: 'eurogame', 2: 'party', 3: 'cooperative', 4: 'deck_builder'}
+    
+    DEFAULT_GENRE = 'eurogame'
+    
+    DEFAULT_INPUT = "хочу популярные игры"
+    
     def __init__(self, recommendation_engine: RecommendationEngine):
         self.engine = recommendation_engine
         self.preferences = None
@@ -56,7 +64,7 @@ class DialogueManager:
             return sanitized
         
         print("Превышено количество попыток. Используем значения по умолчанию.")
-        return "хочу популярные игры"
+        return self.DEFAULT_INPUT
     
     def _refine_preferences(self):
         print("\nДавайте уточним ваши предпочтения...")
@@ -76,8 +84,7 @@ class DialogueManager:
             if not is_valid:
                 print(f"{error_msg}, пропускаем...")
             elif choice_num and choice_num <= 3:
-                complexity_map = {1: 'light', 2: 'medium', 3: 'heavy'}
-                self.preferences.complexity = complexity_map[choice_num]
+                self.preferences.complexity = self.COMPLEXITY_CHOICES[choice_num]
         
         if self.preferences.cooperative is None:
             print("\nВы предпочитаете:")
@@ -109,13 +116,12 @@ class DialogueManager:
             
             if not is_valid:
                 print(f"{error_msg}, используем популярные игры...")
-                self.preferences.genres.add('eurogame')
+                self.preferences.genres.add(self.DEFAULT_GENRE)
             elif choice_num:
-                genre_map = {1: 'eurogame', 2: 'party', 3: 'cooperative', 4: 'deck_builder'}
-                self.preferences.genres.add(genre_map[choice_num])
+                self.preferences.genres.add(self.GENRE_CHOICES[choice_num])
     
     def _display_recommendations(self, games: List[str]):
-        ranked = self.engine.rank_recommendations(games, self.preferences)
+        ranked = self.engine.rank_recommendations(games, self.preferences, top_k=5)
         
         print("Рекомендованные игры".center(60))
         print()
@@ -0,0 +1,70 @@
+import sys
+import os
+import shutil
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.knowledge_base import OWLKnowledgeBase
+from benchmarks.synthetic_owl import generate_ontology
+from benchmarks.run_benchmarks import measure, percentile
+
+
+def test_synthetic_ontology():
+    print("Тестирование генератора онтологий...")
+    
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        first = generate_ontology(os.path.join(tmp_dir, 'a.owl'), 500, genres=15, mechanics=20, seed=7)
+        second = generate_ontology(os.path.join(tmp_dir, 'b.owl'), 500, genres=15, mechanics=20, seed=7)
+        with open(first, 'rb') as a, open(second, 'rb') as b:
+            assert a.read() == b.read(), "Генерация с одним зерном должна быть детерминированной"
+        print("  ✓ Детерминированность по зерну")
+        
+        kb = OWLKnowledgeBase(first)
+        assert len(kb._state.games) == 500, f"Ожидалось 500 игр, получено {len(kb._state.games)}"
+        assert len(kb._state.genres) == 15 and len(kb._state.mechanics) == 20, "Неверное число жанров/механик"
+        
+        counts = {g: len(kb.query_games_by_genre(g)) for g in kb._state.genres}
+        assert counts['eurogame'] > counts['genre_14'], "Распределение Ципфа должно быть смещено к первым жанрам"
+        print(f"  ✓ Онтология загружается: 500 игр, eurogame={counts['eurogame']}, genre_14={counts['genre_14']}")
+    finally:
+        shutil.rmtree(tmp_dir)
+    
+    print("✅ Тест генератора онтологий пройден\n")
+
+
+def test_measure():
+    print("Тестирование измерения задержек...")
+    
+    assert percentile([1, 2, 3, 4], 50) == 2 and percentile([1, 2, 3, 4], 99) == 4, "Неверный перцентиль"
+    stats = measure(lambda x: x * 2, [(1,), (2,)], min_calls=10, time_budget=0)
+    assert stats['calls'] == 10, f"Ожидалось 10 вызовов, получено {stats['calls']}"
+    assert stats['p50_ms'] <= stats['p99_ms'], "p50 не может превышать p99"
+    print(f"  ✓ {stats['calls']} вызовов, p50={stats['p50_ms']:.4f} мс")
+    
+    print("✅ Тест измерения задержек пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование инструментов бенчмарков".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_synthetic_ontology()
+        test_measure()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ БЕНЧМАРКОВ ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
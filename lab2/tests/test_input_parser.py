@@ -0,0 +1,130 @@
+import sys
+import os
+import json
+import random
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.parsers import InputParser
+from src.parsers.keyword_matcher import KeywordMatcher
+from src.validators import InputValidator
+
+
+def _reference_parse(user_input):
+    user_input_lower = InputValidator.sanitize_input(user_input).lower()
+    
+    genres = {v for k, v in InputParser.GENRE_MAPPING.items() if k in user_input_lower}
+    mechanics = {v for k, v in InputParser.MECHANIC_MAPPING.items() if k in user_input_lower}
+    
+    complexity = None
+    for key, value in InputParser.COMPLEXITY_MAPPING.items():
+        if key in user_input_lower:
+            complexity = value
+            break
+    
+    cooperative = None
+    if any(k in user_input_lower for k in InputParser.COOPERATIVE_KEYWORDS):
+        cooperative = True
+    elif any(k in user_input_lower for k in InputParser.COMPETITIVE_KEYWORDS):
+        cooperative = False
+    
+    return genres, mechanics, complexity, cooperative
+
+
+def _as_tuple(preferences):
+    return preferences.genres, preferences.mechanics, preferences.complexity, preferences.cooperative
+
+
+def test_keyword_matcher():
+    print("Тестирование автомата Ахо-Корасик...")
+    
+    matcher = KeywordMatcher()
+    for word in ['he', 'she', 'his', 'hers']:
+        matcher.add(word, word)
+    matcher.build()
+    
+    found = sorted((start, keyword) for start, keyword, _ in matcher.find_all('ushers'))
+    assert found == [(1, 'she'), (2, 'he'), (2, 'hers')], f"Неверные совпадения: {found}"
+    print(f"  ✓ 'ushers' → {found}")
+    
+    print("✅ Тест автомата пройден\n")
+
+
+def test_parse_matches_substring_search():
+    print("Тестирование разбора предпочтений...")
+    
+    examples = [
+        "Мне нравятся кооперативные игры и евро",
+        "Хочу простые партийные игры",
+        "сложные евро с размещением рабочих и контроль территории",
+        "игры против друзей, можно с кубиками",
+        "",
+    ]
+    for text in examples:
+        assert _as_tuple(InputParser.parse_preferences(text)) == _reference_parse(text), f"Несовпадение: '{text}'"
+        print(f"  ✓ '{text}'")
+    
+    keywords = (
+        list(InputParser.GENRE_MAPPING) + list(InputParser.MECHANIC_MAPPING) +
+        list(InputParser.COMPLEXITY_MAPPING) + InputParser.COOPERATIVE_KEYWORDS +
+        InputParser.COMPETITIVE_KEYWORDS + ['игры', 'и', 'мне', 'нравятся']
+    )
+    rng = random.Random(42)
+    for _ in range(500):
+        text = ' '.join(rng.choice(keywords) for _ in range(rng.randint(1, 8)))
+        assert _as_tuple(InputParser.parse_preferences(text)) == _reference_parse(text), f"Несовпадение: '{text}'"
+    print("  ✓ 500 случайных запросов совпадают с поиском подстрок")
+    
+    print("✅ Тест разбора пройден\n")
+
+
+def test_load_synonyms():
+    print("Тестирование словаря синонимов...")
+    
+    saved = (
+        InputParser.GENRE_MAPPING, InputParser.MECHANIC_MAPPING, InputParser.COMPLEXITY_MAPPING,
+        InputParser.COOPERATIVE_KEYWORDS, InputParser.COMPETITIVE_KEYWORDS,
+    )
+    with tempfile.NamedTemporaryFile('w', suffix='.json', delete=False, encoding='utf-8') as f:
+        json.dump({'genres': {'Eurogame': 'eurogame'}, 'cooperative': ['co-op']}, f)
+        path = f.name
+    
+    try:
+        InputParser.load_synonyms(path)
+        preferences = InputParser.parse_preferences("Any Eurogame for co-op play")
+        assert preferences.genres == {'eurogame'}, f"Синоним жанра не найден: {preferences.genres}"
+        assert preferences.cooperative is True, "Синоним кооператива не найден"
+        print("  ✓ Синонимы из файла распознаются")
+    finally:
+        os.remove(path)
+        (InputParser.GENRE_MAPPING, InputParser.MECHANIC_MAPPING, InputParser.COMPLEXITY_MAPPING,
+         InputParser.COOPERATIVE_KEYWORDS, InputParser.COMPETITIVE_KEYWORDS) = saved
+        InputParser.compile_matcher()
+    
+    print("✅ Тест словаря синонимов пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование парсера ввода".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_keyword_matcher()
+        test_parse_matches_substring_search()
+        test_load_synonyms()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ ПАРСЕРА ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,400 @@
+import sys
+import os
+import re
+import shutil
+import tempfile
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.knowledge_base import OWLKnowledgeBase, CachedKnowledgeBase
+from src.knowledge_base.bitset import bits_to_mask, iter_bits
+from src.knowledge_base.state import KnowledgeState
+
+OWL_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'lab1', 'boardgames_fixed.owl')
+
+
+def _load_kb():
+    return OWLKnowledgeBase(OWL_FILE)
+
+
+def test_bitset_helpers():
+    print("Тестирование битовых множеств...")
+    
+    ids = [0, 3, 64, 65, 200]
+    mask = bits_to_mask(ids)
+    assert list(iter_bits(mask)) == ids, f"Ожидалось {ids}, получено {list(iter_bits(mask))}"
+    assert list(iter_bits(0)) == [], "Пустая маска не должна содержать битов"
+    print(f"  ✓ {ids} → маска → {list(iter_bits(mask))}")
+    
+    print("✅ Тест битовых множеств пройден\n")
+
+
+def test_index_queries_match_scan():
+    print("Тестирование индексов базы знаний...")
+    
+    kb = _load_kb()
+    
+    for genre in kb._state.genres | {'unknown_genre'}:
+        expected = [g for g, genres in kb._state.game_genres.items() if genre in genres]
+        assert kb.query_games_by_genre(genre) == expected, f"Несовпадение для жанра {genre}"
+    print("  ✓ Запросы по жанрам совпадают с полным перебором")
+    
+    for mechanic in kb._state.mechanics | {'unknown_mechanic'}:
+        expected = [g for g, mechanics in kb._state.game_mechanics.items() if mechanic in mechanics]
+        assert kb.query_games_by_mechanic(mechanic) == expected, f"Несовпадение для механики {mechanic}"
+    print("  ✓ Запросы по механикам совпадают с полным перебором")
+    
+    expected_coop = {
+        g for g in kb._state.games
+        if 'cooperative' in kb._state.game_genres[g] or 'hidden_roles' in kb._state.game_mechanics[g]
+    }
+    assert set(kb.query_cooperative_games()) == expected_coop, "Несовпадение кооперативных игр"
+    print(f"  ✓ Кооперативные игры: {sorted(expected_coop)}")
+    
+    assert 'catan' in kb.query_games_by_designer('klaus_teuber'), "catan должна быть найдена по автору"
+    print("  ✓ Поиск по автору")
+    
+    print("✅ Тест индексов пройден\n")
+
+
+def test_complexity_partition():
+    print("Тестирование индекса сложности...")
+    
+    kb = _load_kb()
+    
+    levels = {c: set(kb.query_games_by_complexity(c)) for c in ('light', 'medium', 'heavy')}
+    assert set().union(*levels.values()) == kb._state.games, "Каждая игра должна иметь сложность"
+    assert sum(len(v) for v in levels.values()) == len(kb._state.games), "Уровни сложности не должны пересекаться"
+    
+    assert kb.get_game_info('agricola')['complexity'] == 'heavy', "agricola должна быть сложной"
+    assert kb.get_game_info('dixit')['complexity'] == 'light', "dixit должна быть легкой"
+    assert kb.get_game_info('unknown_game')['complexity'] == 'medium', "Неизвестная игра - средняя"
+    print(f"  ✓ light={len(levels['light'])}, medium={len(levels['medium'])}, heavy={len(levels['heavy'])}")
+    
+    print("✅ Тест индекса сложности пройден\n")
+
+
+def test_mask_combinations():
+    print("Тестирование комбинаций масок...")
+    
+    kb = _load_kb()
+    
+    mask = kb.genre_mask('eurogame') & ~kb.mechanic_mask('worker_placement')
+    expected = [
+        g for g in kb.query_games_by_genre('eurogame')
+        if 'worker_placement' not in kb._state.game_mechanics[g]
+    ]
+    assert kb.games_from_mask(mask) == expected, "Ошибка комбинации И/НЕ"
+    print(f"  ✓ eurogame И НЕ worker_placement: {expected}")
+    
+    assert kb.games_from_mask(~0) == kb.games_from_mask(kb.all_games_mask()), "НЕ должно ограничиваться играми"
+    print("  ✓ Отрицание ограничено множеством игр")
+    
+    print("✅ Тест комбинаций масок пройден\n")
+
+
+def test_snapshot_roundtrip():
+    print("Тестирование снимка онтологии...")
+    
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        owl_copy = os.path.join(tmp_dir, 'boardgames.owl')
+        snapshot_file = os.path.join(tmp_dir, 'cache', 'boardgames.snapshot')
+        shutil.copy(OWL_FILE, owl_copy)
+        
+        cold = OWLKnowledgeBase(owl_copy, snapshot_file=snapshot_file)
+        assert os.path.exists(snapshot_file), "Снимок должен быть создан при холодном старте"
+        print("  ✓ Снимок создан")
+        
+        warm = OWLKnowledgeBase(owl_copy, snapshot_file=snapshot_file)
+        assert warm._state.game_names == cold._state.game_names, "Порядок игр должен сохраняться"
+        assert warm._state.game_genres == cold._state.game_genres, "Жанры должны совпадать"
+        assert warm.query_gateway_games() == cold.query_gateway_games(), "Запросы должны совпадать"
+        print("  ✓ Теплый старт совпадает с разбором XML")
+        
+        os.utime(owl_copy, ns=(0, 0))
+        touched = OWLKnowledgeBase(owl_copy, snapshot_file=snapshot_file)
+        assert touched._state.game_names == cold._state.game_names, "Снимок должен переживать изменение mtime"
+        print("  ✓ Изменение mtime без изменения содержимого")
+        
+        with open(owl_copy, 'a', encoding='utf-8') as f:
+            f.write('\n')
+        with open(snapshot_file, 'rb') as f:
+            old_header = f.read(64)
+        OWLKnowledgeBase(owl_copy, snapshot_file=snapshot_file)
+        with open(snapshot_file, 'rb') as f:
+            assert f.read(64) != old_header, "Снимок должен пересоздаваться при изменении файла"
+        print("  ✓ Изменение файла инвалидирует снимок")
+    finally:
+        shutil.rmtree(tmp_dir)
+    
+    print("✅ Тест снимка пройден\n")
+
+
+def _individual_xml(name, genres=(), mechanics=()):
+    ns = 'http://example.org/boardgames#'
+    lines = [f'    <owl:NamedIndividual rdf:about="{ns}{name}">',
+             f'        <rdf:type rdf:resource="{ns}Game"/>']
+    lines += [f'        <hasGenre rdf:resource="{ns}{g}"/>' for g in genres]
+    lines += [f'        <hasMechanic rdf:resource="{ns}{m}"/>' for m in mechanics]
+    lines.append('    </owl:NamedIndividual>')
+    return '\n'.join(lines) + '\n'
+
+
+def _assert_same_answers(kb, reference):
+    for genre in reference._state.genres | {'party', 'eurogame'}:
+        assert kb.query_games_by_genre(genre) == reference.query_games_by_genre(genre), f"Жанр {genre}"
+    for mechanic in reference._state.mechanics | {'tile_placement', 'worker_placement'}:
+        assert kb.query_games_by_mechanic(mechanic) == reference.query_games_by_mechanic(mechanic), \
+            f"Механика {mechanic}"
+    for complexity in ('light', 'medium', 'heavy'):
+        assert kb.query_games_by_complexity(complexity) == reference.query_games_by_complexity(complexity), \
+            f"Сложность {complexity}"
+    assert kb.query_cooperative_games() == reference.query_cooperative_games(), "Кооперативные игры"
+    assert kb.query_gateway_games() == reference.query_gateway_games(), "Gateway игры"
+    assert kb.query_deep_strategy_games() == reference.query_deep_strategy_games(), "Стратегические игры"
+    for game in reference._state.game_names:
+        assert kb.get_game_info(game) == reference.get_game_info(game), f"Информация об игре {game}"
+
+
+def test_incremental_reload():
+    print("Тестирование инкрементальной перезагрузки...")
+    
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        owl_copy = os.path.join(tmp_dir, 'boardgames.owl')
+        snapshot_file = os.path.join(tmp_dir, 'boardgames.snapshot')
+        shutil.copy(OWL_FILE, owl_copy)
+        
+        kb = OWLKnowledgeBase(owl_copy, snapshot_file=snapshot_file)
+        assert kb.reload() == 0 and kb.version == 0, "Неизменённый файл не должен менять версию"
+        
+        with open(owl_copy, encoding='utf-8') as f:
+            text = f.read()
+        text = re.sub(r'\s*<owl:NamedIndividual rdf:about="[^"]*#agricola">.*?</owl:NamedIndividual>',
+                      '\n' + _individual_xml('agricola', ['eurogame', 'party'], ['tile_placement']),
+                      text, flags=re.DOTALL)
+        text = re.sub(r'\s*<owl:NamedIndividual rdf:about="[^"]*#dixit">.*?</owl:NamedIndividual>', '',
+                      text, flags=re.DOTALL)
+        text = text.replace('</rdf:RDF>', _individual_xml('brass', ['eurogame'], ['area_control']) + '</rdf:RDF>')
+        with open(owl_copy, 'w', encoding='utf-8') as f:
+            f.write(text)
+        
+        changed = kb.reload()
+        assert changed == 3, f"Ожидалось 3 изменённых индивида, получено {changed}"
+        assert kb.version == 1, "Версия должна увеличиться после изменений"
+        reference = OWLKnowledgeBase(owl_copy)
+        _assert_same_answers(kb, reference)
+        assert kb.get_game_info('agricola')['complexity'] == 'light', "agricola должна стать лёгкой"
+        assert 'dixit' not in kb.query_games_by_complexity('light'), "Удалённая игра не должна возвращаться"
+        print(f"  ✓ Изменено {changed} индивида, ответы совпадают с полной перезагрузкой")
+        
+        warm = OWLKnowledgeBase(owl_copy, snapshot_file=snapshot_file)
+        _assert_same_answers(warm, reference)
+        print("  ✓ Снимок обновлён после перезагрузки")
+    finally:
+        shutil.rmtree(tmp_dir)
+    
+    print("✅ Тест инкрементальной перезагрузки пройден\n")
+
+
+def test_change_file():
+    print("Тестирование файла изменений...")
+    
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        change_file = os.path.join(tmp_dir, 'changes.jsonl')
+        kb = _load_kb()
+        
+        with open(change_file, 'w', encoding='utf-8') as f:
+            f.write('{"name": "brass", "hasGenre": ["eurogame"], "hasMechanic": ["tile_placement"]}\n')
+            f.write('{"name": "coup", "op": "delete"}\n')
+            f.write('{"name": "catan", "hasGenre": ["eurogame"], "hasMechanic": ["worker_placement"]')
+        
+        assert kb.apply_change_file(change_file) == 2, "Неполная строка не должна применяться"
+        assert 'brass' in kb.query_gateway_games(), "Новая игра должна попасть в индекс"
+        assert 'coup' not in kb.query_cooperative_games(), "Удалённая игра должна исчезнуть"
+        assert kb.get_game_info('catan')['complexity'] == 'medium'
+        
+        with open(change_file, 'a', encoding='utf-8') as f:
+            f.write('}\n{"name": "brass", "op": "delete"}\n')
+        assert kb.apply_change_file(change_file) == 2, "Должны применяться только новые записи"
+        assert kb.get_game_info('catan')['complexity'] == 'heavy', "catan должна стать тяжёлой"
+        assert 'brass' not in kb.query_gateway_games(), "brass должна быть удалена"
+        assert kb.version == 2, f"Ожидалась версия 2, получена {kb.version}"
+        
+        with open(change_file, 'a', encoding='utf-8') as f:
+            f.write('{"name": "azul", "hasGenre": "abstract", "hasMechanic": "set_collection"}\n')
+        kb.apply_change_file(change_file)
+        info = kb.get_game_info('azul')
+        assert info['genres'] == ['abstract'] and info['mechanics'] == ['set_collection'], \
+            f"Строка должна стать списком из одного значения: {info}"
+        with open(change_file, 'a', encoding='utf-8') as f:
+            f.write('{"name": "azul", "hasGenre": 5}\n')
+        try:
+            kb.apply_change_file(change_file)
+            assert False, "Нестроковое значение должно отклоняться"
+        except ValueError:
+            pass
+        print("  ✓ Строковые значения полей и отказ для прочих типов")
+        
+        rebuilt = KnowledgeState()
+        rebuilt.import_facts(kb._state.export_facts())
+        rebuilt.build_indexes()
+        for complexity in ('light', 'medium', 'heavy'):
+            expected = [rebuilt.game_names[i] for i in iter_bits(rebuilt.complexity_index[complexity])]
+            assert kb.query_games_by_complexity(complexity) == expected, f"Сложность {complexity}"
+        print("  ✓ Дельты из файла совпадают с полной перестройкой индексов")
+    finally:
+        shutil.rmtree(tmp_dir)
+    
+    print("✅ Тест файла изменений пройден\n")
+
+
+def test_readers_during_updates():
+    print("Тестирование чтения во время обновлений...")
+    
+    kb = _load_kb()
+    errors = []
+    stop = threading.Event()
+    
+    def reader():
+        while not stop.is_set():
+            try:
+                games = kb.query_games_by_genre('eurogame')
+                assert len(games) == len(set(games)), "Дубликаты в ответе"
+                for game in games:
+                    kb.get_game_info(game)
+            except Exception as e:
+                errors.append(e)
+                return
+    
+    threads = [threading.Thread(target=reader) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for i in range(200):
+        name = f'game_{i % 20}'
+        if i % 3 == 2:
+            kb.apply_delta(removals=[name])
+        else:
+            kb.apply_delta([(name, ['Game'], {'hasGenre': ['eurogame'], 'hasMechanic': [], 'designedBy': []})])
+    stop.set()
+    for thread in threads:
+        thread.join()
+    
+    assert not errors, f"Ошибки чтения: {errors[:1]}"
+    assert kb.version == 200, f"Ожидалась версия 200, получена {kb.version}"
+    print("  ✓ 200 атомарных обновлений без ошибок у читателей")
+    
+    print("✅ Тест чтения во время обновлений пройден\n")
+
+
+def test_state_versions_are_isolated():
+    print("Тестирование версий состояния...")
+    
+    base = _load_kb()._state
+    before = base.export_facts()
+    brass = ('brass', ['Game'], {'hasGenre': ['eurogame'], 'hasMechanic': ['tile_placement'], 'designedBy': []})
+    state = base
+    for i in range(100):
+        removed = before['games'][i % len(before['games'])]
+        state = state.apply_delta([brass], [removed])[0]
+        party = (removed, ['Game'], {'hasGenre': ['party'], 'hasMechanic': [], 'designedBy': []})
+        state = state.apply_delta([party])[0]
+    
+    assert base.export_facts() == before, "Исходная версия не должна меняться"
+    assert 'brass' not in base.games and 'brass' in state.games, "Новая игра видна только в новой версии"
+    rebuilt = KnowledgeState()
+    rebuilt.import_facts(state.export_facts())
+    rebuilt.build_indexes()
+    for genre in rebuilt.genre_index:
+        expected = {rebuilt.game_names[i] for i in iter_bits(rebuilt.genre_index[genre])}
+        actual = {state.game_names[i] for i in iter_bits(state.genre_index[genre])}
+        assert actual == expected, f"Индекс жанра {genre} расходится с полной перестройкой"
+    print(f"  ✓ {state.version} версий делят данные, исходная не изменилась")
+    
+    print("✅ Тест версий состояния пройден\n")
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def test_cached_knowledge_base():
+    print("Тестирование кэширующей базы знаний...")
+    
+    backend = _load_kb()
+    clock = FakeClock()
+    kb = CachedKnowledgeBase(backend, maxsize=2, ttl=10, clock=clock)
+    
+    assert kb.query_games_by_genre('eurogame') == backend.query_games_by_genre('eurogame'), "Результат должен совпадать"
+    kb.query_games_by_genre('eurogame').append('mutated')
+    assert kb.query_games_by_genre('eurogame') == backend.query_games_by_genre('eurogame'), "Кэш не должен изменяться извне"
+    info = kb.cache_info()
+    assert (info.hits, info.misses) == (2, 1), f"Ожидалось 2 попадания и 1 промах, получено {info}"
+    print(f"  ✓ Попадания и промахи: {info.hits}/{info.misses}")
+    
+    kb.query_gateway_games()
+    kb.query_cooperative_games()
+    assert kb.cache_info().evictions == 1, "Самая старая запись должна быть вытеснена"
+    kb.query_games_by_genre('eurogame')
+    assert kb.cache_info().misses == 4, "Вытесненная запись должна вычисляться заново"
+    print("  ✓ Вытеснение LRU")
+    
+    clock.now = 11
+    kb.query_games_by_genre('eurogame')
+    assert kb.cache_info().misses == 5, "Устаревшая запись должна вычисляться заново"
+    print("  ✓ Истечение TTL")
+    
+    backend.reload()
+    kb.query_games_by_genre('eurogame')
+    assert kb.cache_info().misses == 5, "Перезагрузка неизменённого файла не должна очищать кэш"
+    
+    backend.apply_delta([('new_euro', ['Game'], {'hasGenre': ['eurogame'], 'hasMechanic': [], 'designedBy': []})])
+    assert kb.cache_info().currsize > 0
+    assert 'new_euro' in kb.query_games_by_genre('eurogame'), "Изменение источника должно быть видно"
+    info = kb.cache_info()
+    assert info.misses == 6 and info.currsize == 1, "Перезагрузка источника должна очищать кэш"
+    print("  ✓ Инвалидация при перезагрузке онтологии")
+    
+    assert kb.genre_mask('eurogame') == backend.genre_mask('eurogame'), "Прочие методы должны делегироваться"
+    print("  ✓ Делегирование методов источника")
+    
+    print("✅ Тест кэширующей базы знаний пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование базы знаний".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_bitset_helpers()
+        test_index_queries_match_scan()
+        test_complexity_partition()
+        test_mask_combinations()
+        test_snapshot_roundtrip()
+        test_incremental_reload()
+        test_change_file()
+        test_readers_during_updates()
+        test_state_versions_are_isolated()
+        test_cached_knowledge_base()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ БАЗЫ ЗНАНИЙ ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
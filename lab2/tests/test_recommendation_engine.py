@@ -0,0 +1,137 @@
+import sys
+import os
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.knowledge_base import OWLKnowledgeBase
+from src.engine import RecommendationEngine
+from src.models import UserPreferences
+
+OWL_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'lab1', 'boardgames_fixed.owl')
+
+
+class CountingKnowledgeBase(OWLKnowledgeBase):
+    def __init__(self, owl_file: str):
+        super().__init__(owl_file)
+        self.calls = Counter()
+    
+    def query_games_by_genre(self, genre):
+        self.calls['genre', genre] += 1
+        return super().query_games_by_genre(genre)
+    
+    def query_games_by_mechanic(self, mechanic):
+        self.calls['mechanic', mechanic] += 1
+        return super().query_games_by_mechanic(mechanic)
+    
+    def query_games_by_complexity(self, complexity):
+        self.calls['complexity', complexity] += 1
+        return super().query_games_by_complexity(complexity)
+    
+    def query_cooperative_games(self):
+        self.calls['cooperative'] += 1
+        return super().query_cooperative_games()
+
+
+class ScanKnowledgeBase(OWLKnowledgeBase):
+    def incidence_index(self):
+        return None
+
+
+def _sample_preferences():
+    return [
+        UserPreferences({'eurogame'}, set(), 'heavy', None),
+        UserPreferences({'eurogame', 'party'}, {'drafting'}, None, True),
+        UserPreferences(set(), set(), 'light', None),
+        UserPreferences({'eurogame'}, set(), 'heavy', None),
+        UserPreferences(set(), {'worker_placement'}, 'medium', False),
+        UserPreferences(set(), set(), None, None),
+    ]
+
+
+def test_batch_matches_single():
+    print("Тестирование пакетных рекомендаций...")
+    
+    engine = RecommendationEngine(OWLKnowledgeBase(OWL_FILE))
+    prefs_list = _sample_preferences()
+    
+    batch = engine.get_recommendations_batch(prefs_list)
+    assert len(batch) == len(prefs_list), "Количество ответов должно совпадать с количеством запросов"
+    
+    for preferences, games in zip(prefs_list, batch):
+        single = engine.get_recommendations(preferences)
+        assert set(games) == set(single), f"Несовпадение для {preferences}"
+        print(f"  ✓ {sorted(preferences.genres)}, {preferences.complexity} → {len(games)} игр")
+    
+    ranked_batch = engine.rank_batch(batch, prefs_list)
+    for games, preferences, ranked in zip(batch, prefs_list, ranked_batch):
+        assert ranked == engine.rank_recommendations(games, preferences), "Несовпадение ранжирования"
+    print("  ✓ Пакетное ранжирование совпадает с одиночным")
+    
+    print("✅ Тест пакетных рекомендаций пройден\n")
+
+
+def test_batch_deduplicates_queries():
+    print("Тестирование дедупликации запросов...")
+    
+    kb = CountingKnowledgeBase(OWL_FILE)
+    engine = RecommendationEngine(kb)
+    
+    engine.get_recommendations_batch(_sample_preferences() * 50)
+    
+    for key, count in kb.calls.items():
+        assert count == 1, f"Запрос {key} выполнен {count} раз"
+    print(f"  ✓ {len(kb.calls)} различных запросов выполнено по одному разу")
+    
+    print("✅ Тест дедупликации пройден\n")
+
+
+def test_vectorized_ranking_matches_scan():
+    print("Тестирование векторного ранжирования...")
+    
+    fast = RecommendationEngine(OWLKnowledgeBase(OWL_FILE))
+    slow = RecommendationEngine(ScanKnowledgeBase(OWL_FILE))
+    games = fast.kb._state.game_names[::-1]
+    
+    for preferences in _sample_preferences():
+        expected = slow.rank_recommendations(games, preferences)
+        assert fast.rank_recommendations(games, preferences) == expected, "Полное ранжирование отличается"
+        
+        for k in (1, 3, 5, len(games) + 1):
+            assert fast.rank_recommendations(games, preferences, top_k=k) == expected[:k], \
+                f"top-{k} отличается для {preferences}"
+            assert slow.rank_recommendations(games, preferences, top_k=k) == expected[:k], \
+                f"top-{k} без numpy отличается для {preferences}"
+        print(f"  ✓ {sorted(preferences.genres)}, {sorted(preferences.mechanics)}, {preferences.complexity}")
+    
+    assert fast.rank_recommendations(games + ['unknown_game'], _sample_preferences()[0], top_k=3) == \
+        slow.rank_recommendations(games + ['unknown_game'], _sample_preferences()[0], top_k=3), \
+        "Неизвестные игры должны ранжироваться как раньше"
+    print("  ✓ Неизвестные игры")
+    
+    print("✅ Тест векторного ранжирования пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование рекомендательного движка".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_batch_matches_single()
+        test_batch_deduplicates_queries()
+        test_vectorized_ranking_matches_scan()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ ДВИЖКА ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,129 @@
+import sys
+import os
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.knowledge_base import OWLKnowledgeBase
+from src.rules import DatalogProgram, PrologSyntaxError, RuleKnowledgeBase, compile_program, parse_program
+
+LAB1_DIR = os.path.join(os.path.dirname(__file__), '..', '..', 'lab1')
+OWL_FILE = os.path.join(LAB1_DIR, 'boardgames_fixed.owl')
+RULES_FILE = os.path.join(LAB1_DIR, 'boardgames.pl')
+
+
+def _program(text):
+    facts, rules = compile_program(parse_program(text))
+    program = DatalogProgram()
+    program.add_facts(facts)
+    program.add_rules(rules)
+    return program
+
+
+def test_prolog_rules():
+    print("Тестирование правил из boardgames.pl...")
+    
+    kb = RuleKnowledgeBase(RULES_FILE)
+    
+    assert kb.query_rule('modern_classic') == ['catan', 'pandemic'], "Неверная современная классика"
+    assert kb.query_rule('euro_worker_placement') == ['agricola'], "Неверное правило euro_worker_placement"
+    assert kb.query_rule('deck_builder_game') == ['dominion'], "Неверное правило deck_builder_game"
+    assert kb.query_gateway_games() == ['carcassonne'], "Неверные gateway игры"
+    print("  ✓ modern_classic, euro_worker_placement, deck_builder_game, gateway_game")
+    
+    assert kb.get_game_info('dixit')['complexity'] == 'light', "dixit должна быть лёгкой"
+    assert kb.get_game_info('agricola')['complexity'] == 'heavy', "agricola должна быть тяжёлой"
+    assert kb.get_game_info('catan')['complexity'] == 'medium', "catan должна быть средней"
+    assert not kb.holds('complexity', 'agricola', 'medium'), "Отсечение должно исключать medium для agricola"
+    print("  ✓ Отсечения в complexity/2 дают ровно одну сложность")
+    
+    print("✅ Тест правил пройден\n")
+
+
+def test_rules_match_owl_knowledge_base():
+    print("Тестирование правил поверх OWL фактов...")
+    
+    owl = OWLKnowledgeBase(OWL_FILE)
+    kb = RuleKnowledgeBase(RULES_FILE, source=owl)
+    
+    assert kb.query_cooperative_games() == owl.query_cooperative_games(), "Несовпадение кооперативных игр"
+    assert kb.query_gateway_games() == owl.query_gateway_games(), "Несовпадение gateway игр"
+    assert kb.query_deep_strategy_games() == owl.query_deep_strategy_games(), "Несовпадение стратегий"
+    for complexity in ('light', 'medium', 'heavy'):
+        assert kb.query_games_by_complexity(complexity) == owl.query_games_by_complexity(complexity), \
+            f"Несовпадение сложности {complexity}"
+    for genre in owl._state.genres:
+        assert kb.query_games_by_genre(genre) == owl.query_games_by_genre(genre), f"Несовпадение жанра {genre}"
+    for game in owl._state.game_names:
+        assert kb.get_game_info(game) == owl.get_game_info(game), f"Несовпадение информации об игре {game}"
+    print(f"  ✓ {len(owl._state.game_names)} игр: результаты совпадают с OWLKnowledgeBase")
+    
+    print("✅ Тест правил поверх OWL пройден\n")
+
+
+def test_semi_naive_recursion():
+    print("Тестирование рекурсивных правил...")
+    
+    program = _program("""
+        edge(a, b). edge(b, c). edge(c, d). edge(d, b).
+        path(X, Y) :- edge(X, Y).
+        path(X, Z) :- path(X, Y), edge(Y, Z).
+        unreachable(X, Y) :- node(X), node(Y), \\+ path(X, Y).
+        node(X) :- edge(X, _).
+        node(Y) :- edge(_, Y).
+    """)
+    
+    paths = set(program.query('path', None, None))
+    expected = {('a', y) for y in 'bcd'} | {(x, y) for x in 'bcd' for y in 'bcd'}
+    assert paths == expected, f"Ожидалось {sorted(expected)}, получено {sorted(paths)}"
+    print(f"  ✓ Транзитивное замыкание: {len(paths)} пар")
+    
+    assert set(program.query('unreachable', None, 'a')) == {(x, 'a') for x in 'abcd'}, "Неверное отрицание"
+    assert program.query('path', 'a', None) == [('a', 'b'), ('a', 'c'), ('a', 'd')], "Неверный запрос по индексу"
+    print("  ✓ Стратифицированное отрицание и запросы по шаблону")
+    
+    print("✅ Тест рекурсивных правил пройден\n")
+
+
+def test_invalid_programs():
+    print("Тестирование некорректных программ...")
+    
+    program = _program("p(X) :- q(X), \\+ r(X). r(X) :- q(X), \\+ p(X). q(a).")
+    try:
+        program.evaluate()
+        assert False, "Ожидалась ошибка стратификации"
+    except ValueError:
+        print("  ✓ Нестратифицируемая программа отклонена")
+    
+    try:
+        parse_program("p(X) :- q(X)")
+        assert False, "Ожидалась синтаксическая ошибка"
+    except PrologSyntaxError:
+        print("  ✓ Синтаксическая ошибка обнаружена")
+    
+    print("✅ Тест некорректных программ пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование движка правил".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_prolog_rules()
+        test_rules_match_owl_knowledge_base()
+        test_semi_naive_recursion()
+        test_invalid_programs()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ ДВИЖКА ПРАВИЛ ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,119 @@
+import sys
+import os
+import io
+import json
+import asyncio
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.knowledge_base import OWLKnowledgeBase, CachedKnowledgeBase
+from src.engine import RecommendationEngine
+from src.service import RecommendationPipeline, RecommendationServer, run_batch
+
+OWL_FILE = os.path.join(os.path.dirname(__file__), '..', '..', 'lab1', 'boardgames_fixed.owl')
+
+
+def _pipeline():
+    return RecommendationPipeline(RecommendationEngine(CachedKnowledgeBase(OWLKnowledgeBase(OWL_FILE))))
+
+
+def test_pipeline_refines_like_dialogue():
+    print("Тестирование конвейера рекомендаций...")
+    
+    pipeline = _pipeline()
+    
+    response = pipeline.handle({'id': 'a', 'text': 'евро игры с рабочими', 'complexity': 3, 'cooperative': 2})
+    assert response['id'] == 'a', "Идентификатор запроса должен возвращаться"
+    assert response['preferences']['complexity'] == 'heavy', "Выбор 3 означает сложные игры"
+    assert response['preferences']['cooperative'] is False, "Выбор 2 означает конкурентные игры"
+    assert response['recommendations'][0]['name'] == 'agricola', f"Ожидалась agricola: {response}"
+    print(f"  ✓ {[r['name'] for r in response['recommendations']]}")
+    
+    response = pipeline.handle({'text': 'мне все равно'})
+    assert response['preferences']['genres'] == ['eurogame'], "Жанр по умолчанию - eurogame"
+    print("  ✓ Жанр по умолчанию")
+    
+    response = pipeline.handle({'id': 7, 'text': 'test@#$%'})
+    assert response == {'id': 7, 'error': "Ввод содержит недопустимые символы"}, f"Ожидалась ошибка: {response}"
+    print("  ✓ Ошибка валидации")
+    
+    print("✅ Тест конвейера пройден\n")
+
+
+def test_run_batch():
+    print("Тестирование пакетного режима...")
+    
+    lines = io.StringIO(
+        '{"id": 1, "text": "Хочу простые партийные игры"}\n'
+        '\n'
+        'not json\n'
+        '{"id": 2, "text": "кооперативные игры вместе", "top_k": 1}\n'
+    )
+    output = io.StringIO()
+    
+    processed = run_batch(_pipeline(), lines, output, batch_size=2)
+    responses = [json.loads(line) for line in output.getvalue().splitlines()]
+    
+    assert processed == 3 and len(responses) == 3, f"Ожидалось 3 ответа, получено {len(responses)}"
+    assert responses[0]['id'] == 1 and responses[0]['recommendations'], "Первый запрос должен быть обработан"
+    assert responses[1]['line'] == 3 and 'error' in responses[1], "Некорректный JSON должен давать ошибку"
+    assert responses[2]['id'] == 2 and len(responses[2]['recommendations']) == 1, "top_k должен соблюдаться"
+    print("  ✓ Ответы в порядке запросов")
+    
+    print("✅ Тест пакетного режима пройден\n")
+
+
+def test_server_roundtrip():
+    print("Тестирование сервера...")
+    
+    async def scenario():
+        server = await RecommendationServer(_pipeline(), port=0).start()
+        try:
+            async def client(text):
+                reader, writer = await asyncio.open_connection(server.host, server.port)
+                writer.write(json.dumps({'text': text}).encode('utf-8') + b'\n')
+                writer.write(b'{broken\n')
+                await writer.drain()
+                first = json.loads(await reader.readline())
+                second = json.loads(await reader.readline())
+                writer.close()
+                await writer.wait_closed()
+                return first, second
+            
+            return await asyncio.gather(*(client(t) for t in ['партийные игры', 'евро игры'] * 5))
+        finally:
+            await server.close()
+    
+    results = asyncio.run(scenario())
+    assert len(results) == 10, "Все клиенты должны получить ответы"
+    for first, second in results:
+        assert first['recommendations'], "Должны быть рекомендации"
+        assert 'error' in second, "Некорректный JSON должен давать ошибку"
+    print(f"  ✓ {len(results)} параллельных сессий обслужены")
+    
+    print("✅ Тест сервера пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование сервисного режима".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_pipeline_refines_like_dialogue()
+        test_run_batch()
+        test_server_roundtrip()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ СЕРВИСА ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
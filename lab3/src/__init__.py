@@ -0,0 +1,3 @@
+from .models import LinearRegression
+
+__all__ = ['LinearRegression']
@@ -0,0 +1,79 @@
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+TARGET = 'median_house_value'
+
+
+def load_housing(path: str, target: str = TARGET, cache: bool = False, cache_dir: Optional[str] = None,
+                 float_dtype: str = 'float64') -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Загрузка датасета California Housing: заполнение пропусков медианой и разделение на признаки и цель.
+    При cache=True CSV разбирается один раз в столбцовый кэш рядом с файлом (common.columnar) или в cache_dir,
+    дальше столбцы читаются через memmap; y — представление файла без копирования, если в нём нет пропусков.
+    X и в этом случае собирается в новую матрицу: столбцы кэша лежат в разных файлах.
+    """
+    if cache:
+        from common.columnar import open_csv
+        dataset = open_csv(path, cache_dir, float_dtype)
+        X_columns = [col for col in dataset.columns if col != target]
+        X = dataset.matrix(X_columns)
+        missing = np.isnan(X).any(axis=0)
+        for j in np.flatnonzero(missing):
+            X[:, j] = np.where(np.isnan(X[:, j]), np.nanmedian(X[:, j]), X[:, j])
+        y = dataset[target]
+        if np.isnan(y).any():
+            y = np.where(np.isnan(y), np.nanmedian(y), y)
+        return X, y, X_columns
+    
+    df = pd.read_csv(path)
+    df = df.fillna(df.median())
+    X_columns = [col for col in df.columns if col != target]
+    return df[X_columns].values, df[target].values, X_columns
+
+
+def min_max_normalize(X: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Нормализация признаков в [0, 1]: (x - min) / (max - min)
+    """
+    X_min = X.min(axis=0)
+    X_max = X.max(axis=0)
+    X_range = X_max - X_min
+    X_range[X_range == 0] = 1
+    return (X - X_min) / X_range, X_min, X_range
+
+
+def train_test_split(X: np.ndarray, y: np.ndarray, test_size: float = 0.2, random_state: int = None):
+    # Локальный генератор даёт ту же перестановку, что np.random.seed(random_state),
+    # но не сбрасывает глобальное состояние
+    rng = np.random.RandomState(random_state)
+    
+    n_samples = X.shape[0]
+    n_test = int(n_samples * test_size)
+    
+    indices = rng.permutation(n_samples)
+    
+    test_indices = indices[:n_test]
+    train_indices = indices[n_test:]
+    
+    return X[train_indices], X[test_indices], y[train_indices], y[test_indices]
+
+
+SYNTHETIC_FEATURES = ('rooms_per_household', 'bedrooms_per_room', 'population_per_household')
+
+
+def synthetic_features(X: np.ndarray, feature_names: List[str]) -> Tuple[np.ndarray, List[str]]:
+    """
+    Синтетические признаки из ноутбука (бонусная модель), добавленные справа к X
+    """
+    idx_total_rooms = feature_names.index('total_rooms')
+    idx_total_bedrooms = feature_names.index('total_bedrooms')
+    idx_population = feature_names.index('population')
+    idx_households = feature_names.index('households')
+    
+    rooms_per_household = X[:, idx_total_rooms] / (X[:, idx_households] + 1e-10)
+    bedrooms_per_room = X[:, idx_total_bedrooms] / (X[:, idx_total_rooms] + 1e-10)
+    population_per_household = X[:, idx_population] / (X[:, idx_households] + 1e-10)
+    
+    X_synthetic = np.column_stack([X, rooms_per_household, bedrooms_per_room, population_per_household])
+    return X_synthetic, list(feature_names) + list(SYNTHETIC_FEATURES)
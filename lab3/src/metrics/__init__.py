@@ -0,0 +1,3 @@
+from .regression import RegressionAccumulator, regression_metrics, streaming_regression_metrics
+
+__all__ = ['RegressionAccumulator', 'regression_metrics', 'streaming_regression_metrics']
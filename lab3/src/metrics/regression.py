@@ -0,0 +1,70 @@
+from typing import Dict, Iterable, Tuple
+import numpy as np
+
+
+class RegressionAccumulator:
+    """
+    Метрики регрессии, накапливаемые по частям предсказаний: сумма квадратов и модулей остатков,
+    а для SS_tot — среднее и сумма квадратов отклонений y, объединяемые формулой Чана.
+    Итог совпадает с расчётом по всем данным сразу.
+    """
+    
+    def __init__(self):
+        self.n_samples = 0
+        self.mean_y = 0.0
+        self.ss_tot = 0.0
+        self.ss_res = 0.0
+        self.abs_res = 0.0
+    
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> 'RegressionAccumulator':
+        y_true = np.asarray(y_true, dtype=np.float64)
+        y_pred = np.asarray(y_pred, dtype=np.float64)
+        if len(y_true) != len(y_pred):
+            raise ValueError("Длины y_true и y_pred не совпадают")
+        if len(y_true) == 0:
+            return self
+        
+        residual = y_true - y_pred
+        self.ss_res += float(residual @ residual)
+        np.abs(residual, out=residual)
+        self.abs_res += float(residual.sum())
+        
+        m = len(y_true)
+        chunk_mean = float(y_true.mean())
+        np.subtract(y_true, chunk_mean, out=residual)
+        chunk_ss = float(residual @ residual)
+        
+        n = self.n_samples + m
+        delta = chunk_mean - self.mean_y
+        self.ss_tot += chunk_ss + delta * delta * self.n_samples * m / n
+        self.mean_y += delta * m / n
+        self.n_samples = n
+        return self
+    
+    def result(self) -> Dict[str, float]:
+        if self.n_samples == 0:
+            raise ValueError("Нет данных для оценки")
+        mse = self.ss_res / self.n_samples
+        return {
+            'r2': 1 - self.ss_res / self.ss_tot,
+            'mse': mse,
+            'rmse': float(np.sqrt(mse)),
+            'mae': self.abs_res / self.n_samples,
+        }
+
+
+def regression_metrics(y_true: np.ndarray, y_pred: np.ndarray) -> Dict[str, float]:
+    """
+    R2, MSE, RMSE и MAE за один проход по остаткам
+    """
+    return RegressionAccumulator().update(y_true, y_pred).result()
+
+
+def streaming_regression_metrics(chunks: Iterable[Tuple[np.ndarray, np.ndarray]]) -> Dict[str, float]:
+    """
+    Метрики по итератору пар (y_true, y_pred) без загрузки всех предсказаний в память
+    """
+    accumulator = RegressionAccumulator()
+    for y_true, y_pred in chunks:
+        accumulator.update(y_true, y_pred)
+    return accumulator.result()
@@ -0,0 +1,4 @@
+from .gram import GramStatistics, centered_gram
+from .linear_regression import LinearRegression
+
+__all__ = ['GramStatistics', 'LinearRegression', 'centered_gram']
@@ -0,0 +1,164 @@
+from typing import Tuple
+import numpy as np
+
+DEFAULT_BLOCK_BYTES = 64 * 1024 * 1024
+
+
+def centered_gram(X: np.ndarray, mean: np.ndarray, block_bytes: int = DEFAULT_BLOCK_BYTES) -> np.ndarray:
+    """
+    (X - mean)ᵀ(X - mean) по блокам строк: центрированная копия X целиком не создаётся
+    """
+    n_samples, n_features = X.shape
+    gram = np.zeros((n_features, n_features))
+    rows = max(1, block_bytes // (8 * max(1, n_features)))
+    for start in range(0, n_samples, rows):
+        block = X[start:start + rows] - mean
+        gram += block.T @ block
+    return gram
+
+
+def centered_qr(X: np.ndarray, y: np.ndarray, mean_x: np.ndarray, mean_y: float, alpha: float = 0.0,
+                block_bytes: int = DEFAULT_BLOCK_BYTES) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    R и Qᵀ(y - mean_y) из QR-разложения X - mean_x по блокам строк (TSQR): каждый блок центрируется
+    в переиспользуемый буфер под накопленным треугольником R расширенной матрицы [X - mean_x | y - mean_y].
+    При alpha > 0 в конец добавляются строки [sqrt(alpha)·I | 0] — ридж как обычные МНК.
+    """
+    n_samples, n_features = X.shape
+    width = n_features + 1
+    rows = max(width, block_bytes // (8 * width))
+    buffer = np.zeros((width + rows, width))
+    R = np.zeros((width, width))
+    
+    def absorb(n_rows: int) -> np.ndarray:
+        buffer[:width] = R
+        return np.linalg.qr(buffer[:width + n_rows], mode='r')
+    
+    for start in range(0, n_samples, rows):
+        block = buffer[width:width + min(rows, n_samples - start)]
+        np.subtract(X[start:start + rows], mean_x, out=block[:, :n_features])
+        np.subtract(y[start:start + rows], mean_y, out=block[:, n_features])
+        R = absorb(len(block))
+    if alpha > 0:
+        ridge = buffer[width:2 * width]
+        ridge[:] = 0
+        ridge[np.arange(n_features), np.arange(n_features)] = np.sqrt(alpha)
+        R = absorb(width)
+    return R[:n_features, :n_features], R[:n_features, n_features]
+
+
+def solve_cholesky(gram: np.ndarray, rhs: np.ndarray, tolerance: float = None) -> np.ndarray:
+    """
+    Решение gram w = rhs разложением Холецкого. Квадрат ведущего элемента L[i, i]² — остаток
+    признака i после проекции на предыдущие; при заданном tolerance признак считается линейно
+    зависимым, если остаток не больше tolerance·gram[i, i], иначе — при остатке на уровне округления.
+    """
+    message = "Матрица Грама вырождена: используйте solver='qr'/'svd' или alpha > 0"
+    try:
+        L = np.linalg.cholesky(gram)
+    except np.linalg.LinAlgError:
+        raise ValueError(message)
+    # Из-за округления вырожденная матрица может разложиться с ничтожно малым ведущим элементом
+    pivots = np.diag(L) ** 2
+    if tolerance is not None:
+        dependent = np.any(pivots <= tolerance * np.maximum(np.diag(gram), np.finfo(np.float64).tiny))
+    else:
+        dependent = len(L) and pivots.min() <= np.finfo(np.float64).eps * len(L) * np.diag(gram).max()
+    if dependent:
+        raise ValueError(message)
+    return np.linalg.solve(L.T, np.linalg.solve(L, rhs))
+
+
+class GramStatistics:
+    """
+    Достаточные статистики МНК в центрированном виде: число объектов, средние,
+    (X - mean_x)ᵀ(X - mean_x), (X - mean_x)ᵀ(y - mean_y) и сумма (y - mean_y)².
+    Части данных объединяются формулой Чана, поэтому память O(p²) при любом числе строк.
+    """
+    
+    def __init__(self, n_features: int):
+        self.n_features = n_features
+        self.n_samples = 0
+        self.mean_x = np.zeros(n_features)
+        self.mean_y = 0.0
+        self.sxx = np.zeros((n_features, n_features))
+        self.sxy = np.zeros(n_features)
+        self.syy = 0.0
+    
+    @classmethod
+    def from_data(cls, X: np.ndarray, y: np.ndarray, block_bytes: int = DEFAULT_BLOCK_BYTES) -> 'GramStatistics':
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if X.ndim != 2 or len(X) != len(y):
+            raise ValueError("Число объектов и значений целевой переменной не совпадает")
+        stats = cls(X.shape[1])
+        if len(X) == 0:
+            return stats
+        stats.n_samples = len(X)
+        stats.mean_x = X.mean(axis=0)
+        stats.mean_y = float(y.mean())
+        y_centered = y - stats.mean_y
+        stats.sxx = centered_gram(X, stats.mean_x, block_bytes)
+        stats.sxy = X.T @ y_centered
+        stats.syy = float(y_centered @ y_centered)
+        return stats
+    
+    def update(self, X: np.ndarray, y: np.ndarray, block_bytes: int = DEFAULT_BLOCK_BYTES) -> 'GramStatistics':
+        return self.merge(GramStatistics.from_data(X, y, block_bytes))
+    
+    def merge(self, other: 'GramStatistics') -> 'GramStatistics':
+        if other.n_features != self.n_features:
+            raise ValueError(f"Число признаков не совпадает: {self.n_features} != {other.n_features}")
+        if other.n_samples == 0:
+            return self
+        if self.n_samples == 0:
+            self.n_samples = other.n_samples
+            self.mean_x, self.mean_y = other.mean_x.copy(), other.mean_y
+            self.sxx, self.sxy, self.syy = other.sxx.copy(), other.sxy.copy(), other.syy
+            return self
+        
+        n = self.n_samples + other.n_samples
+        weight = self.n_samples * other.n_samples / n
+        delta_x = other.mean_x - self.mean_x
+        delta_y = other.mean_y - self.mean_y
+        
+        self.sxx += other.sxx + weight * np.outer(delta_x, delta_x)
+        self.sxy += other.sxy + weight * delta_x * delta_y
+        self.syy += other.syy + weight * delta_y * delta_y
+        self.mean_x += delta_x * (other.n_samples / n)
+        self.mean_y += delta_y * (other.n_samples / n)
+        self.n_samples = n
+        return self
+    
+    def subtract(self, other: 'GramStatistics') -> 'GramStatistics':
+        """
+        Статистики данных без части other (обращение merge); исходный объект не меняется
+        """
+        if other.n_features != self.n_features:
+            raise ValueError(f"Число признаков не совпадает: {self.n_features} != {other.n_features}")
+        n = self.n_samples - other.n_samples
+        if n <= 0:
+            raise ValueError("Вычитаемая часть должна быть меньше всех данных")
+        result = GramStatistics(self.n_features)
+        result.n_samples = n
+        result.mean_x = (self.n_samples * self.mean_x - other.n_samples * other.mean_x) / n
+        result.mean_y = (self.n_samples * self.mean_y - other.n_samples * other.mean_y) / n
+        
+        weight = n * other.n_samples / self.n_samples
+        delta_x = other.mean_x - result.mean_x
+        delta_y = other.mean_y - result.mean_y
+        result.sxx = self.sxx - other.sxx - weight * np.outer(delta_x, delta_x)
+        result.sxy = self.sxy - other.sxy - weight * delta_x * delta_y
+        result.syy = self.syy - other.syy - weight * delta_y * delta_y
+        return result
+    
+    def solve(self, alpha: float = 0.0) -> Tuple[np.ndarray, float]:
+        """
+        Веса и смещение ридж-регрессии (alpha = 0 — обычный МНК)
+        """
+        if self.n_samples == 0:
+            raise ValueError("Нет данных для обучения")
+        gram = self.sxx.copy()
+        gram[np.diag_indices(self.n_features)] += alpha
+        weights = solve_cholesky(gram, self.sxy)
+        return weights, self.mean_y - self.mean_x @ weights
@@ -0,0 +1,221 @@
+from typing import Dict, Iterable, Optional, Tuple, Union
+import numpy as np
+
+from ..metrics import RegressionAccumulator
+from .gram import DEFAULT_BLOCK_BYTES, GramStatistics, centered_qr
+
+SOLVERS = ('cholesky', 'qr', 'svd')
+
+
+class LinearRegression:
+    """
+    Линейная регрессия методом наименьших квадратов.
+    
+    Модель: y = X @ w + b
+    
+    Метод наименьших квадратов минимизирует:
+    L = sum((y_true - y_pred)^2) + alpha * sum(w^2)
+    
+    Смещение исключается центрированием: w ищется по (X - mean_x, y - mean_y),
+    затем b = mean_y - mean_x @ w. Решатели:
+    - 'cholesky': разложение Холецкого центрированной матрицы Грама (быстро, O(n·p²));
+    - 'qr': QR-разложение центрированной матрицы признаков (устойчивее при плохой обусловленности);
+    - 'svd': сингулярное разложение, допускает линейно зависимые признаки.
+    Все решатели обходят X блоками строк по block_bytes и не создают центрированную копию X:
+    'qr' и 'svd' накапливают треугольный множитель R (p×p), 'svd' раскладывает уже его.
+    
+    partial_fit накапливает статистики Грама по частям данных (только для 'cholesky');
+    система решается один раз при первом обращении к весам.
+    
+    evaluate считает R2, MSE, RMSE и MAE за одно предсказание по блокам строк.
+    """
+    
+    def __init__(self, solver: str = 'cholesky', alpha: float = 0.0, rcond: float = None,
+                 block_bytes: int = DEFAULT_BLOCK_BYTES):
+        if solver not in SOLVERS:
+            raise ValueError(f"Неизвестный решатель: {solver}")
+        if alpha < 0:
+            raise ValueError("Коэффициент регуляризации должен быть неотрицательным")
+        self.solver = solver
+        self.alpha = alpha
+        self.rcond = rcond
+        self.block_bytes = block_bytes
+        self._stats = None
+        self._weights = None
+        self._bias = None
+    
+    @property
+    def weights(self):
+        self._solve_pending()
+        return self._weights
+    
+    @weights.setter
+    def weights(self, value):
+        self._weights = value
+    
+    @property
+    def bias(self):
+        self._solve_pending()
+        return self._bias
+    
+    @bias.setter
+    def bias(self, value):
+        self._bias = value
+    
+    def _solve_pending(self):
+        if self._weights is None and self._stats is not None and self._stats.n_samples:
+            self._weights, self._bias = self._stats.solve(self.alpha)
+    
+    def fit(self, X, y):
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if X.ndim != 2 or len(X) != len(y):
+            raise ValueError("Число объектов и значений целевой переменной не совпадает")
+        
+        if self.solver == 'cholesky':
+            self._stats = GramStatistics.from_data(X, y, self.block_bytes)
+            self._weights, self._bias = self._stats.solve(self.alpha)
+            return self
+        
+        x_mean = X.mean(axis=0)
+        y_mean = y.mean()
+        if self.solver == 'qr':
+            weights = self._solve_qr(*centered_qr(X, y, x_mean, y_mean, self.alpha, self.block_bytes))
+        else:
+            R, qty = centered_qr(X, y, x_mean, y_mean, block_bytes=self.block_bytes)
+            weights = self._solve_svd(R, qty, len(X))
+        
+        self._stats = None
+        self._weights = weights
+        self._bias = y_mean - x_mean @ weights
+        
+        return self
+    
+    def partial_fit(self, X, y):
+        if self.solver != 'cholesky':
+            raise ValueError("partial_fit поддерживается только для solver='cholesky'")
+        X = np.asarray(X, dtype=np.float64)
+        if self._stats is None:
+            self._stats = GramStatistics(X.shape[1])
+        self._stats.update(X, y, self.block_bytes)
+        self._weights = None
+        self._bias = None
+        return self
+    
+    def _solve_qr(self, R: np.ndarray, qty: np.ndarray) -> np.ndarray:
+        n_features = len(R)
+        diag = np.abs(np.diag(R))
+        if n_features and diag.min() <= diag.max() * n_features * np.finfo(np.float64).eps:
+            raise ValueError("Признаки линейно зависимы: используйте solver='svd' или alpha > 0")
+        return np.linalg.solve(R, qty)
+    
+    def _solve_svd(self, R: np.ndarray, qty: np.ndarray, n_samples: int) -> np.ndarray:
+        # Сингулярные числа и правые векторы Xc = QR совпадают с разложением R, а Uᵀyc = U_Rᵀ(Qᵀyc)
+        U, s, Vt = np.linalg.svd(R)
+        if self.alpha > 0:
+            factors = s / (s ** 2 + self.alpha)
+        else:
+            rcond = self.rcond if self.rcond is not None else np.finfo(np.float64).eps * max(n_samples, len(R))
+            keep = s > rcond * (s[0] if len(s) else 0)
+            factors = np.zeros_like(s)
+            factors[keep] = 1 / s[keep]
+        return Vt.T @ (factors * (U.T @ qty))
+    
+    def predict(self, X):
+        if self.weights is None or self.bias is None:
+            raise ValueError("Модель не обучена. Сначала вызовите метод fit().")
+        
+        return X @ self.weights + self.bias
+    
+    def score(self, X, y):
+        """        
+        R2 = 1 - (SS_res / SS_tot)
+        
+        где:
+        SS_res = sum((y_true - y_pred)^2)
+        SS_tot = sum((y_true - y_mean)^2)
+        """
+        y_pred = self.predict(X)
+        
+        ss_res = np.sum((y - y_pred) ** 2)
+        
+        ss_tot = np.sum((y - np.mean(y)) ** 2)
+        
+        r2 = 1 - (ss_res / ss_tot)
+        
+        return r2
+    
+    def mse(self, X, y):
+        """        
+        MSE = (1/n) * sum((y_true - y_pred)^2)
+        """
+        y_pred = self.predict(X)
+        return np.mean((y - y_pred) ** 2)
+    
+    def rmse(self, X, y):
+        """        
+        RMSE = sqrt(MSE)
+        """
+        return np.sqrt(self.mse(X, y))
+    
+    def mae(self, X, y):
+        """        
+        MAE = (1/n) * sum(|y_true - y_pred|)
+        """
+        y_pred = self.predict(X)
+        return np.mean(np.abs(y - y_pred))
+    
+    def evaluate(self, X: Union[np.ndarray, Iterable[Tuple[np.ndarray, np.ndarray]]],
+                 y: Optional[np.ndarray] = None) -> Dict[str, float]:
+        """
+        Все метрики (r2, mse, rmse, mae) за один проход: X и y целиком, обрабатываемые
+        блоками строк, или итератор пар (X_chunk, y_chunk) для данных, не помещающихся в память
+        """
+        if y is None:
+            chunks = X
+        else:
+            X = np.asarray(X)
+            y = np.asarray(y)
+            if len(X) != len(y):
+                raise ValueError("Число объектов и значений целевой переменной не совпадает")
+            rows = max(1, self.block_bytes // (8 * max(1, X.shape[1])))
+            chunks = ((X[start:start + rows], y[start:start + rows]) for start in range(0, len(X), rows))
+        
+        accumulator = RegressionAccumulator()
+        for X_chunk, y_chunk in chunks:
+            accumulator.update(y_chunk, self.predict(X_chunk))
+        return accumulator.result()
+    
+    def save(self, directory: str):
+        """
+        Сохранение в каталог: веса и смещение, а при обучении через статистики Грама — и они,
+        чтобы после загрузки можно было продолжить partial_fit
+        """
+        from common.serialization import save_model, split_state
+        if self.weights is None or self.bias is None:
+            raise ValueError("Модель не обучена. Сначала вызовите метод fit().")
+        params = {'solver': self.solver, 'alpha': self.alpha, 'rcond': self.rcond, 'block_bytes': self.block_bytes,
+                  'bias': float(self.bias)}
+        arrays = {'weights': self.weights}
+        if self._stats is not None:
+            params['stats'], stats_arrays = split_state(self._stats)
+            arrays.update({f'stats.{name}': value for name, value in stats_arrays.items()})
+        save_model(directory, type(self).__name__, params, arrays)
+    
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> 'LinearRegression':
+        from common.serialization import load_model, restore_state
+        kind, params, arrays = load_model(directory, mmap)
+        if kind != cls.__name__:
+            raise ValueError(f"В каталоге сохранена модель {kind}, а не {cls.__name__}")
+        stats = params.pop('stats', None)
+        bias = params.pop('bias')
+        model = cls(**params)
+        model._weights = arrays['weights']
+        model._bias = bias
+        if stats is not None:
+            # partial_fit обновляет статистики на месте, поэтому они копируются из memmap
+            stats_arrays = {name[len('stats.'):]: np.array(value) for name, value in arrays.items()
+                            if name.startswith('stats.')}
+            model._stats = restore_state(GramStatistics, stats, stats_arrays)
+        return model
@@ -0,0 +1,38 @@
+from typing import Any, Dict, Optional, Sequence
+import numpy as np
+
+from common.resampling import RandomState, Split, kfold_indices, summarize
+from src.models import GramStatistics, LinearRegression
+from src.models.gram import DEFAULT_BLOCK_BYTES
+
+
+def cross_validate_linear(X: np.ndarray, y: np.ndarray, n_splits: int = 5, alpha: float = 0.0,
+                          splits: Optional[Sequence[Split]] = None, rng: RandomState = None,
+                          level: float = 0.95, block_bytes: int = DEFAULT_BLOCK_BYTES) -> Dict[str, Any]:
+    """
+    K-блочная кросс-валидация LinearRegression без переобучения на каждом блоке:
+    статистики Грама считаются по одному разу для каждого тестового блока, статистики
+    обучающей части — общие минус блок. Тестовые блоки splits должны разбивать все объекты.
+    Результат в формате common.resampling.resample.
+    """
+    X = np.asarray(X, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if X.ndim != 2 or len(X) != len(y):
+        raise ValueError("Число объектов и значений целевой переменной не совпадает")
+    if splits is None:
+        splits = kfold_indices(len(X), n_splits, rng=rng)
+    tests = [np.asarray(test) for _, test in splits]
+    if not np.array_equal(np.sort(np.concatenate(tests)), np.arange(len(X))):
+        raise ValueError("Тестовые блоки должны разбивать все объекты ровно по одному разу")
+    
+    parts = [GramStatistics.from_data(X[test], y[test], block_bytes) for test in tests]
+    total = GramStatistics(X.shape[1])
+    for part in parts:
+        total.merge(part)
+    
+    folds = []
+    for test, part in zip(tests, parts):
+        model = LinearRegression(alpha=alpha, block_bytes=block_bytes)
+        model.weights, model.bias = total.subtract(part).solve(alpha)
+        folds.append(model.evaluate(X[test], y[test]))
+    return {'folds': folds, 'summary': summarize(folds, level, method='normal')}
@@ -0,0 +1,3 @@
+from .gram_engine import GramEngine, IncrementalCholesky, back_substitution, forward_substitution
+
+__all__ = ['GramEngine', 'IncrementalCholesky', 'back_substitution', 'forward_substitution']
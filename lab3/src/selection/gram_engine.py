@@ -0,0 +1,311 @@
+from itertools import combinations
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+import numpy as np
+
+from src.models.gram import DEFAULT_BLOCK_BYTES, GramStatistics, solve_cholesky
+from src.models.linear_regression import LinearRegression
+
+CRITERIA = ('bic', 'aic', 'r2')
+DIRECTIONS = ('forward', 'backward', 'both')
+
+# Признак считается линейно зависимым от выбранных, если его остаток после проекции
+# меньше этой доли от собственной нормы; так проверяются и ведущие элементы в solve
+COLLINEAR_TOLERANCE = 1e-10
+
+Feature = Union[int, str]
+
+
+def forward_substitution(L: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """
+    Решение L X = B для нижнетреугольной L за O(k²) на столбец правой части
+    """
+    X = np.array(B, dtype=np.float64, copy=True)
+    for i in range(len(L)):
+        X[i] -= L[i, :i] @ X[:i]
+        X[i] /= L[i, i]
+    return X
+
+
+def back_substitution(U: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """
+    Решение U X = B для верхнетреугольной U
+    """
+    X = np.array(B, dtype=np.float64, copy=True)
+    for i in range(len(U) - 1, -1, -1):
+        X[i] -= U[i, i + 1:] @ X[i + 1:]
+        X[i] /= U[i, i]
+    return X
+
+
+class IncrementalCholesky:
+    """
+    Разложение Холецкого L Lᵀ = G[S, S] + alpha·I для меняющегося набора признаков S.
+    Добавление признака — дописывание строки L (O(k²)), удаление — вычёркивание строки
+    и восстановление треугольности вращениями Гивенса (O(k²)). Вместе с L поддерживаются
+    L⁻¹ (те же обновления за O(k²)) и вектор z = L⁻¹ Xᵀy: минимум функции потерь равен syy - ||z||².
+    """
+    
+    def __init__(self, gram: np.ndarray, rhs: np.ndarray, syy: float, alpha: float = 0.0):
+        self.gram = gram
+        self.rhs = rhs
+        self.syy = syy
+        self.alpha = alpha
+        self.features = []
+        self.L = np.zeros((0, 0))
+        self.L_inv = np.zeros((0, 0))
+        self.z = np.zeros(0)
+    
+    @property
+    def objective(self) -> float:
+        return self.syy - float(self.z @ self.z)
+    
+    def _pivots(self, candidates: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        l = self.L_inv @ self.gram[np.ix_(self.features, candidates)]
+        diagonal = self.gram[candidates, candidates] + self.alpha
+        d2 = diagonal - np.sum(l ** 2, axis=0)
+        independent = d2 > COLLINEAR_TOLERANCE * np.maximum(diagonal, np.finfo(np.float64).tiny)
+        return l, d2, independent
+    
+    def gains(self, candidates: Sequence[int]) -> np.ndarray:
+        """
+        Уменьшение функции потерь при добавлении каждого кандидата; для зависимых признаков -inf
+        """
+        candidates = np.asarray(candidates, dtype=np.intp)
+        l, d2, independent = self._pivots(candidates)
+        z_new = self.rhs[candidates] - l.T @ self.z
+        gains = np.full(len(candidates), -np.inf)
+        gains[independent] = z_new[independent] ** 2 / d2[independent]
+        return gains
+    
+    def losses(self) -> np.ndarray:
+        """
+        Рост функции потерь при удалении каждого из выбранных признаков: w_k² / (A⁻¹)_kk
+        """
+        if not self.features:
+            return np.zeros(0)
+        return self.weights() ** 2 / np.sum(self.L_inv ** 2, axis=0)
+    
+    def add(self, feature: int) -> 'IncrementalCholesky':
+        if feature in self.features:
+            raise ValueError(f"Признак {feature} уже выбран")
+        l, d2, independent = self._pivots(np.array([feature]))
+        if not independent[0]:
+            raise ValueError(f"Признак {feature} линейно зависим от выбранных")
+        k = len(self.features)
+        d = np.sqrt(d2[0])
+        L = np.zeros((k + 1, k + 1))
+        L[:k, :k] = self.L
+        L[k, :k] = l[:, 0]
+        L[k, k] = d
+        self.L = L
+        # [[L, 0], [lᵀ, d]]⁻¹ = [[L⁻¹, 0], [-lᵀL⁻¹ / d, 1 / d]]
+        L_inv = np.zeros((k + 1, k + 1))
+        L_inv[:k, :k] = self.L_inv
+        L_inv[k, :k] = -(l[:, 0] @ self.L_inv) / d
+        L_inv[k, k] = 1 / d
+        self.L_inv = L_inv
+        self.z = np.append(self.z, (self.rhs[feature] - l[:, 0] @ self.z) / d)
+        self.features.append(feature)
+        return self
+    
+    def remove(self, feature: int) -> 'IncrementalCholesky':
+        k = self.features.index(feature)
+        M = np.delete(self.L, k, axis=0)
+        # После вычёркивания строки k над диагональю остаются элементы M[i, i + 1]: обнуляем их
+        # вращениями столбцов, что сохраняет M Mᵀ. Если L G = [[L', 0], [r, ρ]] с точностью до
+        # перестановки строки k в конец, то L'⁻¹ — левый верхний блок Gᵀ L⁻¹ без столбца k:
+        # те же вращения применяются к строкам L⁻¹
+        W = self.L_inv.copy()
+        for i in range(k, len(M)):
+            a, b = M[i, i], M[i, i + 1]
+            r = np.hypot(a, b)
+            c, s = a / r, b / r
+            left, right = M[i:, i].copy(), M[i:, i + 1].copy()
+            M[i:, i] = c * left + s * right
+            M[i:, i + 1] = c * right - s * left
+            top, bottom = W[i].copy(), W[i + 1].copy()
+            W[i] = c * top + s * bottom
+            W[i + 1] = c * bottom - s * top
+        self.L = M[:, :-1]
+        self.L_inv = np.delete(W[:-1], k, axis=1)
+        del self.features[k]
+        self.z = forward_substitution(self.L, self.rhs[self.features])
+        return self
+    
+    def weights(self) -> np.ndarray:
+        return back_substitution(self.L.T, self.z)
+
+
+class GramEngine:
+    """
+    Матрица Грама и Xᵀy по полному набору признаков (включая синтетические) считаются один раз;
+    любая модель на подмножестве признаков решается по подблокам без прохода по данным.
+    """
+    
+    def __init__(self, stats: GramStatistics, feature_names: Optional[Sequence[str]] = None, alpha: float = 0.0):
+        if alpha < 0:
+            raise ValueError("Коэффициент регуляризации должен быть неотрицательным")
+        if stats.n_samples == 0:
+            raise ValueError("Нет данных для обучения")
+        self.stats = stats
+        self.alpha = alpha
+        self.feature_names = list(feature_names) if feature_names is not None else None
+        if self.feature_names is not None and len(self.feature_names) != stats.n_features:
+            raise ValueError("Число имён не совпадает с числом признаков")
+    
+    @classmethod
+    def from_data(cls, X: np.ndarray, y: np.ndarray, feature_names: Optional[Sequence[str]] = None,
+                  alpha: float = 0.0, block_bytes: int = DEFAULT_BLOCK_BYTES) -> 'GramEngine':
+        return cls(GramStatistics.from_data(X, y, block_bytes), feature_names, alpha)
+    
+    @property
+    def n_features(self) -> int:
+        return self.stats.n_features
+    
+    def index(self, features: Iterable[Feature]) -> List[int]:
+        indices = []
+        for feature in features:
+            if isinstance(feature, str):
+                if self.feature_names is None or feature not in self.feature_names:
+                    raise ValueError(f"Неизвестный признак: {feature}")
+                feature = self.feature_names.index(feature)
+            if not 0 <= feature < self.n_features:
+                raise ValueError(f"Неизвестный признак: {feature}")
+            indices.append(int(feature))
+        if len(set(indices)) != len(indices):
+            raise ValueError("Признаки в подмножестве повторяются")
+        return indices
+    
+    def names(self, indices: Iterable[int]) -> List[Feature]:
+        return [self.feature_names[i] for i in indices] if self.feature_names is not None else list(indices)
+    
+    def solve(self, features: Iterable[Feature]) -> Tuple[np.ndarray, float]:
+        S = self.index(features)
+        stats = self.stats
+        gram = stats.sxx[np.ix_(S, S)]
+        gram[np.diag_indices(len(S))] += self.alpha
+        weights = solve_cholesky(gram, stats.sxy[S], COLLINEAR_TOLERANCE) if S else np.zeros(0)
+        return weights, stats.mean_y - stats.mean_x[S] @ weights
+    
+    def rss(self, features: Iterable[Feature], weights: Optional[np.ndarray] = None) -> float:
+        """
+        Сумма квадратов остатков на обучающих данных: syy - 2 wᵀXᵀy + wᵀ XᵀX w в центрированном виде
+        """
+        S = self.index(features)
+        if weights is None:
+            weights = self.solve(S)[0]
+        stats = self.stats
+        return float(stats.syy - 2 * weights @ stats.sxy[S] + weights @ stats.sxx[np.ix_(S, S)] @ weights)
+    
+    def r2(self, features: Iterable[Feature]) -> float:
+        return 1 - self.rss(features) / self.stats.syy
+    
+    def model(self, features: Iterable[Feature]) -> LinearRegression:
+        """
+        LinearRegression для X[:, features] без повторного обучения
+        """
+        model = LinearRegression(alpha=self.alpha)
+        model.weights, model.bias = self.solve(features)
+        return model
+    
+    def evaluate(self, features: Iterable[Feature]) -> Dict[str, Any]:
+        S = self.index(features)
+        weights, bias = self.solve(S)
+        rss = self.rss(S, weights)
+        n = self.stats.n_samples
+        return {
+            'features': self.names(S),
+            'weights': weights,
+            'bias': bias,
+            'r2': 1 - rss / self.stats.syy,
+            'mse': rss / n,
+            'rmse': np.sqrt(rss / n),
+        }
+    
+    def exhaustive(self, sizes: Union[int, Iterable[int]], top: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Все подмножества заданных размеров, от лучшего R² к худшему
+        """
+        sizes = [sizes] if isinstance(sizes, int) else list(sizes)
+        results = []
+        for size in sizes:
+            for subset in combinations(range(self.n_features), size):
+                try:
+                    results.append(self.evaluate(subset))
+                except ValueError:
+                    continue
+        results.sort(key=lambda r: -r['r2'])
+        return results[:top] if top is not None else results
+    
+    def _criterion(self, objective: float, k: int, criterion: str) -> float:
+        n = self.stats.n_samples
+        if criterion == 'r2':
+            return objective / self.stats.syy
+        penalty = 2.0 if criterion == 'aic' else np.log(n)
+        return n * np.log(max(objective, np.finfo(np.float64).tiny) / n) + penalty * (k + 1)
+    
+    def stepwise(self, direction: str = 'forward', criterion: str = 'bic', max_features: Optional[int] = None,
+                 min_improvement: float = 0.0, start: Iterable[Feature] = ()) -> List[Dict[str, Any]]:
+        """
+        Пошаговый отбор признаков на разложении Холецкого с пересчётом за O(p²) на изменение набора.
+        criterion: 'bic'/'aic' (информационные критерии) или 'r2' (доля необъяснённой дисперсии).
+        Шаг принимается, если критерий уменьшается больше чем на min_improvement.
+        Возвращает состояние после каждого принятого шага.
+        """
+        if direction not in DIRECTIONS:
+            raise ValueError(f"Неизвестное направление отбора: {direction}")
+        if criterion not in CRITERIA:
+            raise ValueError(f"Неизвестный критерий: {criterion}")
+        stats = self.stats
+        path = IncrementalCholesky(stats.sxx, stats.sxy, stats.syy, self.alpha)
+        start = self.index(start)
+        if direction == 'backward' and not start:
+            start = list(range(self.n_features))
+        for feature in start:
+            try:
+                path.add(feature)
+            except ValueError:
+                continue
+        max_features = max_features or self.n_features
+        
+        history = []
+        current = self._criterion(path.objective, len(path.features), criterion)
+        while True:
+            moves = []
+            k = len(path.features)
+            if direction in ('forward', 'both') and k < max_features:
+                candidates = [j for j in range(self.n_features) if j not in path.features]
+                if candidates:
+                    gains = path.gains(candidates)
+                    best = int(np.argmax(gains))
+                    if np.isfinite(gains[best]):
+                        score = self._criterion(path.objective - gains[best], k + 1, criterion)
+                        moves.append((score, 'add', candidates[best]))
+            if direction in ('backward', 'both') and k > 1:
+                losses = path.losses()
+                worst = int(np.argmin(losses))
+                score = self._criterion(path.objective + losses[worst], k - 1, criterion)
+                moves.append((score, 'remove', path.features[worst]))
+            if not moves:
+                break
+            
+            score, action, feature = min(moves)
+            if current - score <= min_improvement:
+                break
+            if action == 'add':
+                path.add(feature)
+            else:
+                path.remove(feature)
+            current = score
+            
+            weights = path.weights()
+            history.append({
+                'action': action,
+                'feature': self.names([feature])[0],
+                'features': self.names(path.features),
+                'weights': weights,
+                'bias': stats.mean_y - stats.mean_x[path.features] @ weights,
+                'criterion': score,
+                'r2': 1 - self.rss(path.features, weights) / stats.syy,
+            })
+        return history
@@ -0,0 +1,209 @@
+from typing import Dict, Iterator, List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+from src.data import TARGET
+from src.models import LinearRegression
+
+DEFAULT_CHUNKSIZE = 100_000
+MEDIAN_BINS = 4096
+MAX_CANDIDATES = 1 << 20
+
+
+def iter_csv(path: str, chunksize: int = DEFAULT_CHUNKSIZE, columns: Optional[List[str]] = None) -> Iterator[np.ndarray]:
+    """
+    Чтение CSV по частям в виде матриц float64 с колонками в порядке columns
+    """
+    for chunk in pd.read_csv(path, chunksize=chunksize, usecols=columns):
+        if columns is not None:
+            chunk = chunk[columns]
+        yield chunk.to_numpy(dtype=np.float64)
+
+
+class ColumnStatistics:
+    """
+    Потоковые статистики столбцов: число значений, пропусков, минимум и максимум
+    """
+    
+    def __init__(self, n_columns: int):
+        self.n_rows = 0
+        self.count = np.zeros(n_columns, dtype=np.int64)
+        self.missing = np.zeros(n_columns, dtype=np.int64)
+        self.min = np.full(n_columns, np.inf)
+        self.max = np.full(n_columns, -np.inf)
+    
+    def update(self, chunk: np.ndarray) -> 'ColumnStatistics':
+        missing = np.isnan(chunk)
+        self.n_rows += len(chunk)
+        self.missing += missing.sum(axis=0)
+        self.count += len(chunk) - missing.sum(axis=0)
+        if len(chunk):
+            self.min = np.minimum(self.min, np.where(missing, np.inf, chunk).min(axis=0))
+            self.max = np.maximum(self.max, np.where(missing, -np.inf, chunk).max(axis=0))
+        return self
+
+
+class _RankSearch:
+    """
+    Поиск значений заданных порядковых статистик по столбцам за несколько проходов по данным.
+    Каждый проход строит гистограмму значений внутри текущего интервала [lo, hi] вместе с точными
+    минимумом и максимумом каждой корзины; интервал сужается до корзины с искомым рангом.
+    Когда в интервале остаётся не больше max_candidates значений, они собираются и сортируются.
+    """
+    
+    def __init__(self, columns: np.ndarray, ranks: np.ndarray, lo: np.ndarray, hi: np.ndarray, inside: np.ndarray,
+                 bins: int = MEDIAN_BINS, max_candidates: int = MAX_CANDIDATES):
+        self.columns = columns
+        self.ranks = ranks.astype(np.int64)
+        self.lo = lo.astype(np.float64)
+        self.hi = hi.astype(np.float64)
+        self.bins = bins
+        self.max_candidates = max_candidates
+        self.values = np.where(self.lo == self.hi, self.lo, np.nan)
+        self.inside = inside.astype(np.int64)
+    
+    @property
+    def done(self) -> bool:
+        return not np.isnan(self.values).any()
+    
+    def _mask(self, V: np.ndarray, active: np.ndarray) -> np.ndarray:
+        return (V >= self.lo[active]) & (V <= self.hi[active])
+    
+    def run_pass(self, chunks: Iterator[np.ndarray]):
+        active = np.flatnonzero(np.isnan(self.values))
+        collect = active[self.inside[active] <= self.max_candidates]
+        refine = active[self.inside[active] > self.max_candidates]
+        n_refine = len(refine)
+        
+        below = np.zeros(len(self.ranks), dtype=np.int64)
+        counts = np.zeros(n_refine * self.bins, dtype=np.int64)
+        bin_min = np.full(n_refine * self.bins, np.inf)
+        bin_max = np.full(n_refine * self.bins, -np.inf)
+        gathered = {target: [] for target in collect}
+        refining = np.isin(active, refine)
+        
+        for chunk in chunks:
+            V = chunk[:, self.columns[active]]
+            below[active] += np.sum(V < self.lo[active], axis=0)
+            inside = self._mask(V, active)
+            
+            for position, target in enumerate(active):
+                if target in gathered:
+                    gathered[target].append(V[inside[:, position], position])
+            
+            if n_refine:
+                R = V[:, refining]
+                mask = inside[:, refining]
+                lo, hi = self.lo[refine], self.hi[refine]
+                scaled = (R - lo) / (hi - lo) * self.bins
+                index = np.clip(np.floor(np.where(mask, scaled, 0)), 0, self.bins - 1).astype(np.int64)
+                flat = (index + np.arange(n_refine) * self.bins)[mask]
+                values = R[mask]
+                counts += np.bincount(flat, minlength=len(counts))
+                np.minimum.at(bin_min, flat, values)
+                np.maximum.at(bin_max, flat, values)
+        
+        for target in collect:
+            values = np.sort(np.concatenate(gathered[target]))
+            self.values[target] = values[self.ranks[target] - below[target]]
+        
+        counts = counts.reshape(n_refine, self.bins)
+        bin_min = bin_min.reshape(n_refine, self.bins)
+        bin_max = bin_max.reshape(n_refine, self.bins)
+        for position, target in enumerate(refine):
+            cumulative = np.cumsum(counts[position])
+            b = int(np.searchsorted(cumulative, self.ranks[target] - below[target], side='right'))
+            self.lo[target], self.hi[target] = bin_min[position, b], bin_max[position, b]
+            self.inside[target] = counts[position, b]
+            if self.lo[target] == self.hi[target]:
+                self.values[target] = self.lo[target]
+
+
+def exact_medians(path: str, columns: List[str], stats: ColumnStatistics, chunksize: int = DEFAULT_CHUNKSIZE,
+                  bins: int = MEDIAN_BINS, max_candidates: int = MAX_CANDIDATES) -> np.ndarray:
+    """
+    Точные медианы столбцов без пропусков в расчёте (как DataFrame.median) за несколько проходов по CSV
+    """
+    n_columns = len(columns)
+    medians = np.full(n_columns, np.nan)
+    present = np.flatnonzero(stats.count > 0)
+    if len(present) == 0:
+        return medians
+    
+    count = stats.count[present]
+    targets = np.concatenate([present, present])
+    ranks = np.concatenate([(count - 1) // 2, count // 2])
+    search = _RankSearch(targets, ranks, stats.min[targets], stats.max[targets], stats.count[targets],
+                         bins, max_candidates)
+    while not search.done:
+        search.run_pass(iter_csv(path, chunksize, columns))
+    
+    lower, upper = np.split(search.values, 2)
+    medians[present] = np.mean(np.stack([lower, upper]), axis=0)
+    return medians
+
+
+def scan_csv(path: str, target: str = TARGET, chunksize: int = DEFAULT_CHUNKSIZE,
+             bins: int = MEDIAN_BINS, max_candidates: int = MAX_CANDIDATES) -> Dict[str, object]:
+    """
+    Статистики для предобработки из ноутбука: медианы для заполнения пропусков
+    и min/range для нормализации признаков. Память не зависит от числа строк.
+    """
+    columns = list(pd.read_csv(path, nrows=0).columns)
+    stats = ColumnStatistics(len(columns))
+    for chunk in iter_csv(path, chunksize, columns):
+        stats.update(chunk)
+    medians = exact_medians(path, columns, stats, chunksize, bins, max_candidates)
+    
+    features = [i for i, column in enumerate(columns) if column != target]
+    # Медиана лежит между минимумом и максимумом, поэтому заполнение пропусков их не меняет
+    X_min = stats.min[features]
+    X_range = stats.max[features] - X_min
+    X_range[X_range == 0] = 1
+    return {
+        'columns': columns,
+        'feature_columns': [columns[i] for i in features],
+        'target': target,
+        'n_rows': stats.n_rows,
+        'missing': stats.missing,
+        'medians': medians,
+        'X_min': X_min,
+        'X_range': X_range,
+    }
+
+
+def preprocess_chunk(chunk: np.ndarray, preprocessing: Dict[str, object]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Заполнение пропусков медианой и нормализация признаков для одной части CSV
+    """
+    columns = preprocessing['columns']
+    missing = np.isnan(chunk)
+    if missing.any():
+        chunk = np.where(missing, preprocessing['medians'], chunk)
+    target = columns.index(preprocessing['target'])
+    features = [i for i in range(len(columns)) if i != target]
+    X = (chunk[:, features] - preprocessing['X_min']) / preprocessing['X_range']
+    return X, chunk[:, target]
+
+
+def fit_csv(path: str, target: str = TARGET, chunksize: int = DEFAULT_CHUNKSIZE, alpha: float = 0.0,
+            preprocessing: Optional[Dict[str, object]] = None) -> Tuple[LinearRegression, Dict[str, object]]:
+    """
+    Обучение LinearRegression по CSV любого размера: проход для статистик предобработки,
+    затем partial_fit по частям и одно решение системы в конце
+    """
+    if preprocessing is None:
+        preprocessing = scan_csv(path, target, chunksize)
+    model = LinearRegression(solver='cholesky', alpha=alpha)
+    for chunk in iter_csv(path, chunksize, preprocessing['columns']):
+        model.partial_fit(*preprocess_chunk(chunk, preprocessing))
+    return model, preprocessing
+
+
+def evaluate_csv(model: LinearRegression, path: str, preprocessing: Dict[str, object],
+                 chunksize: int = DEFAULT_CHUNKSIZE) -> Dict[str, float]:
+    """
+    Метрики модели по CSV любого размера за один проход с той же предобработкой, что при обучении
+    """
+    chunks = iter_csv(path, chunksize, preprocessing['columns'])
+    return model.evaluate(preprocess_chunk(chunk, preprocessing) for chunk in chunks)
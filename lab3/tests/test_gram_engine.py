@@ -0,0 +1,172 @@
+import sys
+import os
+from itertools import combinations
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data import load_housing, min_max_normalize, synthetic_features, train_test_split
+from src.models import LinearRegression
+from src.selection import GramEngine, IncrementalCholesky
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'california_housing_train.csv')
+
+MODEL2_FEATURES = ['median_income', 'latitude', 'longitude', 'housing_median_age']
+MODEL3_FEATURES = ['total_rooms', 'total_bedrooms', 'population', 'households', 'median_income']
+
+
+def housing_engine():
+    X, y, columns = load_housing(DATA_FILE)
+    X_normalized, _, _ = min_max_normalize(X)
+    X_train, _, y_train, _ = train_test_split(X_normalized, y, test_size=0.2, random_state=42)
+    X_synthetic, names = synthetic_features(X_train, columns)
+    return GramEngine.from_data(X_synthetic, y_train, names), X_synthetic, y_train, names
+
+
+def test_subsets_match_refit():
+    print("Тестирование решения подмножеств по подблокам матрицы Грама...")
+    
+    engine, X, y, names = housing_engine()
+    subsets = {
+        'model1': names[:8],
+        'model2': MODEL2_FEATURES,
+        'model3': MODEL3_FEATURES,
+        'model_bonus': names,
+    }
+    for label, features in subsets.items():
+        columns = [names.index(feature) for feature in features]
+        reference = LinearRegression().fit(X[:, columns], y)
+        model = engine.model(features)
+        assert np.allclose(model.weights, reference.weights, rtol=1e-8), f"Веса {label} отличаются от обучения"
+        assert np.isclose(model.bias, reference.bias, rtol=1e-8), f"Смещение {label} отличается от обучения"
+        r2 = engine.r2(features)
+        assert np.isclose(r2, reference.score(X[:, columns], y), rtol=1e-10), f"R2 {label} отличается"
+        print(f"  ✓ {label}: {len(features)} признаков, R2 на обучении {r2:.4f}")
+    
+    result = engine.evaluate(MODEL2_FEATURES)
+    columns = [names.index(feature) for feature in MODEL2_FEATURES]
+    assert np.isclose(result['mse'], engine.model(MODEL2_FEATURES).mse(X[:, columns], y)), "MSE отличается"
+    print("  ✓ MSE и RMSE без прохода по данным")
+    
+    print("✅ Тест подмножеств пройден\n")
+
+
+def test_incremental_cholesky():
+    print("Тестирование добавления и удаления признаков в разложении Холецкого...")
+    
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(500, 12))
+    y = X @ rng.normal(size=12) + rng.normal(size=500)
+    engine = GramEngine.from_data(X, y, alpha=0.5)
+    stats = engine.stats
+    path = IncrementalCholesky(stats.sxx, stats.sxy, stats.syy, alpha=0.5)
+    
+    operations = [('add', j) for j in (3, 7, 0, 11, 5, 2)] + [('remove', 7), ('add', 9), ('remove', 3),
+                                                                ('remove', 9), ('add', 7), ('remove', 2)]
+    for action, feature in operations:
+        getattr(path, action)(feature)
+        S = path.features
+        gram = stats.sxx[np.ix_(S, S)] + 0.5 * np.eye(len(S))
+        assert np.allclose(path.L @ path.L.T, gram), f"L Lᵀ не совпадает с подблоком после {action} {feature}"
+        assert np.allclose(np.triu(path.L, 1), 0), "Разложение перестало быть треугольным"
+        assert np.allclose(path.L_inv @ path.L, np.eye(len(S))), f"L⁻¹ устарела после {action} {feature}"
+        assert np.allclose(path.weights(), engine.solve(S)[0]), f"Веса отличаются после {action} {feature}"
+    print(f"  ✓ {len(operations)} изменений набора: L Lᵀ и веса совпадают с прямым решением")
+    
+    candidates = [j for j in range(12) if j not in path.features]
+    gains = path.gains(candidates)
+    for candidate, gain in zip(candidates, gains):
+        S = path.features + [candidate]
+        weights = engine.solve(S)[0]
+        objective = engine.rss(S, weights) + 0.5 * weights @ weights
+        assert np.isclose(path.objective - gain, objective), "Выигрыш от добавления посчитан неверно"
+    losses = path.losses()
+    for feature, loss in zip(path.features, losses):
+        S = [j for j in path.features if j != feature]
+        weights = engine.solve(S)[0]
+        objective = engine.rss(S, weights) + 0.5 * weights @ weights
+        assert np.isclose(path.objective + loss, objective), "Потеря от удаления посчитана неверно"
+    print("  ✓ Оценки добавления и удаления совпадают с переобучением")
+    
+    dependent = np.column_stack([X[:, :3], X[:, 0] + X[:, 1]])
+    engine = GramEngine.from_data(dependent, y)
+    path = IncrementalCholesky(engine.stats.sxx, engine.stats.sxy, engine.stats.syy).add(0).add(1)
+    assert np.isneginf(path.gains([3])[0]), "Линейно зависимый признак должен иметь выигрыш -inf"
+    try:
+        path.add(3)
+        assert False, "Линейно зависимый признак должен вызывать ValueError"
+    except ValueError:
+        pass
+    
+    # На таких данных ведущий элемент зависимого признака остаётся на уровне округления, но положителен
+    base = np.random.default_rng(6).uniform(size=(500, 3))
+    engine = GramEngine.from_data(np.column_stack([base, base[:, 0] + base[:, 1]]), y)
+    for subset in ([0, 1, 3], [3, 2, 0, 1]):
+        try:
+            engine.solve(subset)
+            assert False, f"Подмножество {subset} с зависимым признаком должно вызывать ValueError"
+        except ValueError:
+            pass
+    assert all(not {0, 1, 3} <= set(r['features']) for r in engine.exhaustive(3)), \
+        "Полный перебор должен пропускать вырожденные подмножества"
+    print("  ✓ Линейно зависимый признак отклоняется")
+    
+    print("✅ Тест разложения Холецкого пройден\n")
+
+
+def test_selection():
+    print("Тестирование отбора признаков...")
+    
+    engine, X, y, names = housing_engine()
+    
+    history = engine.stepwise('forward', criterion='r2', max_features=5)
+    selected = []
+    for step in history:
+        remaining = [j for j in range(len(names)) if j not in selected]
+        scores = [LinearRegression().fit(X[:, selected + [j]], y).score(X[:, selected + [j]], y) for j in remaining]
+        selected.append(remaining[int(np.argmax(scores))])
+        assert step['features'] == [names[j] for j in selected], "Жадный отбор отличается от перебора с переобучением"
+        assert np.isclose(step['r2'], max(scores)), "R2 шага отличается от переобучения"
+    assert len(history) == 5, "Должно быть выбрано 5 признаков"
+    print(f"  ✓ Прямой отбор совпадает с жадным переобучением: {history[-1]['features']}")
+    
+    backward = engine.stepwise('backward', criterion='bic')
+    both = engine.stepwise('both', criterion='bic')
+    for label, steps in (('backward', backward), ('both', both)):
+        final = steps[-1]
+        model = engine.model(final['features'])
+        assert np.allclose(final['weights'], model.weights), f"Веса {label} отличаются от решения по подблоку"
+        print(f"  ✓ {label}: {len(steps)} шагов, {len(final['features'])} признаков, R2 {final['r2']:.4f}")
+    
+    best = engine.exhaustive(3, top=1)[0]
+    expected = max(combinations(range(len(names)), 3),
+                   key=lambda S: LinearRegression().fit(X[:, list(S)], y).score(X[:, list(S)], y))
+    assert best['features'] == [names[j] for j in expected], "Полный перебор нашёл не лучшее подмножество"
+    print(f"  ✓ Полный перебор {len(list(combinations(names, 3)))} подмножеств: {best['features']}")
+    
+    print("✅ Тест отбора признаков пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование движка матрицы Грама".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_subsets_match_refit()
+        test_incremental_cholesky()
+        test_selection()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ ДВИЖКА МАТРИЦЫ ГРАМА ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
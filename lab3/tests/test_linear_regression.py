@@ -0,0 +1,189 @@
+import sys
+import os
+import asyncio
+import tempfile
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data import load_housing, min_max_normalize, train_test_split
+from src.models import LinearRegression
+from common.preprocessing import Preprocessor
+from common.serving import PredictionServer
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'california_housing_train.csv')
+
+SOLVERS = ('cholesky', 'qr', 'svd')
+
+
+class NotebookLinearRegression:
+    def fit(self, X, y):
+        n_samples, n_features = X.shape
+        X_extended = np.c_[np.ones((n_samples, 1)), X]
+        theta = np.linalg.inv(X_extended.T @ X_extended) @ (X_extended.T @ y)
+        self.bias = theta[0]
+        self.weights = theta[1:]
+        return self
+
+
+def housing_split():
+    X, y, columns = load_housing(DATA_FILE)
+    X_normalized, _, _ = min_max_normalize(X)
+    X_train, X_test, y_train, y_test = train_test_split(X_normalized, y, test_size=0.2, random_state=42)
+    return X_train, X_test, y_train, y_test, columns
+
+
+def test_solvers_match_notebook():
+    print("Тестирование решателей на California Housing...")
+    
+    X_train, X_test, y_train, y_test, columns = housing_split()
+    reference = NotebookLinearRegression().fit(X_train, y_train)
+    
+    for solver in SOLVERS:
+        model = LinearRegression(solver=solver).fit(X_train, y_train)
+        assert np.allclose(model.weights, reference.weights, rtol=1e-6), f"Веса {solver} отличаются от ноутбука"
+        assert np.isclose(model.bias, reference.bias, rtol=1e-6), f"Смещение {solver} отличается от ноутбука"
+        assert 0.6 < model.score(X_test, y_test) < 0.7, f"Неожиданный R2 для {solver}"
+        print(f"  ✓ {solver}: веса совпадают с inv(XᵀX)Xᵀy, R2 на тесте {model.score(X_test, y_test):.4f}")
+    
+    chunked = LinearRegression(block_bytes=4096).fit(X_train, y_train)
+    assert np.allclose(chunked.weights, reference.weights, rtol=1e-6), "Блочная матрица Грама дала другие веса"
+    print("  ✓ Матрица Грама по блокам строк совпадает")
+    
+    print("✅ Тест решателей пройден\n")
+
+
+def test_ridge():
+    print("Тестирование ридж-регрессии...")
+    
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 8)) + 5
+    y = X @ rng.normal(size=8) + 3 + rng.normal(size=300)
+    alpha = 10.0
+    
+    Xc = X - X.mean(axis=0)
+    expected = np.linalg.solve(Xc.T @ Xc + alpha * np.eye(8), Xc.T @ (y - y.mean()))
+    for solver in SOLVERS:
+        model = LinearRegression(solver=solver, alpha=alpha).fit(X, y)
+        assert np.allclose(model.weights, expected), f"Ридж-веса {solver} неверны"
+        assert np.isclose(model.bias, y.mean() - X.mean(axis=0) @ expected), f"Смещение {solver} неверно"
+        blocked = LinearRegression(solver=solver, alpha=alpha, block_bytes=512).fit(X, y)
+        assert np.allclose(blocked.weights, expected), f"Веса {solver} не должны зависеть от размера блока"
+    print("  ✓ Все решатели дают решение (XcᵀXc + αI)⁻¹Xcᵀyc, смещение не регуляризуется")
+    print("  ✓ Результат не зависит от разбиения строк на блоки")
+    
+    try:
+        LinearRegression(alpha=-1)
+        assert False, "Отрицательный alpha должен вызывать ошибку"
+    except ValueError:
+        print("  ✓ Отрицательный alpha отклонён")
+    
+    print("✅ Тест ридж-регрессии пройден\n")
+
+
+def test_ill_conditioned():
+    print("Тестирование плохо обусловленных признаков...")
+    
+    rng = np.random.default_rng(1)
+    base = rng.normal(size=(500, 3))
+    X = np.column_stack([base, base[:, 0] + 1e-7 * rng.normal(size=500)])
+    true_weights = np.array([1.0, -2.0, 0.5, 3.0])
+    y = X @ true_weights + 4
+    
+    for solver in ('qr', 'svd'):
+        model = LinearRegression(solver=solver).fit(X, y)
+        assert np.allclose(model.predict(X), y, atol=1e-6), f"{solver} должен восстанавливать точные данные"
+    print("  ✓ QR и SVD устойчивы при почти коллинеарных признаках")
+    
+    X_dependent = np.column_stack([base, 2 * base[:, 0]])
+    y = base @ true_weights[:3] + 4
+    model = LinearRegression(solver='svd').fit(X_dependent, y)
+    assert np.allclose(model.predict(X_dependent), y), "SVD должен справляться с линейной зависимостью"
+    for solver in ('cholesky', 'qr'):
+        try:
+            LinearRegression(solver=solver).fit(X_dependent, y)
+            assert False, f"{solver} должен сообщать о вырожденности"
+        except ValueError:
+            pass
+    assert np.isfinite(LinearRegression(alpha=1e-3).fit(X_dependent, y).weights).all(), "Ридж снимает вырожденность"
+    print("  ✓ Линейно зависимые признаки: SVD решает, Холецкий и QR сообщают об ошибке")
+    
+    try:
+        LinearRegression().predict(X)
+        assert False, "Необученная модель должна вызывать ошибку"
+    except ValueError:
+        print("  ✓ predict до fit отклонён")
+    
+    print("✅ Тест плохой обусловленности пройден\n")
+
+
+def test_save_and_serve():
+    print("Тестирование сохранения и сервера предсказаний...")
+    
+    X, y, _ = load_housing(DATA_FILE)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
+    preprocessor = Preprocessor('median', 'minmax').fit(X_train)
+    X_train_scaled = preprocessor.transform(X_train)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'linear_regression')
+        for solver in SOLVERS:
+            model = LinearRegression(solver=solver, alpha=0.5).fit(X_train_scaled, y_train)
+            model.save(path)
+            loaded = LinearRegression.load(path)
+            assert loaded.solver == solver and loaded.alpha == 0.5, f"Параметры {solver} не восстановлены"
+            assert np.array_equal(loaded.weights, model.weights), f"Веса {solver} отличаются"
+            assert loaded.bias == model.bias, f"Смещение {solver} отличается"
+        print("  ✓ Веса, смещение и параметры всех решателей восстанавливаются")
+        
+        half = len(X_train_scaled) // 2
+        LinearRegression().partial_fit(X_train_scaled[:half], y_train[:half]).save(path)
+        resumed = LinearRegression.load(path).partial_fit(X_train_scaled[half:], y_train[half:])
+        full = LinearRegression().fit(X_train_scaled, y_train)
+        assert np.allclose(resumed.weights, full.weights, rtol=1e-9), "partial_fit после загрузки продолжает обучение"
+        print("  ✓ partial_fit продолжается после загрузки по сохранённым статистикам Грама")
+        
+        try:
+            LinearRegression().save(path)
+            assert False, "Сохранение необученной модели должно вызывать ValueError"
+        except ValueError:
+            pass
+    
+    async def serve():
+        async with PredictionServer(full.predict, X_test.shape[1], max_batch_size=128,
+                                    preprocessor=preprocessor) as server:
+            predictions = await asyncio.gather(*(server.predict(row) for row in X_test))
+            return np.array(predictions), server.n_batches
+    
+    predictions, n_batches = asyncio.run(serve())
+    assert np.allclose(predictions, full.predict(preprocessor.transform(X_test))), "Ответы сервера отличаются"
+    print(f"  ✓ Сервер: {len(X_test)} запросов с исходными признаками в {n_batches} пакетах")
+    
+    print("✅ Тест сохранения и сервера пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование LinearRegression".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_solvers_match_notebook()
+        test_ridge()
+        test_ill_conditioned()
+        test_save_and_serve()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ ЛИНЕЙНОЙ РЕГРЕССИИ ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,125 @@
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data import load_housing, min_max_normalize, synthetic_features, train_test_split
+from src.metrics import RegressionAccumulator, regression_metrics, streaming_regression_metrics
+from src.models import LinearRegression
+from src.streaming import evaluate_csv, fit_csv
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'california_housing_train.csv')
+
+MODEL2_FEATURES = ['median_income', 'latitude', 'longitude', 'housing_median_age']
+MODEL3_FEATURES = ['total_rooms', 'total_bedrooms', 'population', 'households', 'median_income']
+
+
+def notebook_metrics(model, X, y):
+    return {'r2': model.score(X, y), 'mse': model.mse(X, y), 'rmse': model.rmse(X, y), 'mae': model.mae(X, y)}
+
+
+def assert_metrics_close(actual, expected, label):
+    assert set(actual) == {'r2', 'mse', 'rmse', 'mae'}, f"Неожиданный набор метрик для {label}"
+    for name in expected:
+        assert np.isclose(actual[name], expected[name], rtol=1e-10), f"{name} для {label} отличается"
+
+
+def test_evaluate_matches_notebook():
+    print("Тестирование evaluate на моделях из ноутбука...")
+    
+    X, y, columns = load_housing(DATA_FILE)
+    X_normalized, _, _ = min_max_normalize(X)
+    X_train, X_test, y_train, y_test = train_test_split(X_normalized, y, test_size=0.2, random_state=42)
+    X_train_synthetic, names = synthetic_features(X_train, columns)
+    X_test_synthetic, _ = synthetic_features(X_test, columns)
+    
+    models = {
+        'model1': list(range(len(columns))),
+        'model2': [columns.index(f) for f in MODEL2_FEATURES],
+        'model3': [columns.index(f) for f in MODEL3_FEATURES],
+        'model_bonus': list(range(len(names))),
+    }
+    for label, indices in models.items():
+        train = X_train_synthetic[:, indices]
+        test = X_test_synthetic[:, indices]
+        model = LinearRegression(block_bytes=8192).fit(train, y_train)
+        for split, (X_split, y_split) in (('train', (train, y_train)), ('test', (test, y_test))):
+            assert_metrics_close(model.evaluate(X_split, y_split), notebook_metrics(model, X_split, y_split),
+                                 f"{label}/{split}")
+        print(f"  ✓ {label}: метрики на train и test совпадают с score/mse/rmse/mae")
+    
+    print("✅ Тест evaluate пройден\n")
+
+
+def test_streaming_accumulation():
+    print("Тестирование накопления метрик по частям...")
+    
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(1000, 4)) + 100
+    y = X @ rng.normal(size=4) + 1e4 + rng.normal(size=1000)
+    model = LinearRegression().fit(X, y)
+    expected = notebook_metrics(model, X, y)
+    
+    bounds = [0, 1, 2, 250, 251, 700, 1000]
+    chunks = [(X[a:b], y[a:b]) for a, b in zip(bounds[:-1], bounds[1:])]
+    assert_metrics_close(model.evaluate(iter(chunks)), expected, "итератора частей")
+    print("  ✓ evaluate по итератору частей разного размера")
+    
+    pairs = ((y_chunk, model.predict(X_chunk)) for X_chunk, y_chunk in chunks)
+    assert_metrics_close(streaming_regression_metrics(pairs), expected, "streaming_regression_metrics")
+    assert_metrics_close(regression_metrics(y, model.predict(X)), expected, "regression_metrics")
+    print("  ✓ Функции метрик по предсказаниям")
+    
+    try:
+        RegressionAccumulator().result()
+        assert False, "Пустой аккумулятор должен вызывать ValueError"
+    except ValueError:
+        pass
+    print("  ✓ Пустые данные отклоняются")
+    
+    print("✅ Тест накопления метрик пройден\n")
+
+
+def test_evaluate_csv():
+    print("Тестирование оценки модели по CSV...")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'housing.csv')
+        pd.read_csv(DATA_FILE).to_csv(path, index=False)
+        model, preprocessing = fit_csv(path, chunksize=3000)
+        metrics = evaluate_csv(model, path, preprocessing, chunksize=3000)
+    
+    X, y, _ = load_housing(DATA_FILE)
+    X_normalized, _, _ = min_max_normalize(X)
+    assert_metrics_close(metrics, notebook_metrics(model, X_normalized, y), "CSV")
+    print(f"  ✓ Метрики по частям CSV совпадают с расчётом в памяти, R2 {metrics['r2']:.4f}")
+    
+    print("✅ Тест оценки по CSV пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование метрик регрессии".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_evaluate_matches_notebook()
+        test_streaming_accumulation()
+        test_evaluate_csv()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ МЕТРИК РЕГРЕССИИ ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
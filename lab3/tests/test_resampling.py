@@ -0,0 +1,86 @@
+import sys
+import os
+from functools import partial
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from common import cross_validate, kfold_indices, resample
+from src.data import load_housing, min_max_normalize, train_test_split
+from src.models import GramStatistics, LinearRegression
+from src.resampling import cross_validate_linear
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'california_housing_train.csv')
+
+
+def test_gram_subtract():
+    print("Тестирование вычитания статистик Грама...")
+    
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(400, 5)) * [1, 10, 100, 0.1, 1] + 50
+    y = X @ rng.normal(size=5) + rng.normal(size=400)
+    total = GramStatistics.from_data(X, y)
+    part = GramStatistics.from_data(X[100:180], y[100:180])
+    rest = total.subtract(part)
+    expected = GramStatistics.from_data(np.delete(X, np.s_[100:180], axis=0), np.delete(y, np.s_[100:180]))
+    for name in ('n_samples', 'mean_x', 'mean_y', 'sxx', 'sxy', 'syy'):
+        assert np.allclose(getattr(rest, name), getattr(expected, name), rtol=1e-9), f"{name} отличается"
+    assert total.n_samples == 400, "Исходные статистики не должны меняться"
+    print("  ✓ Общие минус часть совпадают со статистиками остальных данных")
+    
+    print("✅ Тест вычитания пройден\n")
+
+
+def test_cross_validate_linear():
+    print("Тестирование кросс-валидации LinearRegression...")
+    
+    X, y, _ = load_housing(DATA_FILE)
+    X_normalized, _, _ = min_max_normalize(X)
+    splits = kfold_indices(len(X), 5, rng=42)
+    
+    fast = cross_validate_linear(X_normalized, y, splits=splits)
+    refit = resample(LinearRegression, X_normalized, y, splits, n_jobs=2)
+    for fast_fold, refit_fold in zip(fast['folds'], refit['folds']):
+        for name in ('r2', 'mse', 'rmse', 'mae'):
+            assert np.isclose(fast_fold[name], refit_fold[name], rtol=1e-8), f"{name} отличается от переобучения"
+    r2 = fast['summary']['r2']
+    print(f"  ✓ Блоки по статистикам Грама совпадают с переобучением: R2 {r2['mean']:.4f} "
+          f"[{r2['ci_low']:.4f}, {r2['ci_high']:.4f}]")
+    
+    ridge = cross_validate(partial(LinearRegression, alpha=1.0), X_normalized, y, n_splits=5, n_jobs=1, rng=42)
+    fast_ridge = cross_validate_linear(X_normalized, y, alpha=1.0, splits=splits)
+    assert np.allclose(ridge['summary']['r2']['values'], fast_ridge['summary']['r2']['values'], rtol=1e-8), \
+        "Ридж-регрессия на блоках отличается"
+    print("  ✓ Ридж-регрессия через functools.partial")
+    
+    state = np.random.get_state()[1].copy()
+    train_test_split(X_normalized, y, test_size=0.2, random_state=42)
+    assert np.array_equal(state, np.random.get_state()[1]), "train_test_split не должен менять глобальное состояние"
+    print("  ✓ train_test_split не сбрасывает глобальный генератор")
+    
+    print("✅ Тест кросс-валидации пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование ресэмплинга линейной регрессии".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_gram_subtract()
+        test_cross_validate_linear()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ РЕСЭМПЛИНГА ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,146 @@
+import sys
+import os
+import tempfile
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data import load_housing, min_max_normalize
+from src.models import LinearRegression
+from src.streaming import fit_csv, iter_csv, scan_csv
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'california_housing_train.csv')
+
+
+def _csv_with_missing(directory: str) -> str:
+    df = pd.read_csv(DATA_FILE)
+    rng = np.random.default_rng(0)
+    for column in df.columns:
+        df.loc[rng.random(len(df)) < 0.05, column] = np.nan
+    path = os.path.join(directory, 'housing_missing.csv')
+    df.to_csv(path, index=False)
+    return path
+
+
+def test_scan_statistics():
+    print("Тестирование потоковых статистик предобработки...")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        for path in (DATA_FILE, _csv_with_missing(directory)):
+            df = pd.read_csv(path)
+            X, _, columns = load_housing(path)
+            _, X_min, X_range = min_max_normalize(X)
+            
+            for max_candidates in (1 << 20, 50):
+                preprocessing = scan_csv(path, chunksize=3000, max_candidates=max_candidates)
+                assert np.array_equal(preprocessing['medians'], df.median().values), "Медианы отличаются от pandas"
+                assert np.array_equal(preprocessing['X_min'], X_min), "Минимумы отличаются"
+                assert np.array_equal(preprocessing['X_range'], X_range), "Размахи отличаются"
+                assert preprocessing['feature_columns'] == columns, "Порядок признаков отличается"
+                assert preprocessing['n_rows'] == len(df), "Неверное число строк"
+            print(f"  ✓ {os.path.basename(path)}: медианы точные (сбор и уточнение гистограммой), min/range совпадают")
+    
+    print("✅ Тест потоковых статистик пройден\n")
+
+
+def test_streaming_fit_matches_in_memory():
+    print("Тестирование потокового обучения...")
+    
+    with tempfile.TemporaryDirectory() as directory:
+        for path in (DATA_FILE, _csv_with_missing(directory)):
+            X, y, _ = load_housing(path)
+            X_normalized, _, _ = min_max_normalize(X)
+            for alpha in (0.0, 0.5):
+                expected = LinearRegression(alpha=alpha).fit(X_normalized, y)
+                model, _ = fit_csv(path, chunksize=2500, alpha=alpha)
+                assert np.allclose(model.weights, expected.weights, rtol=1e-10), "Веса отличаются"
+                assert np.isclose(model.bias, expected.bias, rtol=1e-10), "Смещение отличается"
+            print(f"  ✓ {os.path.basename(path)}: веса совпадают с обучением в памяти (alpha=0 и 0.5)")
+    
+    assert sum(len(chunk) for chunk in iter_csv(DATA_FILE, chunksize=4000)) == 17000, "Части должны покрывать файл"
+    print("  ✓ Чтение по частям покрывает весь файл")
+    
+    print("✅ Тест потокового обучения пройден\n")
+
+
+def test_partial_fit():
+    print("Тестирование partial_fit...")
+    
+    rng = np.random.default_rng(2)
+    X = rng.normal(size=(1000, 5)) * [1, 10, 100, 1e3, 1e4] + 1e5
+    y = X @ rng.normal(size=5) + rng.normal(size=1000)
+    
+    model = LinearRegression()
+    for start in range(0, 1000, 137):
+        model.partial_fit(X[start:start + 137], y[start:start + 137])
+    expected = LinearRegression().fit(X, y)
+    assert np.allclose(model.weights, expected.weights, rtol=1e-6), "partial_fit дал другие веса"
+    assert np.allclose(model.predict(X), expected.predict(X)), "Предсказания отличаются"
+    print("  ✓ Части по 137 строк со сдвинутыми средними дают те же веса")
+    
+    model.partial_fit(X[:10], y[:10])
+    assert model._weights is None, "После partial_fit система решается лениво"
+    
+    try:
+        LinearRegression(solver='qr').partial_fit(X, y)
+        assert False, "partial_fit для QR должен вызывать ошибку"
+    except ValueError:
+        print("  ✓ partial_fit доступен только для solver='cholesky'")
+    
+    print("✅ Тест partial_fit пройден\n")
+
+
+def test_cached_loader():
+    print("Тестирование загрузки через столбцовый кэш...")
+    
+    X, y, columns = load_housing(DATA_FILE)
+    with tempfile.TemporaryDirectory() as directory:
+        for _ in range(2):
+            X_cached, y_cached, cached_columns = load_housing(DATA_FILE, cache=True, cache_dir=directory)
+            assert cached_columns == columns, "Имена признаков отличаются"
+            assert np.array_equal(X_cached, X) and np.array_equal(y_cached, y), "Данные из кэша отличаются"
+        assert isinstance(y_cached, np.memmap), "Целевая переменная должна читаться через memmap"
+        print("  ✓ Построение и повторное открытие кэша дают те же данные")
+        
+        with open(os.path.join(directory, 'missing.csv'), 'w') as f:
+            f.write("a,b,median_house_value\n1,,10\n2,4,20\n3,6,\n4,5,40\n")
+        expected = load_housing(os.path.join(directory, 'missing.csv'))
+        cached = load_housing(os.path.join(directory, 'missing.csv'), cache=True,
+                              cache_dir=os.path.join(directory, 'missing'))
+        assert np.array_equal(cached[0], expected[0]) and np.array_equal(cached[1], expected[1]), \
+            "Заполнение пропусков медианой отличается"
+        print("  ✓ Пропуски заполняются медианой, как fillna(df.median())")
+        
+        X32, _, _ = load_housing(DATA_FILE, cache=True, cache_dir=os.path.join(directory, 'f32'), float_dtype='float32')
+        assert X32.dtype == np.float32 and np.allclose(X32, X, rtol=1e-6), "Кэш float32 отличается"
+        print("  ✓ Хранение в float32")
+    
+    print("✅ Тест загрузки через кэш пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование потоковой обработки".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_scan_statistics()
+        test_streaming_fit_matches_in_memory()
+        test_partial_fit()
+        test_cached_loader()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ ПОТОКОВОЙ ОБРАБОТКИ ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,150 @@
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.models import KNNClassifier
+
+DEFAULT_N_TRAIN = 200_000
+DEFAULT_N_QUERIES = 2_000
+DEFAULT_FEATURES = 32
+DEFAULT_CLASSES = 10
+DEFAULT_K = 5
+DEFAULT_N_PROBES = (1, 2, 4, 8, 16, 32)
+
+
+def make_blobs(n_samples: int, n_features: int, n_classes: int, n_clusters: int = 100,
+               seed: int = 0) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Смесь гауссовых кластеров; каждый кластер принадлежит одному классу, кластеры перекрываются
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(scale=0.9, size=(n_clusters, n_features))
+    labels = rng.integers(0, n_classes, n_clusters)
+    cluster = rng.integers(0, n_clusters, n_samples)
+    return centers[cluster] + rng.normal(size=(n_samples, n_features)), labels[cluster]
+
+
+def timed(fn: Callable[[], Any]) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def recall_at_k(found: np.ndarray, exact: np.ndarray) -> float:
+    """
+    Доля истинных k ближайших соседей, найденных приближённым поиском
+    """
+    hits = sum(len(np.intersect1d(a, b, assume_unique=True)) for a, b in zip(found, exact))
+    return hits / exact.size
+
+
+def run(n_train: int = DEFAULT_N_TRAIN, n_queries: int = DEFAULT_N_QUERIES, n_features: int = DEFAULT_FEATURES,
+        n_classes: int = DEFAULT_CLASSES, k: int = DEFAULT_K, n_lists: Sequence[Optional[int]] = (None,),
+        n_probes: Sequence[int] = DEFAULT_N_PROBES, seed: int = 0) -> Dict[str, Any]:
+    X, y = make_blobs(n_train + n_queries, n_features, n_classes, seed=seed)
+    X_train, y_train, X_test, y_test = X[:n_train], y[:n_train], X[n_train:], y[n_train:]
+    
+    exact = KNNClassifier(k, algorithm='brute').fit(X_train, y_train)
+    exact_pred, exact_s = timed(lambda: exact.predict(X_test))
+    _, exact_neighbors = exact.kneighbors(X_test)
+    report = {
+        'exact': {
+            'algorithm': exact.algorithm_,
+            'queries_per_s': n_queries / exact_s,
+            'accuracy': float(np.mean(exact_pred == y_test)),
+        },
+        'ivf': [],
+    }
+    
+    for lists in n_lists:
+        model, build_s = timed(lambda: KNNClassifier(k, algorithm='ivf', n_lists=lists).fit(X_train, y_train))
+        for n_probe in n_probes:
+            model.n_probe = n_probe
+            pred, elapsed = timed(lambda: model.predict(X_test))
+            _, neighbors = model.kneighbors(X_test)
+            report['ivf'].append({
+                'n_lists': model._index.n_lists_,
+                'n_probe': n_probe,
+                'build_s': build_s,
+                'queries_per_s': n_queries / elapsed,
+                'speedup': exact_s / elapsed,
+                'recall_at_k': recall_at_k(neighbors, exact_neighbors),
+                'agreement_with_exact': float(np.mean(pred == exact_pred)),
+                'accuracy': float(np.mean(pred == y_test)),
+            })
+    return report
+
+
+def git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def format_table(report: Dict[str, Any]) -> List[str]:
+    exact = report['exact']
+    lines = [
+        f"Точный поиск ({exact['algorithm']}): {exact['queries_per_s']:.0f} запросов/с, "
+        f"accuracy {exact['accuracy']:.4f}",
+        f"{'n_lists':>8} {'n_probe':>8} {'запр/с':>10} {'ускор.':>7} {'recall@k':>9} {'совпад.':>8} {'accuracy':>9}",
+    ]
+    for row in report['ivf']:
+        lines.append(
+            f"{row['n_lists']:>8} {row['n_probe']:>8} {row['queries_per_s']:>10.0f} {row['speedup']:>7.1f} "
+            f"{row['recall_at_k']:>9.4f} {row['agreement_with_exact']:>8.4f} {row['accuracy']:>9.4f}"
+        )
+    return lines
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Бенчмарк приближённого поиска соседей (IVF) для KNNClassifier")
+    parser.add_argument('--n-train', type=int, default=DEFAULT_N_TRAIN, help="размер обучающей выборки")
+    parser.add_argument('--n-queries', type=int, default=DEFAULT_N_QUERIES, help="число запросов")
+    parser.add_argument('--features', type=int, default=DEFAULT_FEATURES, help="размерность")
+    parser.add_argument('--classes', type=int, default=DEFAULT_CLASSES, help="число классов")
+    parser.add_argument('--k', type=int, default=DEFAULT_K, help="число соседей")
+    parser.add_argument('--n-lists', type=int, nargs='+', help="числа списков IVF (по умолчанию sqrt(n))")
+    parser.add_argument('--n-probes', type=int, nargs='+', default=list(DEFAULT_N_PROBES),
+                        help="числа просматриваемых списков")
+    parser.add_argument('--seed', type=int, default=0, help="зерно генератора данных")
+    parser.add_argument('--output', help="файл для JSON-отчёта (по умолчанию таблица в stdout)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    report = run(args.n_train, args.n_queries, args.features, args.classes, args.k,
+                 args.n_lists or [None], args.n_probes, args.seed)
+    report['meta'] = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+        'n_train': args.n_train,
+        'n_queries': args.n_queries,
+        'features': args.features,
+        'k': args.k,
+        'seed': args.seed,
+    }
+    
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(report, ensure_ascii=False, indent=2) + '\n')
+    print('\n'.join(format_table(report)))
+
+
+if __name__ == "__main__":
+    main()
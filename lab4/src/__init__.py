@@ -0,0 +1,4 @@
+from .models import KNNClassifier
+from .neighbors import BruteForceNeighbors, KDTree
+
+__all__ = ['KNNClassifier', 'BruteForceNeighbors', 'KDTree']
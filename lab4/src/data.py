@@ -0,0 +1,54 @@
+from typing import List, Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+def load_wine(path: str, target: str = 'Wine', cache: bool = False, cache_dir: Optional[str] = None,
+              float_dtype: str = 'float64') -> Tuple[np.ndarray, np.ndarray, List[str]]:
+    """
+    Загрузка датасета Wine: удаление пустых строк и разделение на признаки и метки.
+    С cache=True данные берутся из столбцового кэша common.columnar (по умолчанию рядом с CSV)
+    через memmap; метки не копируются, если удалять нечего. X и в этом случае — новая матрица:
+    столбцы кэша лежат в разных файлах.
+    """
+    if cache:
+        from common.columnar import open_csv
+        dataset = open_csv(path, cache_dir, float_dtype)
+        X_columns = [col for col in dataset.columns if col != target]
+        X = dataset.matrix(X_columns)
+        y = dataset[target]
+        complete = ~np.isnan(X).any(axis=1)
+        if y.dtype.kind == 'f':
+            complete &= ~np.isnan(y)
+        if not complete.all():
+            X, y = X[complete], y[complete]
+        return X, y, X_columns
+    
+    df = pd.read_csv(path).dropna()
+    X = df.drop(target, axis=1)
+    y = df[target]
+    return X.values, y.values, list(X.columns)
+
+
+def standardize(data: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Стандартизация данных: (x - mean) / std
+    """
+    mean = np.mean(data, axis=0)
+    std = np.std(data, axis=0)
+    return (data - mean) / std, mean, std
+
+
+def train_test_split(X: np.ndarray, y: np.ndarray, test_size: float = 0.2, random_state: int = 42):
+    # Глобальный np.random не затрагивается
+    rng = np.random.RandomState(random_state)
+    n_samples = X.shape[0]
+    n_test = int(n_samples * test_size)
+    
+    indices = np.arange(n_samples)
+    rng.shuffle(indices)
+    
+    test_indices = indices[:n_test]
+    train_indices = indices[n_test:]
+    
+    return X[train_indices], X[test_indices], y[train_indices], y[test_indices]
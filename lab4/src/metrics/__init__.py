@@ -0,0 +1,9 @@
+from .classification import (
+    ConfusionMatrixAccumulator, calculate_metrics, confusion_matrix, metrics_report, precision_recall_f1,
+    streaming_confusion_matrix,
+)
+
+__all__ = [
+    'ConfusionMatrixAccumulator', 'calculate_metrics', 'confusion_matrix', 'metrics_report', 'precision_recall_f1',
+    'streaming_confusion_matrix',
+]
@@ -0,0 +1,181 @@
+from typing import Dict, Iterable, Optional, Tuple
+import numpy as np
+
+AVERAGES = (None, 'macro', 'micro')
+
+
+def _encode(labels: np.ndarray, classes: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Номера меток в отсортированном массиве classes и маска меток, которые в нём есть
+    """
+    if len(classes) == 0:
+        return np.zeros(len(labels), dtype=np.intp), np.zeros(len(labels), dtype=bool)
+    positions = np.searchsorted(classes, labels)
+    np.minimum(positions, len(classes) - 1, out=positions)
+    return positions, classes[positions] == labels
+
+
+def _pair_counts(true_codes: np.ndarray, pred_codes: np.ndarray, n_classes: int) -> np.ndarray:
+    pairs = true_codes * n_classes + pred_codes
+    return np.bincount(pairs, minlength=n_classes * n_classes).reshape(n_classes, n_classes)
+
+
+def confusion_matrix(y_true: np.ndarray, y_pred: np.ndarray,
+                     classes: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Построение матрицы ошибок за один проход bincount по парам закодированных меток.
+    По умолчанию классы — уникальные значения y_true; предсказания других классов не учитываются.
+    """
+    y_true = np.asarray(y_true)
+    y_pred = np.asarray(y_pred)
+    if len(y_true) != len(y_pred):
+        raise ValueError("Длины y_true и y_pred не совпадают")
+    
+    if classes is None:
+        classes, true_codes = np.unique(y_true, return_inverse=True)
+        true_codes = true_codes.ravel()
+        known = np.ones(len(y_true), dtype=bool)
+    else:
+        classes = np.unique(classes)
+        true_codes, known = _encode(y_true, classes)
+    if len(classes) == 0:
+        return np.zeros((0, 0), dtype=int), classes
+    
+    pred_codes, predicted = _encode(y_pred, classes)
+    known &= predicted
+    return _pair_counts(true_codes[known], pred_codes[known], len(classes)), classes
+
+
+def _safe_divide(numerator: np.ndarray, denominator: np.ndarray) -> np.ndarray:
+    result = np.zeros(np.shape(numerator))
+    np.divide(numerator, denominator, out=result, where=denominator > 0)
+    return result
+
+
+def _f1(precision: np.ndarray, recall: np.ndarray) -> np.ndarray:
+    return _safe_divide(2 * (precision * recall), precision + recall)
+
+
+def precision_recall_f1(cm: np.ndarray, average: Optional[str] = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Precision, recall и F1 по матрице ошибок: по классам (average=None),
+    среднее по классам ('macro') или по суммарным TP/FP/FN ('micro')
+    """
+    if average not in AVERAGES:
+        raise ValueError(f"Неизвестный способ усреднения: {average}")
+    tp = np.diag(cm)
+    predicted = cm.sum(axis=0)
+    actual = cm.sum(axis=1)
+    
+    if average == 'micro':
+        precision = _safe_divide(tp.sum(), predicted.sum())
+        recall = _safe_divide(tp.sum(), actual.sum())
+        return precision, recall, _f1(precision, recall)
+    
+    precision = _safe_divide(tp, predicted)
+    recall = _safe_divide(tp, actual)
+    f1 = _f1(precision, recall)
+    if average == 'macro':
+        return precision.mean(), recall.mean(), f1.mean()
+    return precision, recall, f1
+
+
+def calculate_metrics(cm: np.ndarray) -> Tuple[float, np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Вычисление метрик качества классификации
+    """
+    # Точность (Accuracy)
+    accuracy = np.trace(cm) / np.sum(cm)
+    
+    # Precision, Recall, F1-score для каждого класса
+    precision, recall, f1 = precision_recall_f1(cm)
+    return accuracy, precision, recall, f1
+
+
+def metrics_report(cm: np.ndarray) -> Dict[str, object]:
+    """
+    Все метрики по матрице ошибок: accuracy, по классам, macro и micro
+    """
+    accuracy, precision, recall, f1 = calculate_metrics(cm)
+    report = {'accuracy': accuracy, 'precision': precision, 'recall': recall, 'f1': f1}
+    for average in ('macro', 'micro'):
+        values = precision_recall_f1(cm, average)
+        for name, value in zip(('precision', 'recall', 'f1'), values):
+            report[f'{name}_{average}'] = float(value)
+    return report
+
+
+class ConfusionMatrixAccumulator:
+    """
+    Матрица ошибок, накапливаемая по частям предсказаний. Если классы не заданы заранее,
+    матрица расширяется по мере появления новых меток; итог совпадает с confusion_matrix
+    по всем частям сразу.
+    """
+    
+    def __init__(self, classes: Optional[np.ndarray] = None):
+        self.fixed = classes is not None
+        self.classes = np.unique(classes) if self.fixed else None
+        self.counts = np.zeros((len(self.classes),) * 2, dtype=np.int64) if self.fixed else None
+        self.seen_true = None
+        self.n_samples = 0
+    
+    def _grow(self, labels: np.ndarray):
+        labels = np.unique(labels)
+        if self.classes is None:
+            self.classes = labels
+            self.counts = np.zeros((len(labels), len(labels)), dtype=np.int64)
+            self.seen_true = np.zeros(len(labels), dtype=bool)
+            return
+        classes = np.union1d(self.classes, labels)
+        if len(classes) == len(self.classes):
+            return
+        positions = np.searchsorted(classes, self.classes)
+        counts = np.zeros((len(classes), len(classes)), dtype=np.int64)
+        counts[np.ix_(positions, positions)] = self.counts
+        seen_true = np.zeros(len(classes), dtype=bool)
+        seen_true[positions] = self.seen_true
+        self.classes, self.counts, self.seen_true = classes, counts, seen_true
+    
+    def update(self, y_true: np.ndarray, y_pred: np.ndarray) -> 'ConfusionMatrixAccumulator':
+        y_true = np.asarray(y_true)
+        y_pred = np.asarray(y_pred)
+        if len(y_true) != len(y_pred):
+            raise ValueError("Длины y_true и y_pred не совпадают")
+        if len(y_true) == 0:
+            return self
+        
+        if not self.fixed:
+            self._grow(np.concatenate([np.unique(y_true), np.unique(y_pred)]))
+        true_codes, known = _encode(y_true, self.classes)
+        pred_codes, predicted = _encode(y_pred, self.classes)
+        if not self.fixed:
+            self.seen_true[np.unique(true_codes)] = True
+        known &= predicted
+        self.counts += _pair_counts(true_codes[known], pred_codes[known], len(self.classes))
+        self.n_samples += len(y_true)
+        return self
+    
+    def result(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Матрица ошибок и классы в формате confusion_matrix
+        """
+        if self.classes is None:
+            return np.zeros((0, 0), dtype=np.int64), np.array([])
+        if self.fixed:
+            return self.counts.copy(), self.classes
+        mask = self.seen_true
+        return self.counts[np.ix_(mask, mask)], self.classes[mask]
+    
+    def metrics(self) -> Dict[str, object]:
+        return metrics_report(self.result()[0])
+
+
+def streaming_confusion_matrix(chunks: Iterable[Tuple[np.ndarray, np.ndarray]],
+                               classes: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Матрица ошибок по итератору пар (y_true, y_pred) без загрузки всех предсказаний в память
+    """
+    accumulator = ConfusionMatrixAccumulator(classes)
+    for y_true, y_pred in chunks:
+        accumulator.update(y_true, y_pred)
+    return accumulator.result()
@@ -0,0 +1,3 @@
+from .knn_classifier import KNNClassifier, majority_vote, prefix_votes
+
+__all__ = ['KNNClassifier', 'majority_vote', 'prefix_votes']
@@ -0,0 +1,191 @@
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+import numpy as np
+
+from src.metrics import calculate_metrics, confusion_matrix
+from src.neighbors import (
+    ALGORITHMS, BruteForceNeighbors, IVFIndex, KDTree, QuantizedNeighbors, build_index, select_algorithm,
+)
+from src.neighbors.brute import DEFAULT_BLOCK_BYTES
+from src.neighbors.ivf import DEFAULT_N_PROBE
+from src.neighbors.kd_tree import DEFAULT_LEAF_SIZE
+from src.neighbors.quantized import STORAGES
+
+INDEX_CLASSES = {cls.__name__: cls for cls in (BruteForceNeighbors, KDTree, IVFIndex, QuantizedNeighbors)}
+
+
+def majority_vote(neighbor_labels: np.ndarray, n_classes: int) -> np.ndarray:
+    """
+    Голосование по меткам соседей, упорядоченных по расстоянию.
+    При равенстве голосов побеждает класс, раньше встретившийся среди соседей
+    (как max(counts, key=counts.get) по словарю в порядке вставки).
+    """
+    m, k = neighbor_labels.shape
+    rows = np.arange(m)
+    flat = (rows[:, None] * n_classes + neighbor_labels).ravel()
+    counts = np.bincount(flat, minlength=m * n_classes).reshape(m, n_classes)
+    
+    first_seen = np.full((m, n_classes), k)
+    for position in range(k - 1, -1, -1):
+        first_seen[rows, neighbor_labels[:, position]] = position
+    
+    return np.argmax(counts * (k + 1) - first_seen, axis=1)
+
+
+def prefix_votes(neighbor_labels: np.ndarray, n_classes: int, ks: Iterable[int]) -> Dict[int, np.ndarray]:
+    """
+    Результат majority_vote для каждого k по первым k столбцам одного отсортированного списка соседей.
+    Счётчики голосов накапливаются от меньшего k к большему, позиции первого появления
+    класса общие для всех префиксов.
+    """
+    m, width = neighbor_labels.shape
+    rows = np.arange(m)
+    
+    first_seen = np.full((m, n_classes), width)
+    for position in range(width - 1, -1, -1):
+        first_seen[rows, neighbor_labels[:, position]] = position
+    
+    counts = np.zeros((m, n_classes), dtype=np.intp)
+    done = 0
+    winners = {}
+    for k in sorted(set(ks)):
+        prefix = min(k, width)
+        for position in range(done, prefix):
+            counts[rows, neighbor_labels[:, position]] += 1
+        done = prefix
+        winners[k] = np.argmax(counts * (width + 1) - first_seen, axis=1)
+    return winners
+
+
+class KNNClassifier:
+    def __init__(self, k: int = 3, algorithm: str = 'auto', block_bytes: int = DEFAULT_BLOCK_BYTES,
+                 leaf_size: int = DEFAULT_LEAF_SIZE, n_lists: Optional[int] = None, n_probe: int = DEFAULT_N_PROBE,
+                 storage: str = 'float64', rerank: bool = False):
+        if k < 1:
+            raise ValueError("k должно быть положительным")
+        if algorithm not in ALGORITHMS:
+            raise ValueError(f"Неизвестный алгоритм поиска соседей: {algorithm}")
+        if storage not in STORAGES:
+            raise ValueError(f"Неподдерживаемый тип хранения: {storage}")
+        if storage != 'float64' and algorithm not in ('auto', 'brute'):
+            raise ValueError("Сжатое хранение поддерживается только для полного перебора")
+        self.k = k
+        self.algorithm = algorithm
+        self.block_bytes = block_bytes
+        self.leaf_size = leaf_size
+        # Параметры приближённого поиска algorithm='ivf'; n_probe можно менять после fit()
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        # Хранение обучающей выборки для поиска: копия в 'float32' или 'int8' (в 2 и 8 раз меньше float64).
+        # rerank уточняет k ближайших по исходной матрице float64, которая тогда тоже удерживается:
+        # экономия памяти сохраняется, только если X_train передана как memmap
+        self.storage = storage
+        self.rerank = rerank
+        self.algorithm_ = None
+        self.X_train = None
+        self.y_train = None
+        self.classes_ = None
+        self._y_encoded = None
+        self._index = None
+    
+    def fit(self, X_train: np.ndarray, y_train: np.ndarray) -> 'KNNClassifier':
+        X_train = np.asarray(X_train, dtype=np.float64)
+        y_train = np.asarray(y_train)
+        if len(X_train) != len(y_train):
+            raise ValueError("Число объектов и меток не совпадает")
+        
+        # Без переранжирования сжатому индексу исходная матрица не нужна и не удерживается
+        self.X_train = X_train if self.storage == 'float64' or self.rerank else None
+        self.y_train = y_train
+        self.classes_, self._y_encoded = np.unique(y_train, return_inverse=True)
+        self.algorithm_ = self.algorithm
+        if self.algorithm_ == 'auto':
+            self.algorithm_ = select_algorithm(*X_train.shape) if self.storage == 'float64' else 'brute'
+        self._index = build_index(X_train, self.algorithm_, self.block_bytes, self.leaf_size,
+                                  self.n_lists, self.n_probe, self.storage, self.rerank)
+        return self
+    
+    def _check_fitted(self):
+        if self._index is None:
+            raise RuntimeError("Модель не обучена: вызовите fit()")
+    
+    def kneighbors(self, X: np.ndarray, k: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        self._check_fitted()
+        if self.algorithm_ == 'ivf':
+            return self._index.kneighbors(X, k or self.k, self.n_probe)
+        return self._index.kneighbors(X, k or self.k)
+    
+    def radius_neighbors(self, X: np.ndarray, radius: float) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        self._check_fitted()
+        if self.algorithm_ == 'ivf':
+            return self._index.query_radius(X, radius, self.n_probe)
+        return self._index.query_radius(X, radius)
+    
+    def predict(self, X_test: np.ndarray) -> np.ndarray:
+        _, indices = self.kneighbors(X_test)
+        winners = majority_vote(self._y_encoded[indices], len(self.classes_))
+        return self.classes_[winners]
+    
+    def predict_multi_k(self, X_test: np.ndarray, ks: Iterable[int]) -> Dict[int, np.ndarray]:
+        """
+        Предсказания для нескольких k за один поиск max(ks) ближайших соседей
+        """
+        ks = list(ks)
+        if not ks or min(ks) < 1:
+            raise ValueError("k должно быть положительным")
+        _, indices = self.kneighbors(X_test, max(ks))
+        winners = prefix_votes(self._y_encoded[indices], len(self.classes_), ks)
+        return {k: self.classes_[winners[k]] for k in ks}
+    
+    def evaluate_k_grid(self, X_test: np.ndarray, y_test: np.ndarray,
+                        ks: Iterable[int]) -> Dict[int, Dict[str, Any]]:
+        """
+        Метрики для каждого k в формате model1_results/model2_results из ноутбука
+        """
+        results = {}
+        for k, y_pred in self.predict_multi_k(X_test, ks).items():
+            cm, _ = confusion_matrix(y_test, y_pred)
+            accuracy, precision, recall, f1 = calculate_metrics(cm)
+            results[k] = {
+                'accuracy': accuracy,
+                'precision': precision,
+                'recall': recall,
+                'f1': f1,
+                'confusion_matrix': cm,
+                'predictions': y_pred
+            }
+        return results
+    
+    def score(self, X_test: np.ndarray, y_test: np.ndarray) -> float:
+        predictions = self.predict(X_test)
+        accuracy = np.sum(predictions == y_test) / len(y_test)
+        return accuracy
+    
+    def save(self, directory: str):
+        """
+        Сохранение в каталог: параметры, обучающая выборка, метки и массивы построенного индекса
+        (обучающая матрица, общая с индексом, записывается один раз)
+        """
+        from common.serialization import save_model, split_state
+        self._check_fitted()
+        params, arrays = split_state(self, exclude=('_index',))
+        index_params, index_arrays = split_state(self._index)
+        params['index'] = {'class': type(self._index).__name__, 'params': index_params}
+        arrays.update({f'index.{name}': value for name, value in index_arrays.items()})
+        save_model(directory, type(self).__name__, params, arrays)
+    
+    @classmethod
+    def load(cls, directory: str, mmap: bool = True) -> 'KNNClassifier':
+        """
+        Модель из каталога save(); при mmap=True обучающая выборка и индекс не читаются в память,
+        а отображаются из файлов
+        """
+        from common.serialization import load_model, restore_state
+        kind, params, arrays = load_model(directory, mmap)
+        if kind != cls.__name__:
+            raise ValueError(f"В каталоге сохранена модель {kind}, а не {cls.__name__}")
+        index = params.pop('index')
+        index_arrays = {name[len('index.'):]: value for name, value in arrays.items() if name.startswith('index.')}
+        model_arrays = {name: value for name, value in arrays.items() if not name.startswith('index.')}
+        model = restore_state(cls, params, model_arrays)
+        model._index = restore_state(INDEX_CLASSES[index['class']], index['params'], index_arrays)
+        return model
@@ -0,0 +1,7 @@
+from .auto import ALGORITHMS, build_index, select_algorithm
+from .brute import BruteForceNeighbors
+from .ivf import IVFIndex
+from .kd_tree import KDTree
+from .quantized import QuantizedNeighbors, ScalarQuantizer
+
+__all__ = ['ALGORITHMS', 'BruteForceNeighbors', 'IVFIndex', 'KDTree', 'QuantizedNeighbors', 'ScalarQuantizer', 'build_index', 'select_algorithm']
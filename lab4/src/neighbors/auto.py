@@ -0,0 +1,48 @@
+from typing import Optional
+import numpy as np
+
+from .brute import BruteForceNeighbors, DEFAULT_BLOCK_BYTES
+from .ivf import DEFAULT_N_PROBE, IVFIndex
+from .kd_tree import KDTree, DEFAULT_LEAF_SIZE
+from .quantized import QuantizedNeighbors, STORAGES
+
+# 'ivf' — приближённый поиск, только по явному выбору; 'auto' выбирает среди точных
+ALGORITHMS = ('auto', 'brute', 'kd_tree', 'ivf')
+
+# KD-дерево окупается в малой размерности и на больших выборках: число просматриваемых
+# листьев растёт примерно как 2^d, а перебор линеен по числу обучающих объектов
+AUTO_MAX_FEATURES = 10
+AUTO_MIN_SAMPLES = 20000
+AUTO_SAMPLES_PER_CELL = 64
+
+
+def select_algorithm(n_samples: int, n_features: int) -> str:
+    """
+    Выбор между полным перебором и KD-деревом по размеру и размерности выборки
+    """
+    if n_features > AUTO_MAX_FEATURES:
+        return 'brute'
+    if n_samples < max(AUTO_MIN_SAMPLES, AUTO_SAMPLES_PER_CELL * 2 ** n_features):
+        return 'brute'
+    return 'kd_tree'
+
+
+def build_index(X_train: np.ndarray, algorithm: str = 'auto', block_bytes: int = DEFAULT_BLOCK_BYTES,
+                leaf_size: int = DEFAULT_LEAF_SIZE, n_lists: Optional[int] = None, n_probe: int = DEFAULT_N_PROBE,
+                storage: str = 'float64', rerank: bool = False):
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Неизвестный алгоритм поиска соседей: {algorithm}")
+    if storage not in STORAGES:
+        raise ValueError(f"Неподдерживаемый тип хранения: {storage}")
+    X_train = np.asarray(X_train, dtype=np.float64)
+    if storage != 'float64':
+        if algorithm not in ('auto', 'brute'):
+            raise ValueError("Сжатое хранение поддерживается только для полного перебора")
+        return QuantizedNeighbors(storage, rerank, block_bytes=block_bytes).fit(X_train)
+    if algorithm == 'auto':
+        algorithm = select_algorithm(*X_train.shape) if X_train.ndim == 2 else 'brute'
+    if algorithm == 'kd_tree':
+        return KDTree(leaf_size).fit(X_train)
+    if algorithm == 'ivf':
+        return IVFIndex(n_lists, n_probe, block_bytes=block_bytes).fit(X_train)
+    return BruteForceNeighbors(block_bytes).fit(X_train)
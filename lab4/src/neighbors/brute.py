@@ -0,0 +1,121 @@
+from typing import List, Tuple
+import numpy as np
+
+DEFAULT_BLOCK_BYTES = 64 * 1024 * 1024
+
+EPS = np.finfo(np.float64).eps
+
+
+def exact_distances(Q: np.ndarray, X_train: np.ndarray, candidates: np.ndarray,
+                    block_bytes: int = DEFAULT_BLOCK_BYTES) -> np.ndarray:
+    """
+    Евклидовы расстояния sqrt(sum((x - xi) ** 2)) от каждой строки Q до её кандидатов
+    """
+    m, width = candidates.shape
+    distances = np.empty((m, width))
+    rows = max(1, block_bytes // (8 * max(1, width * X_train.shape[1])))
+    for start in range(0, m, rows):
+        stop = min(m, start + rows)
+        diff = Q[start:stop, None, :] - X_train[candidates[start:stop]]
+        distances[start:stop] = np.sqrt(np.sum(diff ** 2, axis=2))
+    return distances
+
+
+class BruteForceNeighbors:
+    """
+    Точный поиск ближайших соседей полным перебором.
+    Блоки расстояний query×train считаются через ||a||² + ||b||² - 2ab, кандидаты отбираются
+    argpartition с запасом на ошибку округления, а итоговый порядок определяется точными
+    расстояниями с разрешением равенств по индексу обучающего объекта.
+    """
+    
+    def __init__(self, block_bytes: int = DEFAULT_BLOCK_BYTES):
+        self.block_bytes = block_bytes
+        self.X_train = None
+        self.norms = None
+    
+    def fit(self, X_train: np.ndarray) -> 'BruteForceNeighbors':
+        X_train = np.ascontiguousarray(X_train, dtype=np.float64)
+        if X_train.ndim != 2 or len(X_train) == 0:
+            raise ValueError("Обучающая выборка должна быть непустой матрицей")
+        self.X_train = X_train
+        self.norms = np.einsum('ij,ij->i', X_train, X_train)
+        self.max_norm = float(self.norms.max())
+        return self
+    
+    def kneighbors(self, X: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        n_train = len(self.X_train)
+        k = min(k, n_train)
+        
+        distances = np.empty((len(X), k))
+        indices = np.empty((len(X), k), dtype=np.intp)
+        
+        # Два временных массива размера rows×n_train на блок
+        rows = max(1, self.block_bytes // (16 * n_train))
+        for start in range(0, len(X), rows):
+            stop = min(len(X), start + rows)
+            distances[start:stop], indices[start:stop] = self._kneighbors_block(X[start:stop], k)
+        return distances, indices
+    
+    def query_radius(self, X: np.ndarray, radius: float) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        distances, indices = [], []
+        rows = max(1, self.block_bytes // (16 * len(self.X_train)))
+        for start in range(0, len(X), rows):
+            Q = X[start:start + rows]
+            q_norms = np.einsum('ij,ij->i', Q, Q)
+            D = Q @ self.X_train.T
+            D *= -2.0
+            D += q_norms[:, None]
+            D += self.norms[None, :]
+            margin = 2 * (2 * Q.shape[1] + 8) * EPS * (q_norms + self.max_norm)
+            
+            for row, limit in enumerate(radius ** 2 + margin):
+                candidates = np.flatnonzero(D[row] <= limit)
+                diff = Q[row] - self.X_train[candidates]
+                exact = np.sqrt(np.sum(diff ** 2, axis=1))
+                inside = exact <= radius
+                candidates, exact = candidates[inside], exact[inside]
+                order = np.lexsort((candidates, exact))
+                distances.append(exact[order])
+                indices.append(candidates[order])
+        return distances, indices
+    
+    def _kneighbors_block(self, Q: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        q_norms = np.einsum('ij,ij->i', Q, Q)
+        
+        D = Q @ self.X_train.T
+        D *= -2.0
+        D += q_norms[:, None]
+        D += self.norms[None, :]
+        
+        margin = 2 * (2 * Q.shape[1] + 8) * EPS * (q_norms + self.max_norm)
+        candidates = self._candidates(D, k, margin)
+        del D
+        
+        exact = exact_distances(Q, self.X_train, candidates, self.block_bytes)
+        order = np.lexsort((candidates, exact), axis=1)[:, :k]
+        return np.take_along_axis(exact, order, axis=1), np.take_along_axis(candidates, order, axis=1)
+    
+    @staticmethod
+    def _candidates(D: np.ndarray, k: int, margin: np.ndarray) -> np.ndarray:
+        n_train = D.shape[1]
+        width = min(n_train, 2 * k + 8)
+        if width == n_train:
+            return np.broadcast_to(np.arange(n_train), D.shape)
+        
+        candidates = np.argpartition(D, width - 1, axis=1)[:, :width]
+        values = np.sort(np.take_along_axis(D, candidates, axis=1), axis=1)
+        # Все точки вне набора не ближе values[:, -1]; если это за порогом, равные
+        # с точностью до ошибки округления кандидаты уже в наборе
+        unsafe = np.flatnonzero(values[:, -1] <= values[:, k - 1] + margin)
+        if len(unsafe) == 0:
+            return candidates
+        
+        threshold = values[unsafe, k - 1] + margin[unsafe]
+        width = int(np.count_nonzero(D[unsafe] <= threshold[:, None], axis=1).max())
+        if width >= n_train:
+            return np.broadcast_to(np.arange(n_train), D.shape)
+        wide = np.argpartition(D, width - 1, axis=1)[:, :width]
+        return wide
@@ -0,0 +1,177 @@
+from typing import List, Optional, Tuple
+import numpy as np
+
+from .brute import DEFAULT_BLOCK_BYTES
+from .kd_tree import _group_starts, _top_k
+
+DEFAULT_N_PROBE = 8
+DEFAULT_N_ITER = 10
+# Центроиды обучаются на подвыборке: столько точек на список достаточно для устойчивого k-means
+TRAIN_POINTS_PER_LIST = 64
+
+
+def _squared_distances(Q: np.ndarray, q_norms: np.ndarray, X: np.ndarray, x_norms: np.ndarray) -> np.ndarray:
+    D = Q @ X.T
+    D *= -2.0
+    D += q_norms[:, None]
+    D += x_norms[None, :]
+    return D
+
+
+def kmeans(X: np.ndarray, n_clusters: int, n_iter: int = DEFAULT_N_ITER, seed: int = 0,
+           block_bytes: int = DEFAULT_BLOCK_BYTES) -> np.ndarray:
+    """
+    Центроиды алгоритмом Ллойда из случайных точек X; опустевший кластер получает случайную точку
+    """
+    rng = np.random.default_rng(seed)
+    centroids = X[rng.choice(len(X), n_clusters, replace=False)].copy()
+    for _ in range(n_iter):
+        labels = assign(X, centroids, block_bytes)
+        counts = np.bincount(labels, minlength=n_clusters)
+        sums = np.zeros_like(centroids)
+        np.add.at(sums, labels, X)
+        empty = counts == 0
+        centroids[~empty] = sums[~empty] / counts[~empty, None]
+        if empty.any():
+            centroids[empty] = X[rng.choice(len(X), int(empty.sum()), replace=False)]
+    return centroids
+
+
+def assign(X: np.ndarray, centroids: np.ndarray, block_bytes: int = DEFAULT_BLOCK_BYTES) -> np.ndarray:
+    """
+    Номер ближайшего центроида для каждой строки X, блоками строк
+    """
+    c_norms = np.einsum('ij,ij->i', centroids, centroids)
+    labels = np.empty(len(X), dtype=np.intp)
+    rows = max(1, block_bytes // (8 * len(centroids)))
+    for start in range(0, len(X), rows):
+        block = X[start:start + rows]
+        D = _squared_distances(block, np.einsum('ij,ij->i', block, block), centroids, c_norms)
+        labels[start:start + rows] = np.argmin(D, axis=1)
+    return labels
+
+
+class IVFIndex:
+    """
+    Приближённый поиск соседей с инвертированными списками (IVF): k-means разбивает обучающую
+    выборку на n_lists ячеек, запрос просматривает только n_probe ячеек с ближайшими центроидами.
+    Больше n_probe — выше полнота и медленнее поиск; n_probe = n_lists даёт точный результат.
+    Найденные кандидаты ранжируются по точным расстояниям, при равенстве — по индексу.
+    """
+    
+    def __init__(self, n_lists: Optional[int] = None, n_probe: int = DEFAULT_N_PROBE, n_iter: int = DEFAULT_N_ITER,
+                 seed: int = 0, block_bytes: int = DEFAULT_BLOCK_BYTES):
+        if n_lists is not None and n_lists < 1:
+            raise ValueError("Число списков должно быть положительным")
+        if n_probe < 1:
+            raise ValueError("Число просматриваемых списков должно быть положительным")
+        self.n_lists = n_lists
+        self.n_probe = n_probe
+        self.n_iter = n_iter
+        self.seed = seed
+        self.block_bytes = block_bytes
+        self.centroids = None
+        self.data = None
+        self.order = None
+    
+    def fit(self, X_train: np.ndarray) -> 'IVFIndex':
+        X_train = np.ascontiguousarray(X_train, dtype=np.float64)
+        if X_train.ndim != 2 or len(X_train) == 0:
+            raise ValueError("Обучающая выборка должна быть непустой матрицей")
+        n_samples = len(X_train)
+        n_lists = min(self.n_lists or max(1, int(np.sqrt(n_samples))), n_samples)
+        
+        rng = np.random.default_rng(self.seed)
+        sample_size = min(n_samples, n_lists * TRAIN_POINTS_PER_LIST)
+        sample = X_train[np.sort(rng.choice(n_samples, sample_size, replace=False))]
+        self.centroids = kmeans(sample, n_lists, self.n_iter, self.seed, self.block_bytes)
+        self.centroid_norms = np.einsum('ij,ij->i', self.centroids, self.centroids)
+        
+        labels = assign(X_train, self.centroids, self.block_bytes)
+        # Точки одного списка лежат подряд: data[starts[l]:starts[l] + counts[l]]
+        self.order = np.argsort(labels, kind='stable')
+        self.data = X_train[self.order]
+        self.norms = np.einsum('ij,ij->i', self.data, self.data)
+        self.counts = np.bincount(labels, minlength=n_lists)
+        self.starts = np.cumsum(self.counts) - self.counts
+        self.n_lists_ = n_lists
+        return self
+    
+    def _probes(self, Q: np.ndarray, q_norms: np.ndarray, n_probe: int,
+                min_points: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Пары (запрос, список), отсортированные по списку. Каждый запрос просматривает n_probe ближайших
+        списков, но не меньше, чем нужно, чтобы набрать min_points точек.
+        """
+        D = _squared_distances(Q, q_norms, self.centroids, self.centroid_norms)
+        ranked = np.argsort(D, axis=1)
+        covered = np.cumsum(self.counts[ranked], axis=1)
+        needed = np.sum(covered < min_points, axis=1) + 1
+        width = np.minimum(np.maximum(needed, n_probe), self.n_lists_)
+        queries, slots = np.nonzero(np.arange(width.max()) < width[:, None])
+        lists = ranked[queries, slots]
+        by_list = np.argsort(lists, kind='stable')
+        return queries[by_list], lists[by_list]
+    
+    def _block_rows(self, k: int, n_probe: int) -> int:
+        n_probe = min(n_probe, self.n_lists_)
+        per_query = n_probe * max(k, len(self.data) // self.n_lists_)
+        return max(1, self.block_bytes // (24 * per_query))
+    
+    def kneighbors(self, X: np.ndarray, k: int, n_probe: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        k = min(k, len(self.data))
+        n_probe = n_probe or self.n_probe
+        distances = np.empty((len(X), k))
+        indices = np.empty((len(X), k), dtype=np.intp)
+        rows = self._block_rows(k, n_probe)
+        for start in range(0, len(X), rows):
+            stop = min(len(X), start + rows)
+            distances[start:stop], positions = self._kneighbors_block(X[start:stop], k, n_probe)
+            indices[start:stop] = self.order[positions]
+        return distances, indices
+    
+    def _kneighbors_block(self, Q: np.ndarray, k: int, n_probe: int) -> Tuple[np.ndarray, np.ndarray]:
+        q_norms = np.einsum('ij,ij->i', Q, Q)
+        queries, lists = self._probes(Q, q_norms, n_probe, k)
+        
+        candidate_queries, candidate_positions = [], []
+        for group in np.split(np.arange(len(lists)), _group_starts(lists)[1:]):
+            rows = queries[group]
+            lo = self.starts[lists[group[0]]]
+            hi = lo + self.counts[lists[group[0]]]
+            D = _squared_distances(Q[rows], q_norms[rows], self.data[lo:hi], self.norms[lo:hi])
+            # Из каждого списка достаточно k лучших по приближённой формуле; порядок уточняется ниже
+            width = min(k, hi - lo)
+            if width < hi - lo:
+                best = np.argpartition(D, width - 1, axis=1)[:, :width]
+            else:
+                best = np.broadcast_to(np.arange(hi - lo), D.shape)
+            candidate_queries.append(np.repeat(rows, width))
+            candidate_positions.append((best + lo).ravel())
+        
+        candidate_queries = np.concatenate(candidate_queries)
+        candidate_positions = np.concatenate(candidate_positions)
+        diff = Q[candidate_queries] - self.data[candidate_positions]
+        exact = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+        return _top_k(candidate_queries, candidate_positions, exact, self.order, len(Q), k)
+    
+    def query_radius(self, X: np.ndarray, radius: float,
+                     n_probe: Optional[int] = None) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """
+        Точки в радиусе radius среди просмотренных списков, по возрастанию (расстояние, индекс)
+        """
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        n_probe = n_probe or self.n_probe
+        distances, indices = [], []
+        for row in X:
+            _, lists = self._probes(row[None, :], np.array([row @ row]), n_probe, 0)
+            positions = np.concatenate([np.arange(self.starts[l], self.starts[l] + self.counts[l]) for l in lists])
+            diff = row - self.data[positions]
+            exact = np.sqrt(np.einsum('ij,ij->i', diff, diff))
+            inside = exact <= radius
+            found, exact = self.order[positions[inside]], exact[inside]
+            ranked = np.lexsort((found, exact))
+            distances.append(exact[ranked])
+            indices.append(found[ranked])
+        return distances, indices
@@ -0,0 +1,243 @@
+from typing import List, Tuple
+import numpy as np
+
+DEFAULT_LEAF_SIZE = 32
+DEFAULT_BLOCK_QUERIES = 1024
+
+# Относительный запас при отсечении узлов, чтобы округление не отбрасывало равноудалённые точки
+PRUNE_TOLERANCE = 1e-9
+
+
+def _group_starts(groups: np.ndarray) -> np.ndarray:
+    starts = np.ones(len(groups), dtype=bool)
+    starts[1:] = groups[1:] != groups[:-1]
+    return np.flatnonzero(starts)
+
+
+def _with_tolerance(bounds: np.ndarray) -> np.ndarray:
+    return bounds + PRUNE_TOLERANCE * (1.0 + bounds)
+
+
+def _top_k(queries: np.ndarray, positions: np.ndarray, distances: np.ndarray, order: np.ndarray,
+           m: int, k: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    k ближайших кандидатов каждого запроса: по расстоянию, при равенстве по индексу обучающего объекта.
+    У каждого из m запросов должно быть не меньше k кандидатов.
+    """
+    ranked = np.lexsort((order[positions], distances, queries))
+    take = (_group_starts(queries[ranked])[:, None] + np.arange(k)).ravel()
+    ranked = ranked[take]
+    return distances[ranked].reshape(m, k), positions[ranked].reshape(m, k)
+
+
+def _expand_ranges(starts: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    """
+    Конкатенация диапазонов [start, start + count) без цикла Python
+    """
+    total = int(counts.sum())
+    if total == 0:
+        return np.empty(0, dtype=np.intp)
+    offsets = np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(starts, counts) + (np.arange(total) - offsets)
+
+
+class KDTree:
+    """
+    KD-дерево в виде плоских массивов: узел i покрывает точки data[start[i]:end[i]],
+    потомки left[i]/right[i] (-1 у листьев), ограничивающий параллелепипед lower[i]/upper[i].
+    Запросы обрабатываются пачками: все пары (запрос, узел) одного уровня отсекаются разом.
+    """
+    
+    def __init__(self, leaf_size: int = DEFAULT_LEAF_SIZE, block_queries: int = DEFAULT_BLOCK_QUERIES):
+        if leaf_size < 1:
+            raise ValueError("Размер листа должен быть положительным")
+        self.leaf_size = leaf_size
+        self.block_queries = block_queries
+        self.data = None
+        self.order = None
+    
+    def fit(self, X_train: np.ndarray) -> 'KDTree':
+        X_train = np.asarray(X_train, dtype=np.float64)
+        if X_train.ndim != 2 or len(X_train) == 0:
+            raise ValueError("Обучающая выборка должна быть непустой матрицей")
+        
+        n_samples = len(X_train)
+        order = np.arange(n_samples)
+        start, end, left, right, split_dim, split_val = [], [], [], [], [], []
+        stack = [(0, n_samples, -1, False)]
+        
+        while stack:
+            lo, hi, parent, is_right = stack.pop()
+            node = len(start)
+            start.append(lo)
+            end.append(hi)
+            left.append(-1)
+            right.append(-1)
+            split_dim.append(0)
+            split_val.append(0.0)
+            if parent >= 0:
+                (right if is_right else left)[parent] = node
+            
+            if hi - lo <= self.leaf_size:
+                continue
+            
+            points = X_train[order[lo:hi]]
+            spread = points.max(axis=0) - points.min(axis=0)
+            dim = int(np.argmax(spread))
+            if spread[dim] == 0:
+                continue
+            
+            mid = (hi - lo) // 2
+            local = np.argpartition(points[:, dim], mid)
+            order[lo:hi] = order[lo:hi][local]
+            split_dim[node] = dim
+            split_val[node] = float(X_train[order[lo + mid], dim])
+            stack.append((lo + mid, hi, node, True))
+            stack.append((lo, lo + mid, node, False))
+        
+        self.order = order
+        self.data = np.ascontiguousarray(X_train[order])
+        self.start = np.asarray(start, dtype=np.intp)
+        self.end = np.asarray(end, dtype=np.intp)
+        self.left = np.asarray(left, dtype=np.intp)
+        self.right = np.asarray(right, dtype=np.intp)
+        self.split_dim = np.asarray(split_dim, dtype=np.intp)
+        self.split_val = np.asarray(split_val)
+        
+        n_nodes = len(start)
+        self.lower = np.empty((n_nodes, X_train.shape[1]))
+        self.upper = np.empty((n_nodes, X_train.shape[1]))
+        for node in range(n_nodes - 1, -1, -1):
+            if self.left[node] < 0:
+                points = self.data[self.start[node]:self.end[node]]
+                self.lower[node] = points.min(axis=0)
+                self.upper[node] = points.max(axis=0)
+            else:
+                children = [self.left[node], self.right[node]]
+                self.lower[node] = self.lower[children].min(axis=0)
+                self.upper[node] = self.upper[children].max(axis=0)
+        return self
+    
+    @property
+    def n_nodes(self) -> int:
+        return len(self.start)
+    
+    def _box_distance(self, Q: np.ndarray, queries: np.ndarray, nodes: np.ndarray) -> np.ndarray:
+        points = Q[queries]
+        gap = np.maximum(self.lower[nodes] - points, 0) + np.maximum(points - self.upper[nodes], 0)
+        return np.sqrt(np.sum(gap ** 2, axis=1))
+    
+    def _pair_distances(self, Q: np.ndarray, queries: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        diff = Q[queries] - self.data[positions]
+        return np.sqrt(np.sum(diff ** 2, axis=1))
+    
+    def _leaf_pairs(self, Q: np.ndarray, bounds: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Пары (запрос, лист), не отсечённые границами bounds, с расстоянием до параллелепипеда листа
+        """
+        queries = np.arange(len(Q))
+        nodes = np.zeros(len(Q), dtype=np.intp)
+        gaps = np.zeros(len(Q))
+        leaves_q, leaves_n, leaves_gap = [], [], []
+        while len(queries):
+            is_leaf = self.left[nodes] < 0
+            leaves_q.append(queries[is_leaf])
+            leaves_n.append(nodes[is_leaf])
+            leaves_gap.append(gaps[is_leaf])
+            
+            inner_q = queries[~is_leaf]
+            inner_n = nodes[~is_leaf]
+            queries = np.concatenate([inner_q, inner_q])
+            nodes = np.concatenate([self.left[inner_n], self.right[inner_n]])
+            gaps = self._box_distance(Q, queries, nodes)
+            keep = gaps <= _with_tolerance(bounds[queries])
+            queries, nodes, gaps = queries[keep], nodes[keep], gaps[keep]
+        return np.concatenate(leaves_q), np.concatenate(leaves_n), np.concatenate(leaves_gap)
+    
+    def _expand(self, Q: np.ndarray, queries: np.ndarray,
+                nodes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        counts = self.end[nodes] - self.start[nodes]
+        queries = np.repeat(queries, counts)
+        positions = _expand_ranges(self.start[nodes], counts)
+        return queries, positions, self._pair_distances(Q, queries, positions)
+    
+    def _seed_nodes(self, Q: np.ndarray, k: int) -> np.ndarray:
+        """
+        Спуск каждого запроса к самому глубокому узлу своей ячейки, содержащему не меньше k точек
+        """
+        nodes = np.zeros(len(Q), dtype=np.intp)
+        active = np.arange(len(Q))
+        while len(active):
+            current = nodes[active]
+            inner = self.left[current] >= 0
+            active, current = active[inner], current[inner]
+            go_right = Q[active, self.split_dim[current]] >= self.split_val[current]
+            child = np.where(go_right, self.right[current], self.left[current])
+            big_enough = self.end[child] - self.start[child] >= k
+            active, child = active[big_enough], child[big_enough]
+            nodes[active] = child
+        return nodes
+    
+    def _kneighbors_block(self, Q: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        m = len(Q)
+        seeds = self._seed_nodes(Q, k)
+        queries, positions, dist = self._expand(Q, np.arange(m), seeds)
+        best_dist, best_pos = _top_k(queries, positions, dist, self.order, m, k)
+        
+        # Листья обходятся раундами в порядке удаления от запроса; после каждого раунда
+        # граница k-го соседа сужается, и дальние листья отбрасываются без подсчёта расстояний
+        leaf_q, leaf_n, leaf_gap = self._leaf_pairs(Q, best_dist[:, -1])
+        seeded = (self.start[leaf_n] >= self.start[seeds[leaf_q]]) & (self.end[leaf_n] <= self.end[seeds[leaf_q]])
+        leaf_q, leaf_n, leaf_gap = leaf_q[~seeded], leaf_n[~seeded], leaf_gap[~seeded]
+        order = np.lexsort((leaf_gap, leaf_q))
+        leaf_q, leaf_n, leaf_gap = leaf_q[order], leaf_n[order], leaf_gap[order]
+        starts = _group_starts(leaf_q)
+        rank = np.arange(len(leaf_q)) - np.repeat(starts, np.diff(np.append(starts, len(leaf_q))))
+        n_rounds = int(rank.max()) + 1 if len(rank) else 0
+        
+        low = 0
+        while low < n_rounds:
+            high = 2 * low + 1
+            selected = (rank >= low) & (rank < high)
+            selected &= leaf_gap <= _with_tolerance(best_dist[leaf_q, -1])
+            low = high
+            if not selected.any():
+                continue
+            queries, positions, dist = self._expand(Q, leaf_q[selected], leaf_n[selected])
+            closer = dist <= best_dist[queries, -1]
+            if not closer.any():
+                continue
+            queries, positions, dist = queries[closer], positions[closer], dist[closer]
+            rows = np.repeat(np.arange(m), k)
+            queries = np.concatenate([rows, queries])
+            positions = np.concatenate([best_pos.ravel(), positions])
+            dist = np.concatenate([best_dist.ravel(), dist])
+            best_dist, best_pos = _top_k(queries, positions, dist, self.order, m, k)
+        return best_dist, self.order[best_pos]
+    
+    def kneighbors(self, X: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        k = min(k, len(self.data))
+        distances = np.empty((len(X), k))
+        indices = np.empty((len(X), k), dtype=np.intp)
+        
+        for block in range(0, len(X), self.block_queries):
+            stop = min(len(X), block + self.block_queries)
+            distances[block:stop], indices[block:stop] = self._kneighbors_block(X[block:stop], k)
+        return distances, indices
+    
+    def query_radius(self, X: np.ndarray, radius: float) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        distances, indices = [], []
+        
+        for block in range(0, len(X), self.block_queries):
+            Q = X[block:block + self.block_queries]
+            leaf_q, leaf_n, _ = self._leaf_pairs(Q, np.full(len(Q), float(radius)))
+            queries, positions, dist = self._expand(Q, leaf_q, leaf_n)
+            inside = dist <= radius
+            queries, dist, labels = queries[inside], dist[inside], self.order[positions[inside]]
+            order = np.lexsort((labels, dist, queries))
+            bounds = np.searchsorted(queries[order], np.arange(1, len(Q)))
+            distances.extend(np.split(dist[order], bounds))
+            indices.extend(np.split(labels[order], bounds))
+        return distances, indices
@@ -0,0 +1,164 @@
+from typing import List, Tuple
+import numpy as np
+
+from .brute import DEFAULT_BLOCK_BYTES, exact_distances
+
+STORAGES = ('float64', 'float32', 'int8')
+DEFAULT_RERANK_FACTOR = 4
+# Столько строк обучающей выборки декодируется за раз: блок float32 остаётся в кэше процессора
+TRAIN_BLOCK_ROWS = 4096
+INT8_LEVELS = 255
+
+
+class ScalarQuantizer:
+    """
+    Поэлементное квантование признаков в int8: x ≈ offset + scale · code,
+    где min..max каждого признака делится на 255 уровней
+    """
+    
+    def fit(self, X: np.ndarray) -> 'ScalarQuantizer':
+        low = X.min(axis=0)
+        span = X.max(axis=0) - low
+        self.scale = np.where(span > 0, span / INT8_LEVELS, 1.0)
+        # Код -128 соответствует минимуму признака
+        self.offset = low + 128 * self.scale
+        return self
+    
+    def encode(self, X: np.ndarray) -> np.ndarray:
+        codes = np.rint((X - self.offset) / self.scale)
+        return np.clip(codes, -128, 127).astype(np.int8)
+    
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        return self.offset + self.scale * codes
+
+
+class QuantizedNeighbors:
+    """
+    Полный перебор по сжатой копии обучающей выборки: float32 (в 2 раза меньше float64) или int8
+    с поэлементным масштабом (в 8 раз меньше). Расстояния асимметричные: запрос остаётся
+    вещественным, обучающие точки декодируются блоками прямо в произведение матриц:
+    ||q - x̂||² = ||q - offset||² - 2 ((q - offset) · scale) @ code + ||scale · code||².
+    При rerank=True rerank_factor·k лучших кандидатов переранжируются по точным расстояниям
+    float64 из исходной матрицы, и индекс удерживает её вместе со сжатой копией. Память тогда
+    экономится, только если матрица лежит в memmap (np.load(..., mmap_mode='r'), load_model):
+    читаются лишь строки кандидатов. Для матрицы в памяти rerank=True тратит больше, чем float64.
+    """
+    
+    def __init__(self, storage: str = 'int8', rerank: bool = False, rerank_factor: int = DEFAULT_RERANK_FACTOR,
+                 block_bytes: int = DEFAULT_BLOCK_BYTES):
+        if storage not in STORAGES[1:]:
+            raise ValueError(f"Неподдерживаемый тип хранения: {storage}")
+        if rerank_factor < 1:
+            raise ValueError("rerank_factor должен быть положительным")
+        self.storage = storage
+        self.rerank = rerank
+        self.rerank_factor = rerank_factor
+        self.block_bytes = block_bytes
+        self.X_train = None
+        self.codes = None
+    
+    def fit(self, X_train: np.ndarray) -> 'QuantizedNeighbors':
+        X_train = np.asarray(X_train, dtype=np.float64)
+        if X_train.ndim != 2 or len(X_train) == 0:
+            raise ValueError("Обучающая выборка должна быть непустой матрицей")
+        if self.storage == 'int8':
+            quantizer = ScalarQuantizer().fit(X_train)
+            self.offset, self.scale = quantizer.offset, quantizer.scale
+            self.codes = quantizer.encode(X_train)
+        else:
+            self.offset = np.zeros(X_train.shape[1])
+            self.scale = np.ones(X_train.shape[1])
+            self.codes = X_train.astype(np.float32)
+        self.code_norms = np.empty(len(X_train), dtype=np.float32)
+        for start in range(0, len(X_train), TRAIN_BLOCK_ROWS):
+            block = self._decoded_block(start, start + TRAIN_BLOCK_ROWS) * self.scale.astype(np.float32)
+            self.code_norms[start:start + TRAIN_BLOCK_ROWS] = np.einsum('ij,ij->i', block, block)
+        self.X_train = X_train if self.rerank else None
+        self.n_samples = len(X_train)
+        return self
+    
+    @property
+    def nbytes(self) -> int:
+        """
+        Память сжатой копии и норм (исходная матрица для переранжирования, если она удерживается,
+        не учитывается)
+        """
+        return self.codes.nbytes + self.code_norms.nbytes
+    
+    def _decoded_block(self, start: int, stop: int) -> np.ndarray:
+        return self.codes[start:stop].astype(np.float32, copy=False)
+    
+    def _shortlist(self, Q: np.ndarray, width: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        width ближайших по приближённым квадратам расстояний, без упорядочения внутри набора
+        """
+        m = len(Q)
+        shifted = Q - self.offset
+        q_norms = np.einsum('ij,ij->i', shifted, shifted).astype(np.float32)
+        weighted = (shifted * self.scale).astype(np.float32)
+        best_d = np.full((m, width), np.inf, dtype=np.float32)
+        best_i = np.zeros((m, width), dtype=np.intp)
+        for start in range(0, self.n_samples, TRAIN_BLOCK_ROWS):
+            stop = min(self.n_samples, start + TRAIN_BLOCK_ROWS)
+            D = weighted @ self._decoded_block(start, stop).T
+            D *= -2.0
+            D += q_norms[:, None]
+            D += self.code_norms[None, start:stop]
+            merged_d = np.concatenate([best_d, D], axis=1)
+            merged_i = np.concatenate([best_i, np.broadcast_to(np.arange(start, stop), D.shape)], axis=1)
+            keep = np.argpartition(merged_d, width - 1, axis=1)[:, :width]
+            best_d = np.take_along_axis(merged_d, keep, axis=1)
+            best_i = np.take_along_axis(merged_i, keep, axis=1)
+        return best_d, best_i
+    
+    def kneighbors(self, X: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        k = min(k, self.n_samples)
+        width = min(self.n_samples, k * self.rerank_factor if self.rerank else k)
+        distances = np.empty((len(X), k))
+        indices = np.empty((len(X), k), dtype=np.intp)
+        rows = max(1, self.block_bytes // (8 * (TRAIN_BLOCK_ROWS + 2 * width)))
+        for start in range(0, len(X), rows):
+            stop = min(len(X), start + rows)
+            Q = X[start:stop]
+            approx, candidates = self._shortlist(Q, width)
+            if self.rerank:
+                approx = exact_distances(Q, self.X_train, candidates, self.block_bytes)
+            else:
+                approx = np.sqrt(np.maximum(approx.astype(np.float64), 0.0))
+            order = np.lexsort((candidates, approx), axis=1)[:, :k]
+            distances[start:stop] = np.take_along_axis(approx, order, axis=1)
+            indices[start:stop] = np.take_along_axis(candidates, order, axis=1)
+        return distances, indices
+    
+    def query_radius(self, X: np.ndarray, radius: float) -> Tuple[List[np.ndarray], List[np.ndarray]]:
+        """
+        Точки в радиусе по расстояниям до сжатых точек (при rerank=True — проверенные точно)
+        """
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        # Кандидаты для проверки берутся с запасом: полшага квантования по всем признакам
+        # и ошибка округления float32 в развёрнутой формуле квадрата расстояния
+        step = 0.5 * np.linalg.norm(self.scale) if self.storage == 'int8' else 0.0
+        max_code_norm = float(self.code_norms.max())
+        distances, indices = [], []
+        for row in X:
+            shifted = row - self.offset
+            q_norm = float(shifted @ shifted)
+            weighted = (shifted * self.scale).astype(np.float32)
+            limit = (radius + step) ** 2 + 1e-5 * (q_norm + max_code_norm) if self.rerank else radius ** 2
+            found, values = [], []
+            for start in range(0, self.n_samples, TRAIN_BLOCK_ROWS):
+                stop = min(self.n_samples, start + TRAIN_BLOCK_ROWS)
+                D = q_norm - 2.0 * (self._decoded_block(start, stop) @ weighted) + self.code_norms[start:stop]
+                hits = np.flatnonzero(D <= limit)
+                found.append(hits + start)
+                values.append(np.sqrt(np.maximum(D[hits].astype(np.float64), 0.0)))
+            found, values = np.concatenate(found), np.concatenate(values)
+            if self.rerank:
+                values = np.sqrt(np.sum((row - self.X_train[found]) ** 2, axis=1))
+            inside = values <= radius
+            found, values = found[inside], values[inside]
+            ranked = np.lexsort((found, values))
+            distances.append(values[ranked])
+            indices.append(found[ranked])
+        return distances, indices
@@ -0,0 +1,3 @@
+from .feature_search import FeatureSearch, SubsetEvaluator, nearest_from_distances
+
+__all__ = ['FeatureSearch', 'SubsetEvaluator', 'nearest_from_distances']
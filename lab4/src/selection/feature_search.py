@@ -0,0 +1,240 @@
+from multiprocessing import Pool
+from math import comb
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+import os
+import numpy as np
+
+from common import SharedArray
+from src.models.knn_classifier import prefix_votes
+from src.neighbors import BruteForceNeighbors
+from src.neighbors.kd_tree import _group_starts
+
+DEFAULT_KS = (1, 3, 5, 7, 10, 15, 20)
+DEFAULT_CACHE_BYTES = 256 * 1024 * 1024
+DEFAULT_BLOCK_BYTES = 64 * 1024 * 1024
+
+# Состояние процесса-исполнителя: представления разделяемых массивов и параметры оценки
+_worker = {}
+
+
+def nearest_from_distances(D: np.ndarray, k: int) -> np.ndarray:
+    """
+    Индексы k ближайших по матрице расстояний, при равенстве — по индексу обучающего объекта
+    """
+    m, n_train = D.shape
+    k = min(k, n_train)
+    rows = np.arange(m)[:, None]
+    candidates = np.argpartition(D, k - 1, axis=1)[:, :k] if k < n_train else np.tile(np.arange(n_train), (m, 1))
+    values = D[rows, candidates]
+    order = np.lexsort((candidates, values), axis=1)
+    candidates = np.take_along_axis(candidates, order, axis=1)
+    
+    # Если k-е расстояние встречается и за пределами выбранных, argpartition мог взять
+    # не те равные точки: такие строки пересчитываются с упорядочением по индексу
+    kth = values.max(axis=1)
+    tied = np.flatnonzero(np.count_nonzero(D <= kth[:, None], axis=1) > k)
+    if len(tied):
+        tie_rows, cols = np.nonzero(D[tied] <= kth[tied, None])
+        ranked = np.lexsort((cols, D[tied][tie_rows, cols], tie_rows))
+        take = (_group_starts(tie_rows[ranked])[:, None] + np.arange(k)).ravel()
+        candidates[tied] = cols[ranked][take].reshape(len(tied), k)
+    return candidates
+
+
+class SubsetEvaluator:
+    """
+    Оценка kNN на подмножествах признаков. Если задан кэш components, квадраты разностей
+    (x_val_f - x_train_f)² по каждому признаку уже посчитаны и расстояние для подмножества —
+    сумма компонент в порядке признаков. Без кэша соседи ищутся полным перебором по срезу
+    X[:, features]; расстояния двух способов могут различаться в последних битах, поэтому
+    при почти равных расстояниях порядок соседей может не совпадать.
+    """
+    
+    def __init__(self, X_train: np.ndarray, y_encoded: np.ndarray, X_val: np.ndarray, y_val_encoded: np.ndarray,
+                 ks: Sequence[int], components: Optional[np.ndarray] = None, block_bytes: int = DEFAULT_BLOCK_BYTES):
+        self.X_train = X_train
+        self.y_encoded = y_encoded
+        self.X_val = X_val
+        self.y_val_encoded = y_val_encoded
+        self.ks = list(ks)
+        self.n_classes = int(max(y_encoded.max(), y_val_encoded.max())) + 1
+        self.components = components
+        self.block_bytes = block_bytes
+        self._prefix = None
+    
+    def _distances(self, features: Tuple[int, ...]) -> np.ndarray:
+        C = self.components
+        if len(features) == 1:
+            return C[features[0]].copy()
+        
+        # Кандидаты жадного поиска отличаются от общего префикса одним последним признаком:
+        # сумма по префиксу запоминается и переиспользуется
+        prefix = features[:-1]
+        if self._prefix is not None and self._prefix[0] == prefix:
+            partial = self._prefix[1]
+        elif len(prefix) == 1:
+            partial = C[prefix[0]]
+        else:
+            partial = C[prefix[0]] + C[prefix[1]]
+            for feature in prefix[2:]:
+                partial += C[feature]
+        self._prefix = (prefix, partial)
+        return partial + C[features[-1]]
+    
+    def neighbors(self, features: Tuple[int, ...], k: int) -> np.ndarray:
+        if self.components is None:
+            index = BruteForceNeighbors(self.block_bytes).fit(self.X_train[:, list(features)])
+            return index.kneighbors(self.X_val[:, list(features)], k)[1]
+        D = self._distances(features)
+        np.sqrt(D, out=D)
+        return nearest_from_distances(D, k)
+    
+    def evaluate(self, features: Tuple[int, ...]) -> Dict[str, Any]:
+        indices = self.neighbors(tuple(features), max(self.ks))
+        winners = prefix_votes(self.y_encoded[indices], self.n_classes, self.ks)
+        accuracies = {k: float(np.mean(winners[k] == self.y_val_encoded)) for k in self.ks}
+        best_k = max(self.ks, key=lambda k: (accuracies[k], -k))
+        return {
+            'features': tuple(features),
+            'k': best_k,
+            'accuracy': accuracies[best_k],
+            'accuracies': accuracies,
+        }
+
+
+def _init_worker(specs: Dict[str, tuple], ks: Sequence[int], block_bytes: int):
+    shared = {name: SharedArray.attach(spec) for name, spec in specs.items()}
+    _worker['shared'] = shared
+    _worker['evaluator'] = SubsetEvaluator(
+        shared['X_train'].array, shared['y_train'].array, shared['X_val'].array, shared['y_val'].array,
+        ks, shared['components'].array if 'components' in shared else None, block_bytes,
+    )
+
+
+def _evaluate_in_worker(features: Tuple[int, ...]) -> Dict[str, Any]:
+    return _worker['evaluator'].evaluate(features)
+
+
+class FeatureSearch:
+    """
+    Поиск подмножества признаков для kNN: случайный перебор или жадное добавление признаков.
+    Стандартизованные матрицы и кэш компонент расстояний лежат в разделяемой памяти,
+    процессы пула получают только их имена. Кэш компонент занимает n_features * n_val * n_train * 8
+    байт и строится, если это не больше cache_bytes; cache_bytes=0 отключает его.
+    """
+    
+    def __init__(self, X_train: np.ndarray, y_train: np.ndarray, X_val: np.ndarray, y_val: np.ndarray,
+                 ks: Iterable[int] = DEFAULT_KS, n_jobs: Optional[int] = None,
+                 cache_bytes: int = DEFAULT_CACHE_BYTES, block_bytes: int = DEFAULT_BLOCK_BYTES):
+        X_train = np.ascontiguousarray(X_train, dtype=np.float64)
+        X_val = np.ascontiguousarray(X_val, dtype=np.float64)
+        if X_train.ndim != 2 or X_val.ndim != 2 or X_train.shape[1] != X_val.shape[1]:
+            raise ValueError("Обучающая и валидационная выборки должны быть матрицами с одинаковыми признаками")
+        if len(X_train) != len(y_train) or len(X_val) != len(y_val):
+            raise ValueError("Число объектов и меток не совпадает")
+        self.ks = sorted(set(ks))
+        if not self.ks or self.ks[0] < 1:
+            raise ValueError("k должно быть положительным")
+        
+        self.n_features = X_train.shape[1]
+        self.classes_, encoded = np.unique(np.concatenate([np.asarray(y_train), np.asarray(y_val)]),
+                                           return_inverse=True)
+        y_encoded, y_val_encoded = encoded[:len(y_train)], encoded[len(y_train):]
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        self.block_bytes = block_bytes
+        self.cache = {}
+        
+        arrays = {'X_train': X_train, 'y_train': y_encoded, 'X_val': X_val, 'y_val': y_val_encoded}
+        self._shared = {name: SharedArray.copy_of(array) for name, array in arrays.items()}
+        component_bytes = len(X_val) * len(X_train) * 8
+        if self.n_features * component_bytes <= cache_bytes:
+            components = SharedArray.create((self.n_features, len(X_val), len(X_train)))
+            for feature in range(self.n_features):
+                components.array[feature] = (X_val[:, feature, None] - X_train[None, :, feature]) ** 2
+            self._shared['components'] = components
+        
+        shared = {name: array.array for name, array in self._shared.items()}
+        self._evaluator = SubsetEvaluator(
+            shared['X_train'], shared['y_train'], shared['X_val'], shared['y_val'],
+            self.ks, shared.get('components'), block_bytes,
+        )
+        self._pool = None
+    
+    def _get_pool(self) -> Optional[Pool]:
+        if self.n_jobs == 1:
+            return None
+        if self._pool is None:
+            specs = {name: array.spec for name, array in self._shared.items()}
+            self._pool = Pool(self.n_jobs, initializer=_init_worker, initargs=(specs, self.ks, self.block_bytes))
+        return self._pool
+    
+    def evaluate(self, subsets: Iterable[Sequence[int]]) -> List[Dict[str, Any]]:
+        """
+        Оценка подмножеств; уже оценённые берутся из кэша
+        """
+        subsets = [tuple(int(f) for f in subset) for subset in subsets]
+        for subset in subsets:
+            if not subset or min(subset) < 0 or max(subset) >= self.n_features:
+                raise ValueError(f"Некорректное подмножество признаков: {subset}")
+        
+        pending = list(dict.fromkeys(s for s in subsets if s not in self.cache))
+        if pending:
+            pool = self._get_pool()
+            if pool is None:
+                results = [self._evaluator.evaluate(subset) for subset in pending]
+            else:
+                chunksize = max(1, len(pending) // (4 * self.n_jobs))
+                results = pool.map(_evaluate_in_worker, pending, chunksize=chunksize)
+            self.cache.update(zip(pending, results))
+        return [self.cache[subset] for subset in subsets]
+    
+    def random_search(self, n_subsets: int, size: int, seed: int = 42) -> List[Dict[str, Any]]:
+        """
+        Случайный перебор n_subsets различных подмножеств из size признаков, лучшие первыми
+        """
+        if not 1 <= size <= self.n_features:
+            raise ValueError(f"Размер подмножества должен быть от 1 до {self.n_features}")
+        rng = np.random.default_rng(seed)
+        subsets = set()
+        while len(subsets) < min(n_subsets, comb(self.n_features, size)):
+            subsets.add(tuple(sorted(int(f) for f in rng.choice(self.n_features, size, replace=False))))
+        results = self.evaluate(sorted(subsets))
+        return sorted(results, key=lambda r: (-r['accuracy'], r['features']))
+    
+    def forward_selection(self, max_features: Optional[int] = None,
+                          min_improvement: float = 0.0) -> List[Dict[str, Any]]:
+        """
+        Жадное добавление признаков: на каждом шаге параллельно оцениваются все расширения
+        текущего набора на один признак. Возвращает лучший результат каждого шага,
+        признаки в порядке добавления.
+        """
+        max_features = max_features or self.n_features
+        selected = ()
+        history = []
+        while len(selected) < max_features:
+            candidates = [selected + (f,) for f in range(self.n_features) if f not in selected]
+            if not candidates:
+                break
+            best = min(self.evaluate(candidates), key=lambda r: (-r['accuracy'], r['features']))
+            if history and best['accuracy'] <= history[-1]['accuracy'] + min_improvement:
+                break
+            history.append(best)
+            selected = best['features']
+        return history
+    
+    def close(self):
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        self._evaluator = None
+        for array in self._shared.values():
+            array.close()
+        self._shared = {}
+    
+    def __enter__(self) -> 'FeatureSearch':
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
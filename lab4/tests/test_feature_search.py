@@ -0,0 +1,105 @@
+import sys
+import os
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data import load_wine, standardize, train_test_split
+from src.models import KNNClassifier
+from src.selection import FeatureSearch
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'WineDataset.csv')
+
+K_VALUES = [1, 3, 5, 7, 10, 15, 20]
+FIXED_FEATURES = [0, 6, 9, 12, 5, 10]
+
+
+def wine_split():
+    X, y, _ = load_wine(DATA_FILE)
+    X_scaled, _, _ = standardize(X)
+    return train_test_split(X_scaled, y, test_size=0.2, random_state=42)
+
+
+def test_subset_accuracy_matches_classifier():
+    print("Тестирование оценки подмножеств признаков...")
+    
+    X_train, X_test, y_train, y_test = wine_split()
+    np.random.seed(42)
+    random_features = list(np.sort(np.random.choice(X_train.shape[1], 6, replace=False)))
+    subsets = [random_features, FIXED_FEATURES, [3], [12, 0]]
+    
+    with FeatureSearch(X_train, y_train, X_test, y_test, K_VALUES, n_jobs=2) as search:
+        results = search.evaluate(subsets)
+    
+    for subset, result in zip(subsets, results):
+        knn = KNNClassifier().fit(X_train[:, subset], y_train)
+        for k in K_VALUES:
+            expected = knn.evaluate_k_grid(X_test[:, subset], y_test, [k])[k]['accuracy']
+            assert result['accuracies'][k] == expected, f"Точность {subset} при k={k} отличается"
+        assert result['accuracy'] == max(result['accuracies'].values()), "Лучшее k выбрано неверно"
+    print("  ✓ Точность по всем k совпадает с KNNClassifier на срезе X[:, features]")
+    
+    with FeatureSearch(X_train, y_train, X_test, y_test, K_VALUES, n_jobs=1, cache_bytes=0, block_bytes=4096) as search:
+        assert search.evaluate(subsets) == results, "Без кэша компонент результат должен совпадать"
+    print("  ✓ Пул процессов, последовательный режим и расчёт без кэша дают одинаковый результат")
+    
+    print("✅ Тест оценки подмножеств пройден\n")
+
+
+def test_search_strategies():
+    print("Тестирование стратегий поиска...")
+    
+    X_train, X_test, y_train, y_test = wine_split()
+    with FeatureSearch(X_train, y_train, X_test, y_test, K_VALUES, n_jobs=2) as search:
+        ranked = search.random_search(50, size=6, seed=0)
+        assert len(ranked) == 50, f"Ожидалось 50 подмножеств, получено {len(ranked)}"
+        assert len({r['features'] for r in ranked}) == 50, "Подмножества должны быть различными"
+        assert all(len(r['features']) == 6 for r in ranked), "Размер подмножества должен быть 6"
+        accuracies = [r['accuracy'] for r in ranked]
+        assert accuracies == sorted(accuracies, reverse=True), "Результаты должны идти от лучшего"
+        print(f"  ✓ Случайный поиск: лучшее {ranked[0]['features']}, accuracy={ranked[0]['accuracy']:.4f}")
+        
+        assert len(search.random_search(100, size=12)) == 13, "Подмножеств из 12 признаков всего 13"
+        
+        cached = len(search.cache)
+        history = search.forward_selection(max_features=4)
+        assert 1 <= len(history) <= 4, "Не больше max_features шагов"
+        for step, result in enumerate(history, start=1):
+            assert len(result['features']) == step, "На каждом шаге добавляется один признак"
+        steps = [r['accuracy'] for r in history]
+        assert steps == sorted(steps) and len(set(steps)) == len(steps), "Точность должна расти"
+        assert len(search.cache) > cached, "Оценки должны попадать в кэш"
+        print(f"  ✓ Жадное добавление: {history[-1]['features']}, accuracy={history[-1]['accuracy']:.4f}")
+        
+        try:
+            search.evaluate([[13]])
+            assert False, "Несуществующий признак должен вызывать ошибку"
+        except ValueError:
+            print("  ✓ Некорректное подмножество отклонено")
+    
+    print("✅ Тест стратегий поиска пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование поиска признаков".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_subset_accuracy_matches_classifier()
+        test_search_strategies()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ ПОИСКА ПРИЗНАКОВ ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
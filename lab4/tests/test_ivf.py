@@ -0,0 +1,116 @@
+import sys
+import os
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from benchmarks.ann_benchmark import make_blobs, recall_at_k, run
+from src.data import load_wine, standardize, train_test_split
+from src.models import KNNClassifier
+from src.neighbors import BruteForceNeighbors, IVFIndex
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'WineDataset.csv')
+
+
+def test_full_probe_is_exact():
+    print("Тестирование IVF при просмотре всех списков...")
+    
+    rng = np.random.default_rng(0)
+    X_train = rng.normal(size=(3000, 8))
+    X_test = np.vstack([rng.normal(size=(300, 8)), X_train[:20]])
+    brute = BruteForceNeighbors().fit(X_train)
+    index = IVFIndex(n_lists=40, block_bytes=1 << 16).fit(X_train)
+    assert index.counts.sum() == 3000 and len(index.centroids) == 40, "Списки должны покрывать всю выборку"
+    for k in (1, 7, 50):
+        distances, indices = index.kneighbors(X_test, k, n_probe=40)
+        expected_distances, expected_indices = brute.kneighbors(X_test, k)
+        assert np.array_equal(indices, expected_indices), f"Соседи отличаются при k={k}"
+        assert np.allclose(distances, expected_distances), f"Расстояния отличаются при k={k}"
+    print("  ✓ n_probe = n_lists совпадает с полным перебором для k=1/7/50")
+    
+    X_grid = rng.integers(0, 3, size=(1000, 2)).astype(float)
+    index = IVFIndex(n_lists=10).fit(X_grid)
+    expected = BruteForceNeighbors().fit(X_grid).kneighbors(X_grid[:100], 30)[1]
+    assert np.array_equal(index.kneighbors(X_grid[:100], 30, n_probe=10)[1], expected), "Равенства разрешены иначе"
+    print("  ✓ Равные расстояния упорядочены по индексу")
+    
+    distances, indices = index.query_radius(X_grid[:5], 1.0, n_probe=10)
+    expected_distances, expected_indices = BruteForceNeighbors().fit(X_grid).query_radius(X_grid[:5], 1.0)
+    for found, reference in zip(indices, expected_indices):
+        assert np.array_equal(found, reference), "Поиск в радиусе отличается от полного перебора"
+    print("  ✓ Поиск в радиусе")
+    
+    print("✅ Тест точного режима пройден\n")
+
+
+def test_recall_tradeoff():
+    print("Тестирование полноты приближённого поиска...")
+    
+    X, _ = make_blobs(20000, 16, 5, seed=1)
+    X_train, X_test = X[:19000], X[19000:]
+    exact = BruteForceNeighbors().fit(X_train).kneighbors(X_test, 10)[1]
+    index = IVFIndex(n_lists=100).fit(X_train)
+    
+    recalls = [recall_at_k(index.kneighbors(X_test, 10, n_probe)[1], exact) for n_probe in (1, 4, 16, 100)]
+    assert all(a <= b + 1e-12 for a, b in zip(recalls, recalls[1:])), f"Полнота должна расти с n_probe: {recalls}"
+    assert recalls[0] < 1.0 and recalls[-1] == 1.0, f"Неожиданная полнота: {recalls}"
+    print("  ✓ Полнота по n_probe=1/4/16/100: " + ", ".join(f"{r:.3f}" for r in recalls))
+    
+    small = IVFIndex(n_lists=500).fit(X_train[:600])
+    distances, indices = small.kneighbors(X_test[:50], 20, n_probe=1)
+    assert indices.shape == (50, 20) and np.all(np.diff(distances, axis=1) >= 0), \
+        "Запросу должно хватать соседей даже при маленьких списках"
+    print("  ✓ Списков просматривается столько, чтобы набрать k соседей")
+    
+    print("✅ Тест полноты пройден\n")
+
+
+def test_knn_classifier_ivf():
+    print("Тестирование KNNClassifier с algorithm='ivf'...")
+    
+    X, y, _ = load_wine(DATA_FILE)
+    X_scaled, _, _ = standardize(X)
+    X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, test_size=0.2, random_state=42)
+    exact = KNNClassifier(k=5, algorithm='brute').fit(X_train, y_train)
+    approximate = KNNClassifier(k=5, algorithm='ivf', n_lists=6, n_probe=6).fit(X_train, y_train)
+    assert approximate.algorithm_ == 'ivf', "Должен использоваться IVF"
+    assert np.array_equal(approximate.predict(X_test), exact.predict(X_test)), "Полный просмотр должен совпадать"
+    
+    approximate.n_probe = 1
+    accuracy = approximate.score(X_test, y_test)
+    assert accuracy > 0.8, f"Неожиданно низкая точность при n_probe=1: {accuracy}"
+    assert KNNClassifier(algorithm='auto').fit(X_train, y_train).algorithm_ != 'ivf', "auto не выбирает IVF"
+    print(f"  ✓ n_probe=n_lists совпадает с точным классификатором, n_probe=1 после fit(): accuracy {accuracy:.4f}")
+    
+    report = run(n_train=3000, n_queries=200, n_features=8, k=5, n_lists=(20,), n_probes=(1, 20))
+    rows = report['ivf']
+    assert [row['n_probe'] for row in rows] == [1, 20], "Отчёт должен содержать все n_probe"
+    assert rows[-1]['recall_at_k'] == 1.0 and rows[-1]['agreement_with_exact'] == 1.0, "Полный просмотр неточен"
+    print("  ✓ Бенчмарк: полнота, совпадение с точным классификатором и запросы в секунду")
+    
+    print("✅ Тест KNNClassifier с IVF пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование приближённого поиска (IVF)".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_full_probe_is_exact()
+        test_recall_tradeoff()
+        test_knn_classifier_ivf()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ IVF ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
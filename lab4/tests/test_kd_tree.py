@@ -0,0 +1,116 @@
+import sys
+import os
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.models import KNNClassifier
+from src.neighbors import BruteForceNeighbors, KDTree, build_index, select_algorithm
+
+
+def _reference_radius(X_train, x, radius):
+    distances = np.sqrt(np.sum((x - X_train) ** 2, axis=1))
+    inside = np.flatnonzero(distances <= radius)
+    order = np.lexsort((inside, distances[inside]))
+    return distances[inside][order], inside[order]
+
+
+def test_kneighbors_match_brute_force():
+    print("Тестирование KD-дерева против полного перебора...")
+    
+    rng = np.random.default_rng(1)
+    X_train = rng.normal(size=(5000, 6))
+    X_test = np.vstack([rng.normal(size=(700, 6)), X_train[:50]])
+    brute = BruteForceNeighbors().fit(X_train)
+    
+    for leaf_size in (1, 8, 32):
+        tree = KDTree(leaf_size, block_queries=256).fit(X_train)
+        for k in (1, 5, 40):
+            distances, indices = tree.kneighbors(X_test, k)
+            expected_distances, expected_indices = brute.kneighbors(X_test, k)
+            assert np.array_equal(indices, expected_indices), f"Соседи отличаются: leaf_size={leaf_size}, k={k}"
+            assert np.array_equal(distances, expected_distances), f"Расстояния отличаются: leaf_size={leaf_size}, k={k}"
+    print("  ✓ Непрерывные данные: совпадение для leaf_size=1/8/32 и k=1/5/40")
+    
+    X_train = rng.integers(0, 3, size=(2000, 3)).astype(float)
+    X_test = rng.integers(0, 3, size=(200, 3)).astype(float)
+    tree = KDTree(leaf_size=4).fit(X_train)
+    for k in (3, 64, 5000):
+        expected = BruteForceNeighbors().fit(X_train).kneighbors(X_test, k)[1]
+        assert np.array_equal(tree.kneighbors(X_test, k)[1], expected), f"Равенства разрешены иначе при k={k}"
+    print("  ✓ Дубликаты точек: равенства разрешаются по индексу, k > n_train обрезается")
+    
+    print("✅ Тест KD-дерева пройден\n")
+
+
+def test_radius_queries():
+    print("Тестирование запросов по радиусу...")
+    
+    rng = np.random.default_rng(2)
+    X_train = np.vstack([rng.normal(size=(3000, 4)), rng.integers(0, 2, size=(300, 4))])
+    X_test = np.vstack([rng.normal(size=(100, 4)), rng.integers(0, 2, size=(20, 4))])
+    
+    for index in (KDTree(leaf_size=16).fit(X_train), BruteForceNeighbors(block_bytes=1 << 16).fit(X_train)):
+        for radius in (0.0, 0.5, 1.0):
+            distances, indices = index.query_radius(X_test, radius)
+            assert len(indices) == len(X_test), "Результат нужен для каждого запроса"
+            for i, x in enumerate(X_test):
+                expected_distances, expected_indices = _reference_radius(X_train, x, radius)
+                assert np.array_equal(indices[i], expected_indices), f"Соседи в радиусе {radius} отличаются"
+                assert np.array_equal(distances[i], expected_distances), f"Расстояния в радиусе {radius} отличаются"
+        print(f"  ✓ {type(index).__name__}: радиусы 0, 0.5, 1 совпадают с полным перебором")
+    
+    knn = KNNClassifier(k=3, algorithm='kd_tree').fit(X_train, np.zeros(len(X_train)))
+    assert np.array_equal(knn.radius_neighbors(X_test[:1], 1.0)[1][0], _reference_radius(X_train, X_test[0], 1.0)[1])
+    print("  ✓ KNNClassifier.radius_neighbors")
+    
+    print("✅ Тест запросов по радиусу пройден\n")
+
+
+def test_algorithm_selection():
+    print("Тестирование автоматического выбора алгоритма...")
+    
+    assert select_algorithm(142, 6) == 'brute', "На Wine перебор быстрее дерева"
+    assert select_algorithm(1_000_000, 6) == 'kd_tree', "Большая выборка малой размерности — дерево"
+    assert select_algorithm(1_000_000, 40) == 'brute', "В большой размерности дерево не окупается"
+    print("  ✓ select_algorithm учитывает размер и размерность")
+    
+    X_train = np.random.default_rng(3).normal(size=(30000, 2))
+    assert isinstance(build_index(X_train), KDTree), "auto должен выбрать дерево"
+    assert isinstance(build_index(X_train, 'brute'), BruteForceNeighbors), "Явный выбор перебора"
+    knn = KNNClassifier(k=3).fit(X_train, np.arange(len(X_train)) % 2)
+    assert knn.algorithm_ == 'kd_tree', f"Выбран {knn.algorithm_}"
+    print("  ✓ KNNClassifier.fit выбирает индекс автоматически")
+    
+    try:
+        KNNClassifier(algorithm='ball_tree')
+        assert False, "Неизвестный алгоритм должен вызывать ошибку"
+    except ValueError:
+        print("  ✓ Неизвестный алгоритм отклонён")
+    
+    print("✅ Тест выбора алгоритма пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование KD-дерева".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_kneighbors_match_brute_force()
+        test_radius_queries()
+        test_algorithm_selection()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ KD-ДЕРЕВА ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,254 @@
+import sys
+import os
+import asyncio
+import tempfile
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from src.data import load_wine, standardize, train_test_split
+from src.metrics import calculate_metrics, confusion_matrix
+from src.models import KNNClassifier
+from common.serialization import load_model
+from common.serving import PredictionServer
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'WineDataset.csv')
+
+K_VALUES = [1, 3, 5, 7, 10, 15, 20]
+FIXED_FEATURES = [0, 6, 9, 12, 5, 10]
+
+
+class NotebookKNN:
+    def __init__(self, k=3):
+        self.k = k
+    
+    def fit(self, X_train, y_train):
+        self.X_train = X_train
+        self.y_train = y_train
+    
+    def _predict_single(self, x):
+        distances = []
+        for i in range(len(self.X_train)):
+            distances.append((np.sqrt(np.sum((x - self.X_train[i]) ** 2)), self.y_train[i]))
+        distances.sort(key=lambda x: x[0])
+        counts = {}
+        for _, label in distances[:self.k]:
+            counts[label] = counts.get(label, 0) + 1
+        return max(counts, key=counts.get)
+    
+    def predict(self, X_test):
+        return np.array([self._predict_single(x) for x in X_test])
+
+
+def wine_split():
+    X, y, _ = load_wine(DATA_FILE)
+    X_scaled, _, _ = standardize(X)
+    return train_test_split(X_scaled, y, test_size=0.2, random_state=42)
+
+
+def _assert_same_predictions(X_train, y_train, X_test, k, **options):
+    reference = NotebookKNN(k)
+    reference.fit(X_train, y_train)
+    expected = reference.predict(X_test)
+    actual = KNNClassifier(k, **options).fit(X_train, y_train).predict(X_test)
+    assert actual.dtype == expected.dtype, f"Тип меток {actual.dtype} != {expected.dtype}"
+    assert np.array_equal(actual, expected), f"Предсказания отличаются при k={k}"
+
+
+def test_matches_notebook_on_wine():
+    print("Тестирование совпадения с ноутбуком на Wine...")
+    
+    X_train, X_test, y_train, y_test = wine_split()
+    np.random.seed(42)
+    random_features = np.sort(np.random.choice(X_train.shape[1], 6, replace=False))
+    
+    for name, features in (('random', random_features), ('fixed', FIXED_FEATURES), ('all', slice(None))):
+        for k in K_VALUES:
+            _assert_same_predictions(X_train[:, features], y_train, X_test[:, features], k)
+            _assert_same_predictions(X_train[:, features], y_train, X_test[:, features], k, algorithm='kd_tree')
+        print(f"  ✓ Признаки {name}: предсказания совпадают для k={K_VALUES}")
+    
+    knn = KNNClassifier(k=5).fit(X_train, y_train)
+    assert 0.0 <= knn.score(X_test, y_test) <= 1.0, "Точность должна быть в [0, 1]"
+    
+    print("✅ Тест совпадения с ноутбуком пройден\n")
+
+
+def test_ties_and_chunking():
+    print("Тестирование равенств расстояний и блочной обработки...")
+    
+    rng = np.random.default_rng(0)
+    X_train = rng.integers(0, 3, size=(300, 4)).astype(float)
+    y_train = rng.integers(0, 4, size=300)
+    X_test = rng.integers(0, 3, size=(120, 4)).astype(float)
+    
+    for k in (1, 2, 4, 6, 25, 400):
+        _assert_same_predictions(X_train, y_train, X_test, k)
+        _assert_same_predictions(X_train, y_train, X_test, k, block_bytes=4096)
+        _assert_same_predictions(X_train, y_train, X_test, k, algorithm='kd_tree', leaf_size=4)
+    print("  ✓ Целочисленная решётка с дубликатами, чётные k и k > n_train")
+    
+    X_train = rng.normal(size=(500, 40)) * 1e3
+    X_test = np.vstack([rng.normal(size=(50, 40)) * 1e3, X_train[:10]])
+    y_train = np.array(['a', 'b', 'c'])[rng.integers(0, 3, size=500)]
+    for k in (1, 8):
+        _assert_same_predictions(X_train, y_train, X_test, k, block_bytes=1 << 16)
+    print("  ✓ 40 признаков, строковые метки, запросы совпадают с обучающими точками")
+    
+    print("✅ Тест равенств и блочной обработки пройден\n")
+
+
+def test_kneighbors():
+    print("Тестирование kneighbors...")
+    
+    X_train, X_test, y_train, _ = wine_split()
+    knn = KNNClassifier(k=4).fit(X_train, y_train)
+    distances, indices = knn.kneighbors(X_test)
+    
+    expected = np.sqrt(((X_test[:, None, :] - X_train[None, :, :]) ** 2).sum(axis=2))
+    order = np.argsort(expected, axis=1, kind='stable')[:, :4]
+    assert np.array_equal(indices, order), "Индексы соседей должны идти по возрастанию расстояния"
+    assert np.allclose(distances, np.take_along_axis(expected, order, axis=1)), "Неверные расстояния"
+    print(f"  ✓ Форма результата {indices.shape}, порядок совпадает со стабильной сортировкой")
+    
+    try:
+        KNNClassifier(k=0)
+        assert False, "k=0 должно вызывать ошибку"
+    except ValueError:
+        print("  ✓ Некорректное k отклонено")
+    
+    print("✅ Тест kneighbors пройден\n")
+
+
+def test_k_grid():
+    print("Тестирование перебора k за один поиск соседей...")
+    
+    X_train, X_test, y_train, y_test = wine_split()
+    features = FIXED_FEATURES
+    knn = KNNClassifier().fit(X_train[:, features], y_train)
+    results = knn.evaluate_k_grid(X_test[:, features], y_test, K_VALUES)
+    assert list(results) == K_VALUES, "Результаты должны идти в порядке ks"
+    
+    for k in K_VALUES:
+        reference = NotebookKNN(k)
+        reference.fit(X_train[:, features], y_train)
+        y_pred = reference.predict(X_test[:, features])
+        cm, _ = confusion_matrix(y_test, y_pred)
+        accuracy, precision, recall, f1 = calculate_metrics(cm)
+        assert np.array_equal(results[k]['predictions'], y_pred), f"Предсказания отличаются при k={k}"
+        assert np.array_equal(results[k]['confusion_matrix'], cm), f"Матрица ошибок отличается при k={k}"
+        assert results[k]['accuracy'] == accuracy, f"Accuracy отличается при k={k}"
+        for name, expected in (('precision', precision), ('recall', recall), ('f1', f1)):
+            assert np.array_equal(results[k][name], expected), f"{name} отличается при k={k}"
+    print(f"  ✓ Метрики для k={K_VALUES} совпадают с циклом из ноутбука")
+    
+    rng = np.random.default_rng(4)
+    X_train = rng.integers(0, 3, size=(60, 3)).astype(float)
+    y_train = rng.integers(0, 5, size=60)
+    X_test = rng.integers(0, 3, size=(40, 3)).astype(float)
+    ks = [8, 2, 1, 4, 100]
+    predictions = KNNClassifier().fit(X_train, y_train).predict_multi_k(X_test, ks)
+    for k in ks:
+        expected = KNNClassifier(k).fit(X_train, y_train).predict(X_test)
+        assert np.array_equal(predictions[k], expected), f"predict_multi_k отличается от predict при k={k}"
+    print("  ✓ Неупорядоченные ks, равенства голосов и k > n_train")
+    
+    print("✅ Тест перебора k пройден\n")
+
+
+def test_cached_loader():
+    print("Тестирование загрузки Wine через столбцовый кэш...")
+    
+    X, y, columns = load_wine(DATA_FILE)
+    with tempfile.TemporaryDirectory() as directory:
+        X_cached, y_cached, cached_columns = load_wine(DATA_FILE, cache=True, cache_dir=directory)
+        assert cached_columns == columns and np.array_equal(X_cached, X), "Признаки из кэша отличаются"
+        assert y_cached.dtype == y.dtype and np.array_equal(y_cached, y), "Метки из кэша отличаются"
+        
+        model = KNNClassifier(k=5).fit(*train_test_split(X_cached, y_cached, random_state=42)[::2])
+        reference = KNNClassifier(k=5).fit(*train_test_split(X, y, random_state=42)[::2])
+        X_test = train_test_split(X, y, random_state=42)[1]
+        assert np.array_equal(model.predict(X_test), reference.predict(X_test)), "Предсказания отличаются"
+    print("  ✓ Признаки, целочисленные метки и предсказания совпадают с read_csv")
+    
+    print("✅ Тест загрузки через кэш пройден\n")
+
+
+def test_save_and_serve():
+    print("Тестирование сохранения и сервера предсказаний...")
+    
+    X_train, X_test, y_train, y_test = wine_split()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'knn')
+        for options in ({'algorithm': 'brute'}, {'algorithm': 'kd_tree', 'leaf_size': 4},
+                        {'algorithm': 'ivf', 'n_lists': 8, 'n_probe': 2}, {'storage': 'int8'},
+                        {'storage': 'float32', 'rerank': True}):
+            model = KNNClassifier(k=5, **options).fit(X_train, y_train)
+            model.save(path)
+            loaded = KNNClassifier.load(path)
+            assert loaded.algorithm_ == model.algorithm_ and loaded.k == 5, f"Параметры {options} не восстановлены"
+            assert np.array_equal(loaded.predict(X_test), model.predict(X_test)), f"Предсказания {options} отличаются"
+            if model.X_train is not None:
+                assert isinstance(loaded.X_train, np.memmap), "Обучающая выборка должна открываться через memmap"
+        print("  ✓ brute, kd_tree, ivf и сжатое хранение восстанавливаются с индексом, данные — через memmap")
+        
+        names = np.array([f'сорт_{label}' for label in y_train], dtype=object)
+        model = KNNClassifier(k=5).fit(X_train, names)
+        model.save(path)
+        loaded = KNNClassifier.load(path)
+        assert loaded.classes_.dtype.kind == 'U', "Строковые метки должны сохраняться как '<U'"
+        assert np.array_equal(loaded.predict(X_test), model.predict(X_test)), "Предсказания со строковыми метками"
+        print("  ✓ Строковые метки dtype=object сохраняются как строки фиксированной длины")
+        
+        try:
+            KNNClassifier().save(path)
+            assert False, "Сохранение необученной модели должно вызывать ошибку"
+        except RuntimeError:
+            pass
+        
+        KNNClassifier(k=5, algorithm='brute').fit(X_train, y_train).save(path)
+        arrays = load_model(path)[2]
+        assert arrays['X_train'] is arrays['index.X_train'], "Общая обучающая матрица должна сохраняться один раз"
+        model = KNNClassifier.load(path)
+        
+        async def serve():
+            async with PredictionServer(model.predict, X_test.shape[1], max_batch_size=8) as server:
+                predictions = await asyncio.gather(*(server.predict(row) for row in X_test))
+                return np.array(predictions), server.n_batches
+        
+        predictions, n_batches = asyncio.run(serve())
+        assert np.array_equal(predictions, model.predict(X_test)), "Ответы сервера отличаются от predict"
+        del model
+    assert predictions.dtype == y_train.dtype, "Метки должны сохранять тип"
+    print(f"  ✓ Сервер: {len(X_test)} конкурентных запросов в {n_batches} пакетах по ≤ 8 строк")
+    
+    print("✅ Тест сохранения и сервера пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование KNNClassifier".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_matches_notebook_on_wine()
+        test_ties_and_chunking()
+        test_kneighbors()
+        test_k_grid()
+        test_cached_loader()
+        test_save_and_serve()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ KNN ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
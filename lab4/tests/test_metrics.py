@@ -0,0 +1,152 @@
+import sys
+import os
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.metrics import (
+    ConfusionMatrixAccumulator, calculate_metrics, confusion_matrix, metrics_report, precision_recall_f1,
+    streaming_confusion_matrix,
+)
+
+
+def notebook_confusion_matrix(y_true, y_pred):
+    classes = np.unique(y_true)
+    n_classes = len(classes)
+    matrix = np.zeros((n_classes, n_classes), dtype=int)
+    for i, true_class in enumerate(classes):
+        for j, pred_class in enumerate(classes):
+            matrix[i, j] = np.sum((y_true == true_class) & (y_pred == pred_class))
+    return matrix, classes
+
+
+def notebook_calculate_metrics(cm):
+    accuracy = np.trace(cm) / np.sum(cm)
+    n_classes = cm.shape[0]
+    precision = np.zeros(n_classes)
+    recall = np.zeros(n_classes)
+    f1 = np.zeros(n_classes)
+    for i in range(n_classes):
+        tp = cm[i, i]
+        fp = np.sum(cm[:, i]) - tp
+        fn = np.sum(cm[i, :]) - tp
+        precision[i] = tp / (tp + fp) if (tp + fp) > 0 else 0
+        recall[i] = tp / (tp + fn) if (tp + fn) > 0 else 0
+        f1[i] = 2 * (precision[i] * recall[i]) / (precision[i] + recall[i]) if (precision[i] + recall[i]) > 0 else 0
+    return accuracy, precision, recall, f1
+
+
+def _label_sets():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(1, 6, size=2000)
+    y_pred = np.where(rng.random(2000) < 0.6, y_true, rng.integers(0, 8, size=2000))
+    yield 'целые метки, предсказания вне классов', y_true, y_pred
+    
+    names = np.array(['red', 'white', 'rose', 'orange'])
+    y_true = names[rng.integers(0, 3, size=500)]
+    y_pred = names[rng.integers(0, 4, size=500)]
+    yield 'строковые метки', y_true, y_pred
+    
+    y_true = np.array([1, 1, 2, 2, 3])
+    y_pred = np.array([1, 1, 1, 1, 1])
+    yield 'классы без предсказаний', y_true, y_pred
+
+
+def test_matches_notebook():
+    print("Тестирование совпадения метрик с ноутбуком...")
+    
+    for name, y_true, y_pred in _label_sets():
+        cm, classes = confusion_matrix(y_true, y_pred)
+        expected_cm, expected_classes = notebook_confusion_matrix(y_true, y_pred)
+        assert np.array_equal(cm, expected_cm), f"Матрица ошибок отличается: {name}"
+        assert np.array_equal(classes, expected_classes), f"Классы отличаются: {name}"
+        
+        for actual, expected in zip(calculate_metrics(cm), notebook_calculate_metrics(expected_cm)):
+            assert np.array_equal(actual, expected), f"Метрики отличаются: {name}"
+        print(f"  ✓ {name}")
+    
+    cm, classes = confusion_matrix([1, 2], [1, 2], classes=[])
+    assert cm.shape == (0, 0) and len(classes) == 0, "Пустой список классов должен давать пустую матрицу"
+    print("  ✓ Пустой список классов даёт пустую матрицу")
+    
+    print("✅ Тест совпадения с ноутбуком пройден\n")
+
+
+def test_averages():
+    print("Тестирование macro и micro усреднения...")
+    
+    cm = np.array([[5, 1, 0], [2, 3, 1], [0, 0, 0]])
+    precision, recall, f1 = precision_recall_f1(cm)
+    assert np.allclose(precision, [5 / 7, 3 / 4, 0]), "Неверная precision по классам"
+    assert np.allclose(recall, [5 / 6, 3 / 6, 0]), "Неверный recall по классам"
+    
+    macro = precision_recall_f1(cm, 'macro')
+    assert np.allclose(macro, [precision.mean(), recall.mean(), f1.mean()]), "Неверное macro"
+    micro = precision_recall_f1(cm, 'micro')
+    assert np.allclose(micro, [8 / 12] * 3), "Micro-метрики при одной метке на объект равны accuracy"
+    print("  ✓ Класс без объектов и предсказаний получает нули, micro считается по суммарным TP")
+    
+    report = metrics_report(cm)
+    assert report['f1_macro'] == float(macro[2]) and report['precision_micro'] == float(micro[0]), "Неверный отчёт"
+    
+    try:
+        precision_recall_f1(cm, 'weighted')
+        assert False, "Неизвестное усреднение должно вызывать ошибку"
+    except ValueError:
+        print("  ✓ Неизвестный способ усреднения отклонён")
+    
+    print("✅ Тест усреднения пройден\n")
+
+
+def test_streaming():
+    print("Тестирование потокового накопления...")
+    
+    for name, y_true, y_pred in _label_sets():
+        expected_cm, expected_classes = confusion_matrix(y_true, y_pred)
+        bounds = sorted({0, 1, min(7, len(y_true)), len(y_true) // 2, len(y_true)})
+        chunks = [(y_true[a:b], y_pred[a:b]) for a, b in zip(bounds, bounds[1:])]
+        cm, classes = streaming_confusion_matrix(chunks)
+        assert np.array_equal(cm, expected_cm) and np.array_equal(classes, expected_classes), f"Отличие: {name}"
+        print(f"  ✓ {name}: части разного размера дают ту же матрицу")
+    
+    rng = np.random.default_rng(1)
+    accumulator = ConfusionMatrixAccumulator(classes=np.arange(50))
+    y_true_all, y_pred_all = [], []
+    for _ in range(20):
+        y_true = rng.integers(0, 50, size=10000)
+        y_pred = np.where(rng.random(10000) < 0.3, y_true, rng.integers(0, 50, size=10000))
+        accumulator.update(y_true, y_pred)
+        y_true_all.append(y_true)
+        y_pred_all.append(y_pred)
+    cm, _ = confusion_matrix(np.concatenate(y_true_all), np.concatenate(y_pred_all), classes=np.arange(50))
+    assert np.array_equal(accumulator.result()[0], cm), "Заданные классы: матрица отличается"
+    assert accumulator.n_samples == 200000 and cm.sum() == 200000, "Должны учитываться все объекты"
+    assert accumulator.metrics()['accuracy'] == np.trace(cm) / cm.sum(), "Неверная accuracy"
+    print("  ✓ Заданные заранее 50 классов, 200000 объектов по частям")
+    
+    print("✅ Тест потокового накопления пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование метрик".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_matches_notebook()
+        test_averages()
+        test_streaming()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ МЕТРИК ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
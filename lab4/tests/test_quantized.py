@@ -0,0 +1,111 @@
+import sys
+import os
+import tempfile
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data import load_wine, standardize, train_test_split
+from src.models import KNNClassifier
+from src.neighbors import BruteForceNeighbors, QuantizedNeighbors, ScalarQuantizer
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'WineDataset.csv')
+
+
+def test_quantized_search():
+    print("Тестирование поиска по сжатой выборке...")
+    
+    rng = np.random.default_rng(0)
+    X_train = rng.normal(size=(6000, 10)) * rng.uniform(0.1, 10, size=10)
+    X_test = rng.normal(size=(300, 10)) * X_train.std(axis=0)
+    
+    quantizer = ScalarQuantizer().fit(X_train)
+    codes = quantizer.encode(X_train)
+    assert codes.dtype == np.int8, "Коды должны быть int8"
+    assert np.all(np.abs(quantizer.decode(codes) - X_train) <= quantizer.scale / 2 + 1e-9), "Ошибка больше полушага"
+    print("  ✓ Квантование int8 с ошибкой не больше полушага по каждому признаку")
+    
+    brute = BruteForceNeighbors().fit(X_train)
+    expected_distances, expected_indices = brute.kneighbors(X_test, 7)
+    for storage, ratio in (('float32', 2), ('int8', 8)):
+        index = QuantizedNeighbors(storage, rerank=True).fit(X_train)
+        distances, indices = index.kneighbors(X_test, 7)
+        assert np.array_equal(indices, expected_indices), f"{storage}: соседи после переранжирования отличаются"
+        assert np.allclose(distances, expected_distances, rtol=1e-12), f"{storage}: расстояния не точные"
+        assert index.codes.nbytes * ratio == X_train.nbytes, f"{storage}: сжатие должно быть в {ratio} раз"
+        
+        fast = QuantizedNeighbors(storage, rerank=False).fit(X_train)
+        approx_distances, approx_indices = fast.kneighbors(X_test, 7)
+        recall = np.mean([len(np.intersect1d(a, b)) / 7 for a, b in zip(approx_indices, expected_indices)])
+        assert recall > 0.9 and fast.X_train is None, f"{storage}: полнота без переранжирования {recall}"
+        assert np.all(np.diff(approx_distances, axis=1) >= 0), "Расстояния должны быть упорядочены"
+        print(f"  ✓ {storage}: в {ratio} раз меньше памяти, с переранжированием точно, без него полнота {recall:.3f}")
+    
+    radius = float(np.median(expected_distances[:, -1]))
+    _, expected_radius = brute.query_radius(X_test[:30], radius)
+    for storage in ('float32', 'int8'):
+        index = QuantizedNeighbors(storage, rerank=True).fit(X_train)
+        _, found = index.query_radius(X_test[:30], radius)
+        assert all(np.array_equal(a, b) for a, b in zip(found, expected_radius)), f"{storage}: поиск в радиусе отличается"
+    print("  ✓ Поиск в радиусе с проверкой по float64")
+    
+    print("✅ Тест сжатого поиска пройден\n")
+
+
+def test_knn_classifier_storage():
+    print("Тестирование KNNClassifier со сжатым хранением...")
+    
+    X, y, _ = load_wine(DATA_FILE)
+    X_scaled, _, _ = standardize(X)
+    X_train, X_test, y_train, y_test = train_test_split(X_scaled, y, test_size=0.2, random_state=42)
+    expected = KNNClassifier(k=5, algorithm='brute').fit(X_train, y_train).predict(X_test)
+    
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'X_train.npy')
+        np.save(path, X_train)
+        X_mapped = np.load(path, mmap_mode='r')
+        for storage in ('float32', 'int8'):
+            model = KNNClassifier(k=5, storage=storage, rerank=True).fit(X_mapped, y_train)
+            assert model.algorithm_ == 'brute', "Сжатое хранение использует полный перебор"
+            assert np.array_equal(model.predict(X_test), expected), f"{storage}: предсказания отличаются"
+        del model, X_mapped
+    print("  ✓ float32 и int8 с переранжированием по memmap совпадают с точным классификатором")
+    
+    model = KNNClassifier(k=5, storage='int8').fit(X_train, y_train)
+    assert model.X_train is None, "По умолчанию исходная матрица не должна удерживаться"
+    accuracy = model.score(X_test, y_test)
+    assert accuracy > 0.9, f"Неожиданно низкая точность: {accuracy}"
+    print(f"  ✓ int8 без переранжирования: accuracy {accuracy:.4f}")
+    
+    try:
+        KNNClassifier(algorithm='kd_tree', storage='int8')
+        assert False, "KD-дерево со сжатым хранением должно вызывать ValueError"
+    except ValueError:
+        pass
+    print("  ✓ Сжатое хранение только с полным перебором")
+    
+    print("✅ Тест KNNClassifier со сжатым хранением пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование сжатого хранения для kNN".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_quantized_search()
+        test_knn_classifier_storage()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ СЖАТОГО ХРАНЕНИЯ ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()
@@ -0,0 +1,61 @@
+import sys
+import os
+from functools import partial
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+
+from common import bootstrap, cross_validate
+from src.data import load_wine, standardize
+from src.models import KNNClassifier
+
+DATA_FILE = os.path.join(os.path.dirname(__file__), '..', 'data', 'WineDataset.csv')
+
+
+def accuracy(model, X, y):
+    return {'accuracy': model.score(X, y)}
+
+
+def test_knn_cross_validation():
+    print("Тестирование кросс-валидации KNNClassifier...")
+    
+    X, y, _ = load_wine(DATA_FILE)
+    X_scaled, _, _ = standardize(X)
+    factory = partial(KNNClassifier, k=5)
+    
+    serial = cross_validate(factory, X_scaled, y, n_splits=5, stratify=True, scoring=accuracy, n_jobs=1, rng=42)
+    parallel = cross_validate(factory, X_scaled, y, n_splits=5, stratify=True, scoring=accuracy, n_jobs=2, rng=42)
+    assert serial['folds'] == parallel['folds'], "Пул процессов дал другие результаты"
+    summary = serial['summary']['accuracy']
+    assert summary['mean'] > 0.9, f"Неожиданно низкая точность: {summary['mean']}"
+    print(f"  ✓ Стратифицированная 5-блочная: {summary['mean']:.4f} [{summary['ci_low']:.4f}, {summary['ci_high']:.4f}]")
+    
+    result = bootstrap(factory, X_scaled, y, n_resamples=30, scoring=accuracy, n_jobs=2, rng=42)
+    summary = result['summary']['accuracy']
+    assert summary['ci_low'] <= summary['mean'] <= summary['ci_high'], "Среднее должно лежать внутри интервала"
+    print(f"  ✓ Бутстреп out-of-bag: {summary['mean']:.4f} [{summary['ci_low']:.4f}, {summary['ci_high']:.4f}]")
+    
+    print("✅ Тест кросс-валидации пройден\n")
+
+
+def run_all_tests():
+    print("=" * 60)
+    print("Тестирование ресэмплинга kNN".center(60))
+    print("=" * 60)
+    print()
+    
+    try:
+        test_knn_cross_validation()
+        
+        print("=" * 60)
+        print("✅ ВСЕ ТЕСТЫ РЕСЭМПЛИНГА ПРОЙДЕНЫ".center(60))
+        print("=" * 60)
+    except AssertionError as e:
+        print(f"\n❌ Тест провален: {e}")
+        import traceback
+        traceback.print_exc()
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_all_tests()